@@ -0,0 +1,143 @@
+"""
+Incremental re-evaluation of a planned trajectory.
+For a fixed Ta and time grid, profile() is affine in start and linear in
+displacement, so new moves are derived from a cached unit profile.
+"""
+
+import math
+
+import numpy as np
+
+from profileArray import motionArray, profileArray, timeArray
+
+
+class AffineTrajectory:
+    """
+    Cached trajectory that can be re-evaluated for a new start position or
+    displacement without per-sample Python work.
+
+    Args:
+        displacement (float): The total change in position of the base move
+        start (float): The initial position of the base move
+        time (list or array of floats): Each value of time to evaluate
+        Ta (float): The duration of the acceleration and deceleration
+        accelLimit (float): The acceleration limit the move was planned for,
+            or None when Ta was chosen by hand
+        veloLimit (float): The velocity limit the move was planned for,
+            or None when Ta was chosen by hand
+        interval (float): Sample interval used when a new displacement needs
+            a replan, defaults to the spacing of the first two times
+    """
+
+    def __init__(
+        self, displacement, start, time, Ta, accelLimit=None, veloLimit=None, interval=None
+    ):
+        self.displacement = float(displacement)
+        self.start = float(start)
+        self.Ta = float(Ta)
+        self.accelLimit = accelLimit
+        self.veloLimit = veloLimit
+
+        self.time = _readOnly(np.asarray(time, dtype=float))
+        if interval is None and len(self.time) > 1:
+            interval = float(self.time[1] - self.time[0])
+        self.interval = interval
+        unitPos, unitVel, unitAcc = profileArray(1.0, 0.0, self.time, self.Ta)
+        self.unitPos = _readOnly(unitPos)
+        self.unitVel = _readOnly(unitVel)
+        self.unitAcc = _readOnly(unitAcc)
+
+        self.pos = _readOnly(self.start + self.displacement * self.unitPos)
+        self.vel = _readOnly(self.displacement * self.unitVel)
+        self.acc = _readOnly(self.displacement * self.unitAcc)
+
+    @classmethod
+    def plan(cls, displacement, start, interval, accelLimit, veloLimit):
+        """Plan the base move the way motion() does and cache it."""
+        Tf, Ta = motionArray(displacement, accelLimit, veloLimit)
+        time = timeArray(float(Tf), interval)
+        return cls(displacement, start, time, float(Ta), accelLimit, veloLimit, interval)
+
+    def requiresReplan(self, displacement, accelLimit=None, veloLimit=None):
+        """
+        True when the cached Ta and time grid are no longer the motion()
+        solution for the requested move.
+
+        A hand-timed base (no limits) is valid for any displacement. A
+        limit-planned base only stays time-optimal and within its limits
+        for the same move length, in either direction.
+        """
+        if accelLimit is not None and accelLimit != self.accelLimit:
+            return True
+        if veloLimit is not None and veloLimit != self.veloLimit:
+            return True
+        if self.accelLimit is None or self.veloLimit is None:
+            return False
+        return not math.isclose(
+            abs(displacement), abs(self.displacement), rel_tol=1e-12, abs_tol=1e-12
+        )
+
+    def evaluate(self, start=None, displacement=None):
+        """
+        Trajectory for a new start and/or displacement.
+
+        Returns:
+            tuple: (pos, vel, acc, time) arrays. Unchanged quantities are
+                read-only views of the cache, changed ones are a single
+                fused array operation. Falls back to a full replan when
+                requiresReplan() says so.
+
+        Raises:
+            ValueError: When a replan is needed but the interval is unknown
+        """
+        start = self.start if start is None else float(start)
+        displacement = self.displacement if displacement is None else float(displacement)
+
+        if self.requiresReplan(displacement):
+            if self.interval is None:
+                raise ValueError("cannot replan: no interval given and time has one sample")
+            replanned = AffineTrajectory.plan(
+                displacement,
+                start,
+                self.interval,
+                self.accelLimit,
+                self.veloLimit,
+            )
+            return (replanned.pos, replanned.vel, replanned.acc, replanned.time)
+
+        if displacement == self.displacement:
+            if start == self.start:
+                return (self.pos, self.vel, self.acc, self.time)
+            return (self.pos + (start - self.start), self.vel, self.acc, self.time)
+
+        pos = self.unitPos * displacement
+        pos += start
+        return (
+            pos,
+            self.unitVel * displacement,
+            self.unitAcc * displacement,
+            self.time,
+        )
+
+    def evaluateStarts(self, starts):
+        """
+        Same move repeated from many start positions (e.g. pallet slots).
+
+        Returns:
+            tuple: (pos, vel, acc, time) where pos has shape (len(starts), n)
+                and vel/acc are zero-copy broadcast views of the cache
+        """
+        offsets = np.asarray(starts, dtype=float) - self.start
+        pos = np.add.outer(offsets, self.pos)
+        shape = pos.shape
+        return (
+            pos,
+            np.broadcast_to(self.vel, shape),
+            np.broadcast_to(self.acc, shape),
+            self.time,
+        )
+
+
+def _readOnly(array):
+    array.setflags(write=False)
+    return array
@@ -0,0 +1,293 @@
+"""
+Planner backend registry with a single facade API.
+
+motion(), profile() and jointInterpolation() here dispatch to one of the
+registered backends:
+
+    python         motion.py / trajectory.py / jointInterpolation.py (lists)
+    MotionProfiles MotionProfiles.py (lists), only used when requested
+    numpy          profileArray.py, whole move in one vectorized pass
+    chunked        chunked.py, vectorized in fixed-size blocks written into
+                   preallocated outputs, so temporaries stay bounded
+
+The JavaScript port in index.html runs in the browser and is not a backend.
+
+Automatic dispatch picks pure Python for small problems, where NumPy's
+per-call overhead dominates, NumPy above a crossover measured on first use,
+and chunked above CHUNKED_SAMPLES. setBackend() overrides globally and the
+backend= keyword per call; dispatchReport() lists which backend served
+each call.
+
+Results do not depend on which backend served a call: the facade always
+returns float64 arrays, and the numpy and chunked backends build the same
+accumulated time grid as motion() (see motionGrid()). MotionProfiles keeps
+its own grid, rounded up to a whole number of intervals, and so is never
+chosen automatically.
+"""
+
+import time as clock
+from collections import Counter, deque
+
+import numpy as np
+
+import MotionProfiles
+import jointInterpolation as jointInterpolationModule
+import motion as motionModule
+import trajectory as trajectoryModule
+from chunked import DEFAULT_BLOCK_SIZE
+from profileArray import motionArray, profileArray, syncArray
+
+CHUNKED_SAMPLES = 4 * DEFAULT_BLOCK_SIZE
+HISTORY_LENGTH = 1000
+
+
+def motionGrid(finalTime, interval):
+    """
+    The time grid motion() builds with its while loop, including the
+    rounding drift of adding interval repeatedly. np.add.accumulate sums
+    sequentially, so every sample matches motion() bit for bit; unlike
+    profileArray.timeArray(), which is drift-free.
+    """
+    steps = int(np.floor(finalTime / interval)) + 3
+    time = np.add.accumulate(np.concatenate(([0.0], np.full(steps, interval))))
+    time = time[time <= finalTime]
+    if time[-1] < finalTime:
+        time = np.append(time, finalTime)
+    return time
+
+
+class PythonBackend:
+    name = "python"
+
+    def motion(self, displacement, interval, accelLimit, veloLimit):
+        return motionModule.motion(displacement, interval, accelLimit, veloLimit)
+
+    def profile(self, displacement, start, time, Ta):
+        if np.ndim(displacement) == 0:
+            return trajectoryModule.profile(displacement, start, time, Ta)
+        starts = np.broadcast_to(start, np.shape(displacement))
+        Tas = np.broadcast_to(Ta, np.shape(displacement))
+        results = [
+            trajectoryModule.profile(d, s, time, ta)
+            for d, s, ta in zip(displacement, starts, Tas)
+        ]
+        return tuple([result[k] for result in results] for k in range(3))
+
+    def jointInterpolation(self, *args):
+        return jointInterpolationModule.jointInterpolation(*args)
+
+
+class MotionProfilesBackend(PythonBackend):
+    name = "MotionProfiles"
+
+    def motion(self, displacement, interval, accelLimit, veloLimit):
+        return MotionProfiles.motion(displacement, interval, accelLimit, veloLimit)
+
+    def profile(self, displacement, start, time, Ta):
+        if np.ndim(displacement) == 0:
+            return MotionProfiles.profile(displacement, start, time, Ta)
+        return super().profile(displacement, start, time, Ta)
+
+    def jointInterpolation(self, *args):
+        return MotionProfiles.joint_interpolation(*args)
+
+
+class NumpyBackend:
+    name = "numpy"
+
+    def motion(self, displacement, interval, accelLimit, veloLimit):
+        Tf, Ta = motionArray(displacement, accelLimit, veloLimit)
+        return (motionGrid(float(Tf), interval), float(Ta))
+
+    def profile(self, displacement, start, time, Ta):
+        return profileArray(displacement, start, time, Ta)
+
+    def jointInterpolation(
+        self,
+        displacementA,
+        startA,
+        displacementB,
+        startB,
+        interval,
+        accelLimitA,
+        veloLimitA,
+        accelLimitB,
+        veloLimitB,
+    ):
+        displacement = np.array([displacementA, displacementB], dtype=float)
+        accelLimit = np.array([accelLimitA, accelLimitB], dtype=float)
+        Tf, Ta = motionArray(displacement, accelLimit, [veloLimitA, veloLimitB])
+        finalTime = float(Tf.max())
+        Ta = syncArray(displacement, finalTime, accelLimit, Tf, Ta)
+        time = motionGrid(finalTime, interval)
+        pos, vel, acc = profileArray(displacement, [startA, startB], time, Ta)
+        return ((pos[0], vel[0], acc[0]), (pos[1], vel[1], acc[1]), time)
+
+
+class ChunkedBackend(NumpyBackend):
+    name = "chunked"
+
+    def __init__(self, blockSize=DEFAULT_BLOCK_SIZE):
+        self.blockSize = blockSize
+
+    def profile(self, displacement, start, time, Ta):
+        time = np.asarray(time, dtype=float)
+        totalTime = time[..., -1]
+        shape = np.broadcast_shapes(np.shape(displacement) + (1,), time.shape)
+        outputs = tuple(np.empty(shape) for _ in range(3))
+        for first in range(0, time.shape[-1], self.blockSize):
+            block = slice(first, first + self.blockSize)
+            values = profileArray(displacement, start, time[..., block], Ta, totalTime)
+            for output, value in zip(outputs, values):
+                output[..., block] = value
+        return outputs
+
+    def jointInterpolation(
+        self,
+        displacementA,
+        startA,
+        displacementB,
+        startB,
+        interval,
+        accelLimitA,
+        veloLimitA,
+        accelLimitB,
+        veloLimitB,
+    ):
+        displacement = np.array([displacementA, displacementB], dtype=float)
+        accelLimit = np.array([accelLimitA, accelLimitB], dtype=float)
+        Tf, Ta = motionArray(displacement, accelLimit, [veloLimitA, veloLimitB])
+        finalTime = float(Tf.max())
+        Ta = syncArray(displacement, finalTime, accelLimit, Tf, Ta)
+        time = motionGrid(finalTime, interval)
+        pos, vel, acc = self.profile(displacement, [startA, startB], time, Ta)
+        return ((pos[0], vel[0], acc[0]), (pos[1], vel[1], acc[1]), time)
+
+
+BACKENDS = {}
+_override = None
+_crossover = None
+_history = deque(maxlen=HISTORY_LENGTH)
+
+
+def registerBackend(backend):
+    """Make a backend available under backend.name."""
+    BACKENDS[backend.name] = backend
+
+
+for _backend in (PythonBackend(), MotionProfilesBackend(), NumpyBackend(), ChunkedBackend()):
+    registerBackend(_backend)
+
+
+def setBackend(name):
+    """Force every call onto one backend; None restores automatic dispatch."""
+    global _override
+    if name is not None and name not in BACKENDS:
+        raise KeyError(f"unknown backend {name!r}, registered: {sorted(BACKENDS)}")
+    _override = name
+
+
+def calibrate(sizes=(8, 32, 128, 512, 2048), repeats=5):
+    """
+    Measure the sample count above which the NumPy backend beats pure Python.
+    Runs automatically on the first automatic dispatch.
+    """
+    global _crossover
+    python, numpy = BACKENDS["python"], BACKENDS["numpy"]
+    _crossover = sizes[-1]
+    for size in sizes:
+        time = list(np.linspace(0, 2, size))
+        timings = []
+        for backend in (python, numpy):
+            started = clock.perf_counter()
+            for _ in range(repeats):
+                backend.profile(100.0, 0.0, time, 0.5)
+            timings.append(clock.perf_counter() - started)
+        if timings[1] < timings[0]:
+            _crossover = size
+            break
+    return _crossover
+
+
+def chooseBackend(samples):
+    """Backend name automatic dispatch would use for this many samples."""
+    if _crossover is None:
+        calibrate()
+    if samples >= CHUNKED_SAMPLES:
+        return "chunked"
+    if samples >= _crossover:
+        return "numpy"
+    return "python"
+
+
+def _dispatch(function, samples, backend):
+    name = backend or _override or chooseBackend(samples)
+    _history.append((function, name, int(samples)))
+    return getattr(BACKENDS[name], function)
+
+
+def motion(displacement, interval, accelLimit, veloLimit, backend=None):
+    Tf, _ = motionArray(displacement, accelLimit, veloLimit)
+    serve = _dispatch("motion", float(Tf) / interval + 1, backend)
+    time, Ta = serve(displacement, interval, accelLimit, veloLimit)
+    return (_array(time), float(Ta))
+
+
+def profile(displacement, start, time, Ta, backend=None):
+    samples = np.size(time) * max(1, np.size(displacement))
+    serve = _dispatch("profile", samples, backend)
+    return tuple(_array(values) for values in serve(displacement, start, time, Ta))
+
+
+def jointInterpolation(
+    displacementA,
+    startA,
+    displacementB,
+    startB,
+    interval,
+    accelLimitA,
+    veloLimitA,
+    accelLimitB,
+    veloLimitB,
+    backend=None,
+):
+    Tf, _ = motionArray(
+        [displacementA, displacementB], [accelLimitA, accelLimitB], [veloLimitA, veloLimitB]
+    )
+    serve = _dispatch("jointInterpolation", 2 * (float(Tf.max()) / interval + 1), backend)
+    eomA, eomB, time = serve(
+        displacementA,
+        startA,
+        displacementB,
+        startB,
+        interval,
+        accelLimitA,
+        veloLimitA,
+        accelLimitB,
+        veloLimitB,
+    )
+    return (
+        tuple(_array(values) for values in eomA),
+        tuple(_array(values) for values in eomB),
+        _array(time),
+    )
+
+
+def _array(values):
+    # Lists from the Python backends and arrays from NumPy look the same
+    return np.asarray(values, dtype=float)
+
+
+def dispatchReport():
+    """
+    Which backend served recent calls.
+
+    Returns:
+        dict: "calls" as (function, backend, samples) tuples, most recent
+            last, "counts" per backend and the calibrated "crossover"
+    """
+    return {
+        "calls": list(_history),
+        "counts": dict(Counter(name for _, name, _ in _history)),
+        "crossover": _crossover,
+    }
@@ -0,0 +1,187 @@
+"""
+Straight-line Cartesian moves for a 2-link planar arm.
+The trapezoidal profile is applied along the path length and the sampled
+path is converted to joint angles with a vectorized two-link IK solve.
+Angles are in radians.
+"""
+
+import numpy as np
+
+from profileArray import motionArray, profileArray, timeArray
+
+
+def forwardKinematics(theta1, theta2, link1, link2):
+    """
+    Tool position for arrays of joint angles.
+
+    Returns:
+        tuple: Two arrays (x, y)
+    """
+    theta1 = np.asarray(theta1, dtype=float)
+    theta12 = theta1 + np.asarray(theta2, dtype=float)
+    x = link1 * np.cos(theta1) + link2 * np.cos(theta12)
+    y = link1 * np.sin(theta1) + link2 * np.sin(theta12)
+    return (x, y)
+
+
+def inverseKinematics(x, y, link1, link2, elbowUp=False):
+    """
+    Joint angles that place the tool at arrays of (x, y).
+
+    Args:
+        x (float or array): Tool x position
+        y (float or array): Tool y position
+        link1 (float): Length of the first link
+        link2 (float): Length of the second link
+        elbowUp (bool): Pick the negative theta2 solution
+
+    Returns:
+        tuple: Three arrays (theta1, theta2, reachable); angles are NaN
+            where the point is out of reach
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    c2 = (x**2 + y**2 - link1**2 - link2**2) / (2 * link1 * link2)
+    reachable = np.abs(c2) <= 1 + 1e-12
+    c2 = np.clip(c2, -1, 1)
+    s2 = np.sqrt(1 - c2**2)
+    if elbowUp:
+        s2 = -s2
+
+    theta2 = np.arctan2(s2, c2)
+    theta1 = np.arctan2(y, x) - np.arctan2(link2 * s2, link1 + link2 * c2)
+
+    theta1 = np.where(reachable, theta1, np.nan)
+    theta2 = np.where(reachable, theta2, np.nan)
+    return (theta1, theta2, reachable)
+
+
+def unwrapPath(theta):
+    """
+    Joint angles along a path made continuous, removing the 2 pi jumps of
+    arctan2. Unreachable (NaN) samples are skipped.
+    """
+    theta = np.array(theta, dtype=float)
+    finite = np.isfinite(theta)
+    theta[finite] = np.unwrap(theta[finite])
+    return theta
+
+
+def jointRates(theta1, theta2, xVel, yVel, xAcc, yAcc, link1, link2):
+    """
+    Joint velocities and accelerations from tool velocity and acceleration
+    through the inverse Jacobian, qdd = J^-1 (xdd - Jdot qd).
+
+    Returns:
+        tuple: Four arrays (vel1, vel2, acc1, acc2), NaN at singularities
+    """
+    s1, c1 = np.sin(theta1), np.cos(theta1)
+    s12, c12 = np.sin(theta1 + theta2), np.cos(theta1 + theta2)
+
+    # J = [[j11, j12], [j21, j22]]
+    j11 = -link1 * s1 - link2 * s12
+    j12 = -link2 * s12
+    j21 = link1 * c1 + link2 * c12
+    j22 = link2 * c12
+    det = j11 * j22 - j12 * j21
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse = np.where(np.abs(det) > 1e-12, 1 / det, np.nan)
+
+    vel1 = (j22 * xVel - j12 * yVel) * inverse
+    vel2 = (-j21 * xVel + j11 * yVel) * inverse
+
+    # Jdot qd
+    w1 = vel1**2
+    w12 = (vel1 + vel2) ** 2
+    bx = -link1 * c1 * w1 - link2 * c12 * w12
+    by = -link1 * s1 * w1 - link2 * s12 * w12
+
+    acc1 = (j22 * (xAcc - bx) - j12 * (yAcc - by)) * inverse
+    acc2 = (-j21 * (xAcc - bx) + j11 * (yAcc - by)) * inverse
+
+    return (vel1, vel2, acc1, acc2)
+
+
+def cartesianInterpolation(
+    startX,
+    startY,
+    endX,
+    endY,
+    interval,
+    accelLimit,
+    veloLimit,
+    link1,
+    link2,
+    jointAccelLimits,
+    jointVeloLimits,
+    elbowUp=False,
+):
+    """
+    Move the tool along a straight line with a trapezoidal path-speed
+    profile and report whether the joints stay within their limits.
+
+    Args:
+        startX, startY (float): Tool start position
+        endX, endY (float): Tool end position
+        interval (float): The time step interval
+        accelLimit (float): Tool acceleration limit along the path
+        veloLimit (float): Tool velocity limit along the path
+        link1, link2 (float): Link lengths
+        jointAccelLimits (tuple of 2 floats): Acceleration limits for joints A, B
+        jointVeloLimits (tuple of 2 floats): Velocity limits for joints A, B
+        elbowUp (bool): IK branch to follow
+
+    Returns:
+        tuple: (eomA, eomB, time, report) where eomA and eomB are the joint
+            (angle, velocity, acceleration) arrays and report is a dict with
+            "ok", "reachable", "singular", peak joint rates (velocity
+            includes the step between consecutive samples) and "timeScale",
+            the factor to stretch the move by so the joints fit their limits
+    """
+    dx = endX - startX
+    dy = endY - startY
+    length = float(np.hypot(dx, dy))
+    ux, uy = (dx / length, dy / length) if length > 0 else (0.0, 0.0)
+
+    Tf, Ta = motionArray(length, accelLimit, veloLimit)
+    time = timeArray(float(Tf), interval)
+    s, sVel, sAcc = profileArray(length, 0.0, time, float(Ta))
+
+    x = startX + ux * s
+    y = startY + uy * s
+    theta1, theta2, reachable = inverseKinematics(x, y, link1, link2, elbowUp)
+    # arctan2 wraps at +-pi, e.g. when the line crosses the -x axis; the
+    # joints move continuously instead
+    theta1, theta2 = unwrapPath(theta1), unwrapPath(theta2)
+    vel1, vel2, acc1, acc2 = jointRates(
+        theta1, theta2, ux * sVel, uy * sVel, ux * sAcc, uy * sAcc, link1, link2
+    )
+
+    # The analytic rates only see each sample; the steps between samples
+    # also catch a joint that jumps from one tick to the next
+    with np.errstate(invalid="ignore"):
+        stepRate = np.abs(np.diff([theta1, theta2], axis=1)) / np.diff(time)
+    peakVelocity = np.nanmax(np.abs([vel1, vel2]), axis=1)
+    if stepRate.size and not np.isnan(stepRate).all():
+        peakVelocity = np.fmax(peakVelocity, np.nanmax(stepRate, axis=1))
+    peakAcceleration = np.nanmax(np.abs([acc1, acc2]), axis=1)
+    velocityRatio = peakVelocity / np.asarray(jointVeloLimits, dtype=float)
+    accelRatio = peakAcceleration / np.asarray(jointAccelLimits, dtype=float)
+
+    singular = bool(np.isnan(vel1).any() or np.isnan(vel2).any())
+    allReachable = bool(reachable.all())
+    # Stretching time by k scales velocity by 1/k and acceleration by 1/k^2
+    timeScale = float(max(1.0, velocityRatio.max(), np.sqrt(accelRatio.max())))
+
+    report = {
+        "ok": allReachable and not singular and timeScale <= 1.0,
+        "reachable": allReachable,
+        "singular": singular,
+        "peakJointVelocity": tuple(float(v) for v in peakVelocity),
+        "peakJointAcceleration": tuple(float(a) for a in peakAcceleration),
+        "timeScale": timeScale,
+    }
+
+    return ((theta1, vel1, acc1), (theta2, vel2, acc2), time, report)
@@ -0,0 +1,162 @@
+"""
+Chunked evaluation of very long or very finely sampled moves.
+Moves are yielded as fixed-size NumPy blocks so peak memory is bounded by
+the block size rather than by the move length.
+"""
+
+import numpy as np
+
+from profileArray import motionArray, profileArray, sampleCount, syncArray, timeSlice
+
+# Approximate bytes held per sample while a block is evaluated: the four
+# float64 outputs plus the temporaries profileArray() creates
+BYTES_PER_SAMPLE = 16 * 8
+DEFAULT_BLOCK_SIZE = 65536
+
+
+def blockSizeFor(maxBytes):
+    """Largest block size whose evaluation stays within maxBytes."""
+    return max(1, int(maxBytes) // BYTES_PER_SAMPLE)
+
+
+def timeBlocks(finalTime, interval, blockSize=DEFAULT_BLOCK_SIZE):
+    """
+    Yield the timeArray() time grid in blocks of at most blockSize samples,
+    which concatenate to exactly timeArray(finalTime, interval).
+    """
+    total = sampleCount(finalTime, interval)
+    for first in range(0, total, blockSize):
+        yield timeSlice(finalTime, interval, first, min(first + blockSize, total))
+
+
+def profileBlocks(
+    displacement,
+    start,
+    totalTime,
+    Ta,
+    interval,
+    blockSize=DEFAULT_BLOCK_SIZE,
+    maxBytes=None,
+):
+    """
+    Evaluate profile() over 0..totalTime in blocks.
+
+    Args:
+        displacement (float): The total change in position
+        start (float): The initial position for a move
+        totalTime (float): The duration of the move
+        Ta (float): The duration of the acceleration and deceleration
+        interval (float): The time step interval
+        blockSize (int): Samples per block
+        maxBytes (int): Peak memory budget, overrides blockSize when given
+
+    Yields:
+        tuple: Four arrays (t, pos, vel, acc) covering the move in order
+    """
+    if maxBytes is not None:
+        blockSize = blockSizeFor(maxBytes)
+
+    for time in timeBlocks(totalTime, interval, blockSize):
+        pos, vel, acc = profileArray(displacement, start, time, Ta, totalTime)
+        yield (time, pos, vel, acc)
+
+
+def motionBlocks(
+    displacement,
+    start,
+    interval,
+    accelLimit,
+    veloLimit,
+    blockSize=DEFAULT_BLOCK_SIZE,
+    maxBytes=None,
+):
+    """
+    Plan a move like motion() and evaluate it in blocks.
+
+    Yields:
+        tuple: Four arrays (t, pos, vel, acc) covering the move in order
+    """
+    Tf, Ta = motionArray(displacement, accelLimit, veloLimit)
+    yield from profileBlocks(
+        displacement, start, float(Tf), float(Ta), interval, blockSize, maxBytes
+    )
+
+
+def jointBlocks(
+    displacementA,
+    startA,
+    displacementB,
+    startB,
+    interval,
+    accelLimitA,
+    veloLimitA,
+    accelLimitB,
+    veloLimitB,
+    blockSize=DEFAULT_BLOCK_SIZE,
+    maxBytes=None,
+):
+    """
+    Coordinate two joints like jointInterpolation() and evaluate in blocks.
+
+    Yields:
+        tuple: (t, eomA, eomB) where eomA and eomB are (pos, vel, acc) arrays
+    """
+    if maxBytes is not None:
+        # Two joints share each block
+        blockSize = max(1, blockSizeFor(maxBytes) // 2)
+
+    displacement = np.array([displacementA, displacementB], dtype=float)
+    start = np.array([startA, startB], dtype=float)
+    accelLimit = np.array([accelLimitA, accelLimitB], dtype=float)
+    veloLimit = np.array([veloLimitA, veloLimitB], dtype=float)
+
+    Tf, Ta = motionArray(displacement, accelLimit, veloLimit)
+    finalTime = float(Tf.max())
+    Ta = syncArray(displacement, finalTime, accelLimit, Tf, Ta)
+
+    for time in timeBlocks(finalTime, interval, blockSize):
+        pos, vel, acc = profileArray(displacement, start, time, Ta, finalTime)
+        yield (time, (pos[0], vel[0], acc[0]), (pos[1], vel[1], acc[1]))
+
+
+def writeBlocks(blocks, file):
+    """
+    Stream (t, pos, vel, acc) blocks to a binary file as float64 rows.
+
+    Args:
+        blocks (iterable of tuples): Output of profileBlocks/motionBlocks
+        file (file object): Opened in binary write mode
+
+    Returns:
+        int: Number of samples written
+    """
+    count = 0
+    for block in blocks:
+        file.write(np.column_stack(block).tobytes())
+        count += len(block[0])
+    return count
+
+
+def reduceBlocks(blocks):
+    """
+    Summarize a move from its blocks without concatenating them.
+
+    Returns:
+        dict: Sample count, final time and position, and peak |vel| and |acc|
+    """
+    summary = {
+        "samples": 0,
+        "finalTime": 0.0,
+        "finalPosition": 0.0,
+        "maxVelocity": 0.0,
+        "maxAcceleration": 0.0,
+    }
+    for time, pos, vel, acc in blocks:
+        summary["samples"] += len(time)
+        summary["finalTime"] = float(time[-1])
+        summary["finalPosition"] = float(pos[-1])
+        summary["maxVelocity"] = max(summary["maxVelocity"], float(np.abs(vel).max()))
+        summary["maxAcceleration"] = max(
+            summary["maxAcceleration"], float(np.abs(acc).max())
+        )
+    return summary
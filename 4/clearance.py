@@ -0,0 +1,298 @@
+"""
+Swept-clearance check between two planar 2-link arms sharing a workspace.
+
+Each arm is a dict with "base" (x, y), "link1", "link2" and "radius", the
+links being capsules of that radius. Moves are the joint angles of
+jointInterpolation() or cartesianInterpolation() placed at a start time on
+a shared clock.
+
+Forward kinematics is evaluated in batch over whole sample arrays, never per
+sample in Python. Move pairs are pruned in two stages before any exact
+distance is computed: a time-window index keeps only moves that run at the
+same time, and bounding boxes of the swept links, first per move and then
+per block of samples, skip everything that cannot come within the required
+clearance. Between samples the joint angles are interpolated linearly, so
+the interval should be fine compared with how fast the links sweep.
+
+An arm does not vanish between moves: it stays parked at the pose its last
+move ended in (or, before its first move, the pose that move starts from).
+Those idle windows are checked too, as static pseudo-moves.
+"""
+
+import bisect
+
+import numpy as np
+
+from cartesian import forwardKinematics
+
+DEFAULT_BLOCK_SIZE = 64
+
+
+def armPoints(arm, theta1, theta2):
+    """
+    Base, elbow and tool positions for arrays of joint angles.
+
+    Returns:
+        array of shape (n, 3, 2)
+    """
+    theta1 = np.asarray(theta1, dtype=float)
+    baseX, baseY = arm["base"]
+    elbowX = baseX + arm["link1"] * np.cos(theta1)
+    elbowY = baseY + arm["link1"] * np.sin(theta1)
+    toolX, toolY = forwardKinematics(theta1, theta2, arm["link1"], arm["link2"])
+    points = np.empty(theta1.shape + (3, 2))
+    points[..., 0, :] = (baseX, baseY)
+    points[..., 1, 0], points[..., 1, 1] = elbowX, elbowY
+    points[..., 2, 0], points[..., 2, 1] = toolX + baseX, toolY + baseY
+    return points
+
+
+def _pointSegmentDistance(point, start, end):
+    direction = end - start
+    length = np.sum(direction**2, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.where(
+            length > 0, np.sum((point - start) * direction, axis=-1) / length, 0.0
+        )
+    closest = start + np.clip(fraction, 0, 1)[..., np.newaxis] * direction
+    return np.linalg.norm(point - closest, axis=-1)
+
+
+def _cross(origin, a, b):
+    return (a[..., 0] - origin[..., 0]) * (b[..., 1] - origin[..., 1]) - (
+        a[..., 1] - origin[..., 1]
+    ) * (b[..., 0] - origin[..., 0])
+
+
+def segmentDistance(p0, p1, q0, q1):
+    """
+    Shortest distance between 2D segments p0-p1 and q0-q1, elementwise over
+    arrays of shape (..., 2).
+    """
+    distance = np.minimum.reduce(
+        [
+            _pointSegmentDistance(p0, q0, q1),
+            _pointSegmentDistance(p1, q0, q1),
+            _pointSegmentDistance(q0, p0, p1),
+            _pointSegmentDistance(q1, p0, p1),
+        ]
+    )
+    # Proper crossings have endpoints on opposite sides of both segments
+    crossing = (_cross(p0, p1, q0) * _cross(p0, p1, q1) < 0) & (
+        _cross(q0, q1, p0) * _cross(q0, q1, p1) < 0
+    )
+    return np.where(crossing, 0.0, distance)
+
+
+def armClearance(pointsA, radiusA, pointsB, radiusB):
+    """
+    Gap between two arms' link capsules for aligned samples; negative
+    values are penetration depth.
+
+    Args:
+        pointsA, pointsB (arrays of shape (n, 3, 2)): armPoints() output
+
+    Returns:
+        array of shape (n,)
+    """
+    distances = [
+        segmentDistance(pointsA[:, i], pointsA[:, i + 1], pointsB[:, k], pointsB[:, k + 1])
+        for i in range(2)
+        for k in range(2)
+    ]
+    return np.minimum.reduce(distances) - radiusA - radiusB
+
+
+def _boxes(points, radius):
+    # Inflated (xmin, ymin, xmax, ymax) over every sample and point
+    return np.concatenate(
+        [points.min(axis=(-3, -2)) - radius, points.max(axis=(-3, -2)) + radius], axis=-1
+    )
+
+
+def _boxGap(first, second):
+    # Distance between axis-aligned boxes, zero when they overlap
+    gap = np.maximum(
+        np.maximum(first[..., :2] - second[..., 2:], second[..., :2] - first[..., 2:]), 0
+    )
+    return np.linalg.norm(gap, axis=-1)
+
+
+def sweptMove(arm, startTime, time, theta1, theta2):
+    """
+    A move's samples on the shared clock with their forward kinematics.
+
+    Args:
+        arm (dict): "base", "link1", "link2" and "radius"
+        startTime (float): When the move starts on the shared clock
+        time (list or array): Sample times from the start of the move
+        theta1, theta2 (lists or arrays): Joint angles at each sample
+
+    Returns:
+        dict: "arm", "startTime", "endTime", "time" (absolute), "theta1",
+            "theta2", "points" and the swept bounding "box"
+    """
+    time = startTime + np.asarray(time, dtype=float)
+    theta1 = np.asarray(theta1, dtype=float)
+    theta2 = np.asarray(theta2, dtype=float)
+    points = armPoints(arm, theta1, theta2)
+    return {
+        "arm": arm,
+        "startTime": float(time[0]),
+        "endTime": float(time[-1]),
+        "time": time,
+        "theta1": theta1,
+        "theta2": theta2,
+        "points": points,
+        "box": _boxes(points, arm["radius"]),
+    }
+
+
+def _resample(move, time):
+    # Arm points at new times, interpolating the joint angles
+    theta1 = np.interp(time, move["time"], move["theta1"])
+    theta2 = np.interp(time, move["time"], move["theta2"])
+    return armPoints(move["arm"], theta1, theta2)
+
+
+def checkPair(moveA, moveB, clearance=0.0, blockSize=DEFAULT_BLOCK_SIZE):
+    """
+    Clearance between two swept moves over the time they share.
+
+    Returns:
+        dict: "start"/"end" of the shared window, "minClearance" and the
+            "minTime" it occurs, "firstConflict" (first time the gap drops
+            below clearance, or None), "exact" (False when bounding boxes
+            proved the pair clear and minClearance is only their lower
+            bound) and the number of "checked" samples
+    """
+    start = max(moveA["startTime"], moveB["startTime"])
+    end = min(moveA["endTime"], moveB["endTime"])
+    report = {
+        "start": start,
+        "end": end,
+        "minClearance": float(_boxGap(moveA["box"], moveB["box"])),
+        "minTime": None,
+        "firstConflict": None,
+        "exact": False,
+        "checked": 0,
+    }
+    if report["minClearance"] > clearance:
+        return report
+
+    times = [
+        move["time"][(move["time"] >= start) & (move["time"] <= end)] for move in (moveA, moveB)
+    ]
+    time = np.union1d(np.union1d(*times), [start, end])
+    # Grids offset by a whole number of intervals differ only by rounding
+    time = time[np.concatenate(([True], np.diff(time) > 1e-9))]
+    pointsA = _resample(moveA, time)
+    pointsB = _resample(moveB, time)
+    radiusA, radiusB = moveA["arm"]["radius"], moveB["arm"]["radius"]
+
+    # Per-block boxes: only blocks that could come within clearance are checked
+    blocks = -(-len(time) // blockSize)
+    padded = blocks * blockSize - len(time)
+    boxes = []
+    for points, radius in ((pointsA, radiusA), (pointsB, radiusB)):
+        edge = np.concatenate([points, np.repeat(points[-1:], padded, axis=0)])
+        boxes.append(_boxes(edge.reshape(blocks, blockSize, 3, 2), radius))
+    blockGap = _boxGap(*boxes)
+    candidates = np.flatnonzero(blockGap <= clearance)
+
+    # Skipped blocks can be no closer than their box gap
+    skipped = blockGap[blockGap > clearance]
+    lowerBound = float(skipped.min()) if len(skipped) else np.inf
+    if len(candidates) == 0:
+        report["minClearance"] = lowerBound
+        return report
+
+    samples = (candidates[:, np.newaxis] * blockSize + np.arange(blockSize)).ravel()
+    samples = samples[samples < len(time)]
+    gap = armClearance(pointsA[samples], radiusA, pointsB[samples], radiusB)
+
+    closest = int(np.argmin(gap))
+    conflicts = np.flatnonzero(gap < clearance)
+    report["checked"] = len(samples)
+    report["exact"] = bool(gap[closest] <= lowerBound)
+    report["minClearance"] = float(min(gap[closest], lowerBound))
+    report["minTime"] = float(time[samples[closest]]) if report["exact"] else None
+    if len(conflicts):
+        report["firstConflict"] = float(time[samples[conflicts[0]]])
+    return report
+
+
+def _parked(move, sample, startTime, endTime):
+    # Static pseudo-move holding one sample's pose of move over a window
+    return sweptMove(
+        move["arm"],
+        startTime,
+        [0.0, endTime - startTime],
+        np.repeat(move["theta1"][sample], 2),
+        np.repeat(move["theta2"][sample], 2),
+    )
+
+
+def parkedMoves(moves, startTime, endTime):
+    """
+    An arm's idle windows within [startTime, endTime] as static pseudo-moves.
+
+    Args:
+        moves (list of dicts): sweptMove() output for one arm
+        startTime, endTime (float): Span of the shared clock to cover
+
+    Returns:
+        list of tuples: (index, pseudo-move) in time order, where index is
+            the move whose pose is held: the one before the window, or the
+            first move for a window before it starts
+    """
+    order = sorted(range(len(moves)), key=lambda k: moves[k]["startTime"])
+    parked = []
+    clock, index, sample = startTime, order[0] if order else None, 0
+    for k in order:
+        if moves[k]["startTime"] > clock:
+            parked.append((index, _parked(moves[index], sample, clock, moves[k]["startTime"])))
+        clock, index, sample = max(clock, moves[k]["endTime"]), k, -1
+    if order and endTime > clock:
+        parked.append((index, _parked(moves[index], sample, clock, endTime)))
+    return parked
+
+
+def checkInterference(movesA, movesB, clearance=0.0, blockSize=DEFAULT_BLOCK_SIZE, parked=True):
+    """
+    Check every pair of concurrent moves between two arms.
+
+    Args:
+        movesA, movesB (lists of dicts): sweptMove() output for each arm
+        clearance (float): Required gap between link capsules
+        parked (bool): Also check each arm parked between its moves, over
+            the span of both schedules
+
+    Returns:
+        list of dicts: checkPair() reports with the move indices "a" and
+            "b", for every pair whose time windows overlap. "parkedA" and
+            "parkedB" mark parkedMoves() windows, whose index is the move
+            holding the pose. Ordered by a, moves before parked windows
+    """
+    entriesA = [(a, False, move) for a, move in enumerate(movesA)]
+    entriesB = [(b, False, move) for b, move in enumerate(movesB)]
+    if parked and movesA and movesB:
+        everything = movesA + movesB
+        startTime = min(move["startTime"] for move in everything)
+        endTime = max(move["endTime"] for move in everything)
+        entriesA += [(a, True, move) for a, move in parkedMoves(movesA, startTime, endTime)]
+        entriesB += [(b, True, move) for b, move in parkedMoves(movesB, startTime, endTime)]
+
+    order = sorted(range(len(entriesB)), key=lambda k: entriesB[k][2]["startTime"])
+    starts = [entriesB[k][2]["startTime"] for k in order]
+    ends = np.array([entriesB[k][2]["endTime"] for k in order])
+
+    reports = []
+    for a, parkedA, moveA in entriesA:
+        # Moves of B that start before A ends and end after A starts
+        last = bisect.bisect_right(starts, moveA["endTime"])
+        for position in np.flatnonzero(ends[:last] >= moveA["startTime"]):
+            b, parkedB, moveB = entriesB[order[position]]
+            report = checkPair(moveA, moveB, clearance, blockSize)
+            reports.append({"a": a, "b": b, "parkedA": parkedA, "parkedB": parkedB, **report})
+    return reports
@@ -0,0 +1,184 @@
+"""
+Runtime feed-rate override for an already planned move.
+
+The planned profile is followed in its own time tau, which advances at the
+override scale s (0.1 to 1) instead of at wall-clock rate. Setpoints are
+then
+
+    pos = p(tau),  vel = v(tau) * s,  acc = a(tau) * s^2 + v(tau) * ds/dt
+
+so s <= 1 keeps velocity within the original limit, and ds/dt is clipped
+every tick so acceleration does too. A plan whose cruise velocity exceeds
+its velocity limit is capped at the largest scale that fits instead. Each tick is a constant-time closed
+form evaluation, no replanning or resampling.
+"""
+
+from profileArray import motionArray, syncArray
+
+MIN_SCALE = 0.1
+MAX_SCALE = 1.0
+MAX_ITERATIONS = 8
+
+
+def sample(displacement, start, Ta, totalTime, t):
+    """Position, velocity and acceleration of a planned move at one time t."""
+    if displacement == 0 or totalTime <= 0:
+        return (start, 0.0, 0.0)
+    t = min(max(t, 0.0), totalTime)
+    cruiseVelocity = displacement / (totalTime - Ta)
+    accel = cruiseVelocity / Ta
+    if t <= Ta:
+        return (start + 0.5 * accel * t**2, accel * t, accel)
+    if t <= totalTime - Ta:
+        return (start + cruiseVelocity * (t - 0.5 * Ta), cruiseVelocity, 0.0)
+    timeFromEnd = t - totalTime
+    return (
+        start + displacement - 0.5 * accel * timeFromEnd**2,
+        -accel * timeFromEnd,
+        -accel,
+    )
+
+
+class RetimedTrajectory:
+    """
+    One or more synchronized axes that share a planned duration and are
+    retimed together by a speed override.
+
+    Args:
+        displacements (list of floats): Change in position per axis
+        starts (list of floats): Initial position per axis
+        Tas (list of floats): Acceleration time per axis
+        totalTime (float): Planned duration shared by every axis
+        accelLimits (list of floats): Acceleration limit per axis
+        veloLimits (list of floats): Velocity limit per axis, which caps
+            the scale when the planned cruise velocity exceeds it
+        transitionTime (float): Fastest full-range change of the override,
+            which keeps transitions smooth even when the limits would allow
+            a faster one
+    """
+
+    def __init__(
+        self,
+        displacements,
+        starts,
+        Tas,
+        totalTime,
+        accelLimits,
+        veloLimits,
+        transitionTime=0.5,
+    ):
+        self.axes = list(zip(displacements, starts, Tas))
+        self.totalTime = float(totalTime)
+        self.accelLimits = list(accelLimits)
+        self.veloLimits = list(veloLimits)
+        self.maxRate = (MAX_SCALE - MIN_SCALE) / transitionTime
+        self.maxScale = self._maxScale()
+        self.tau = 0.0
+        self.scale = self.maxScale
+        self.target = self.maxScale
+
+    @classmethod
+    def fromMotion(cls, displacement, start, accelLimit, veloLimit, **options):
+        """Retime a single move planned like motion()."""
+        Tf, Ta = motionArray(displacement, accelLimit, veloLimit)
+        return cls(
+            [displacement],
+            [start],
+            [float(Ta)],
+            float(Tf),
+            [accelLimit],
+            [veloLimit],
+            **options,
+        )
+
+    @classmethod
+    def fromJoints(cls, displacements, starts, accelLimits, veloLimits, **options):
+        """Retime joints synchronized like jointInterpolation()."""
+        Tf, Ta = motionArray(displacements, accelLimits, veloLimits)
+        finalTime = float(Tf.max())
+        Ta = syncArray(displacements, finalTime, accelLimits, Tf, Ta)
+        return cls(
+            displacements,
+            starts,
+            Ta.tolist(),
+            finalTime,
+            accelLimits,
+            veloLimits,
+            **options,
+        )
+
+    def _maxScale(self):
+        # Largest scale whose cruise velocity is within every axis's limit;
+        # 1 for moves planned within their limits
+        scale = MAX_SCALE
+        for (displacement, _, Ta), veloLimit in zip(self.axes, self.veloLimits):
+            if displacement != 0 and self.totalTime > Ta:
+                peak = abs(displacement) / (self.totalTime - Ta)
+                scale = min(scale, veloLimit / peak)
+        return max(scale, MIN_SCALE)
+
+    def setOverride(self, percent):
+        """Request a new speed override in percent (10 to 100)."""
+        self.target = min(max(percent / 100.0, MIN_SCALE), self.maxScale)
+
+    @property
+    def done(self):
+        return self.tau >= self.totalTime
+
+    def _rateBounds(self, samples, scale):
+        # Range of ds/dt that keeps every axis within its acceleration limit
+        low, high = -self.maxRate, self.maxRate
+        for (pos, vel, acc), accelLimit in zip(samples, self.accelLimits):
+            if abs(vel) < 1e-12:
+                continue
+            base = acc * scale**2
+            # |base + vel * rate| <= accelLimit
+            first = (-accelLimit - base) / vel
+            second = (accelLimit - base) / vel
+            low = max(low, min(first, second))
+            high = min(high, max(first, second))
+        return (low, max(low, high))
+
+    def _samples(self, tau):
+        return [sample(d, s, Ta, self.totalTime, tau) for d, s, Ta in self.axes]
+
+    def _advance(self, rate, dt):
+        # Scale and tau after dt at the given rate of change of the scale
+        scale = min(max(self.scale + rate * dt, MIN_SCALE), self.maxScale)
+        tau = min(self.tau + 0.5 * (self.scale + scale) * dt, self.totalTime)
+        return (scale, tau)
+
+    def tick(self, dt):
+        """
+        Advance by dt seconds of wall-clock time.
+
+        Returns:
+            tuple: (tau, scale, setpoints) where setpoints is a list of
+                (pos, vel, acc) per axis in wall-clock units
+        """
+        wanted = (self.target - self.scale) / dt if dt > 0 else 0.0
+        low, high = self._rateBounds(self._samples(self.tau), self.scale)
+        rate = min(max(wanted, low), high)
+
+        # The setpoint is evaluated where the tick lands, so the rate must be
+        # within the bounds there. Every bound contains zero (s <= 1), so
+        # clipping only shrinks the rate; if that does not settle, holding
+        # the scale is always within the limits
+        for _ in range(MAX_ITERATIONS):
+            scale, tau = self._advance(rate, dt)
+            if dt > 0:
+                rate = (scale - self.scale) / dt
+            low, high = self._rateBounds(self._samples(tau), scale)
+            if low <= rate <= high:
+                break
+            rate = min(max(rate, low), high)
+        else:
+            rate = 0.0
+            scale, tau = self._advance(rate, dt)
+        self.scale, self.tau = scale, tau
+
+        setpoints = [
+            (pos, vel * self.scale, acc * self.scale**2 + vel * rate)
+            for pos, vel, acc in self._samples(self.tau)
+        ]
+        return (self.tau, self.scale, setpoints)
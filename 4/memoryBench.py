@@ -0,0 +1,153 @@
+"""
+Peak-memory benchmark for the planning APIs.
+
+Measures peak and retained allocations per call with tracemalloc and
+compares bytes-per-sample against memory_baseline.json.
+
+    python memoryBench.py            # report, exit 1 on regressions
+    python memoryBench.py --update   # rewrite the baseline
+"""
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+import MotionProfiles
+from jointInterpolation import jointInterpolation
+from motion import motion
+from trajectory import profile
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "memory_baseline.json")
+SAMPLE_COUNTS = (1000, 10000, 100000)
+REGRESSION_THRESHOLD = 0.15
+
+# Reference move: 100 units at 50 accel / 100 velocity takes 2*sqrt(2) s
+DISPLACEMENT, ACCEL_LIMIT, VELO_LIMIT = 100, 50, 100
+MOVE_TIME = 2 * 2**0.5
+
+
+def _cases(samples):
+    interval = MOVE_TIME / samples
+    time, Ta = motion(DISPLACEMENT, interval, ACCEL_LIMIT, VELO_LIMIT)
+    joint = (DISPLACEMENT, 0, 50, 0, interval, ACCEL_LIMIT, VELO_LIMIT, 80, 150)
+    return {
+        "motion": (motion, (DISPLACEMENT, interval, ACCEL_LIMIT, VELO_LIMIT)),
+        "profile": (profile, (DISPLACEMENT, 0, time, Ta)),
+        "jointInterpolation": (jointInterpolation, joint),
+        "MotionProfiles.motion": (
+            MotionProfiles.motion,
+            (DISPLACEMENT, interval, ACCEL_LIMIT, VELO_LIMIT),
+        ),
+        "MotionProfiles.profile": (MotionProfiles.profile, (DISPLACEMENT, 0, time, Ta)),
+        "MotionProfiles.joint_interpolation": (MotionProfiles.joint_interpolation, joint),
+    }
+
+
+def measure(function, args):
+    """
+    Peak and retained bytes allocated by one call.
+
+    Returns:
+        tuple: (peak, retained) where retained is what the result still
+            holds once the call returns
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function(*args)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return (peak, retained)
+
+
+def run(sampleCounts=SAMPLE_COUNTS):
+    """
+    Measure every API at every sample count.
+
+    Returns:
+        list of dicts: name, samples, peak, retained and both per sample
+    """
+    rows = []
+    for samples in sampleCounts:
+        for name, (function, args) in _cases(samples).items():
+            peak, retained = measure(function, args)
+            rows.append(
+                {
+                    "name": name,
+                    "samples": samples,
+                    "peak": peak,
+                    "retained": retained,
+                    "peakPerSample": peak / samples,
+                    "retainedPerSample": retained / samples,
+                }
+            )
+    return rows
+
+
+def summarize(rows):
+    """Worst bytes-per-sample for each API across sample counts."""
+    summary = {}
+    for row in rows:
+        entry = summary.setdefault(row["name"], {"peakPerSample": 0, "retainedPerSample": 0})
+        entry["peakPerSample"] = max(entry["peakPerSample"], row["peakPerSample"])
+        entry["retainedPerSample"] = max(entry["retainedPerSample"], row["retainedPerSample"])
+    return summary
+
+
+def loadBaseline(path=BASELINE_PATH):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def saveBaseline(rows, path=BASELINE_PATH):
+    summary = {
+        name: {key: round(value, 1) for key, value in entry.items()}
+        for name, entry in summarize(rows).items()
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def regressions(rows, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Bytes-per-sample figures more than threshold above the baseline.
+
+    Returns:
+        list of str: One message per regression, empty when within budget
+    """
+    failures = []
+    for name, entry in summarize(rows).items():
+        if name not in baseline:
+            continue
+        for key, value in entry.items():
+            limit = baseline[name][key] * (1 + threshold)
+            if value > limit:
+                failures.append(
+                    f"{name} {key}: {value:.1f} B/sample exceeds {limit:.1f} "
+                    f"(baseline {baseline[name][key]:.1f} + {threshold:.0%})"
+                )
+    return failures
+
+
+if __name__ == "__main__":
+    rows = run()
+    print(f"{'API':38} {'samples':>8} {'peak B/s':>10} {'kept B/s':>10}")
+    for row in rows:
+        print(
+            f"{row['name']:38} {row['samples']:>8} "
+            f"{row['peakPerSample']:>10.1f} {row['retainedPerSample']:>10.1f}"
+        )
+
+    if "--update" in sys.argv:
+        saveBaseline(rows)
+        print(f"\nBaseline written to {BASELINE_PATH}")
+    else:
+        failures = regressions(rows, loadBaseline())
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        sys.exit(1 if failures else 0)
@@ -5,9 +5,8 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
-from jointInterpolation import jointInterpolation
-from motion import motion
-from trajectory import profile
+from plotStyle import AXES_BG, FIGURE_BG, draw_dual_plot, draw_plot
+from trajectoryCache import TrajectoryCache
 
 
 class MotionProfileUI:
@@ -16,6 +15,9 @@ class MotionProfileUI:
         self.root.title("Assignment #4")
         self.root.configure(bg="#1e1e1e")
 
+        # Trajectories planned in earlier sessions are reused from disk
+        self.cache = TrajectoryCache()
+
         # Configure style
         style = ttk.Style()
         style.theme_use("clam")
@@ -432,22 +434,10 @@ class MotionProfileUI:
         )
         plot_frame.pack(fill="both", expand=True, padx=24, pady=(0, 24))
 
-        fig = Figure(figsize=(8, 3), facecolor="#252526")
-        ax = fig.add_subplot(111, facecolor="#1e1e1e")
-
-        ax.plot(t, data, color=color, linewidth=2, alpha=0.8)
-        ax.fill_between(t, data, alpha=0.1, color=color)
+        fig = Figure(figsize=(8, 3), facecolor=FIGURE_BG)
+        ax = fig.add_subplot(111, facecolor=AXES_BG)
 
-        ax.set_title(title, color="#cccccc", fontsize=11, pad=10)
-        ax.set_xlabel("Time (s)", color="#858585", fontsize=9)
-        ax.set_ylabel(ylabel, color="#858585", fontsize=9)
-
-        ax.tick_params(colors="#858585", labelsize=8)
-        ax.grid(True, color="#3e3e42", linewidth=0.5, alpha=0.5)
-        ax.spines["bottom"].set_color("#3e3e42")
-        ax.spines["top"].set_color("#3e3e42")
-        ax.spines["left"].set_color("#3e3e42")
-        ax.spines["right"].set_color("#3e3e42")
+        draw_plot(ax, t, data, title, ylabel, color)
 
         fig.tight_layout()
 
@@ -462,27 +452,10 @@ class MotionProfileUI:
         )
         plot_frame.pack(fill="both", expand=True, padx=24, pady=(0, 24))
 
-        fig = Figure(figsize=(8, 3), facecolor="#252526")
-        ax = fig.add_subplot(111, facecolor="#1e1e1e")
-
-        ax.plot(t, data_a, color="#4fc3f7", linewidth=2, alpha=0.8, label="Joint A")
-        ax.plot(t, data_b, color="#ce93d8", linewidth=2, alpha=0.8, label="Joint B")
-        ax.fill_between(t, data_a, alpha=0.1, color="#4fc3f7")
-        ax.fill_between(t, data_b, alpha=0.1, color="#ce93d8")
+        fig = Figure(figsize=(8, 3), facecolor=FIGURE_BG)
+        ax = fig.add_subplot(111, facecolor=AXES_BG)
 
-        ax.set_title(title, color="#cccccc", fontsize=11, pad=10)
-        ax.set_xlabel("Time (s)", color="#858585", fontsize=9)
-        ax.set_ylabel(ylabel, color="#858585", fontsize=9)
-
-        ax.tick_params(colors="#858585", labelsize=8)
-        ax.grid(True, color="#3e3e42", linewidth=0.5, alpha=0.5)
-        ax.legend(
-            facecolor="#252526", edgecolor="#3e3e42", labelcolor="#cccccc", fontsize=8
-        )
-        ax.spines["bottom"].set_color("#3e3e42")
-        ax.spines["top"].set_color("#3e3e42")
-        ax.spines["left"].set_color("#3e3e42")
-        ax.spines["right"].set_color("#3e3e42")
+        draw_dual_plot(ax, t, data_a, data_b, title, ylabel)
 
         fig.tight_layout()
 
@@ -506,7 +479,7 @@ class MotionProfileUI:
         if not t or t[-1] < tt:
             t.append(tt)
 
-        pos, vel, acc = profile(d, s, t, ta)
+        pos, vel, acc = self.cache.profile(d, s, t, ta)
 
         self.clear_plots(self.profile_canvas_frame)
 
@@ -527,8 +500,8 @@ class MotionProfileUI:
         al = float(self.m_accel_limit.get())
         vl = float(self.m_velo_limit.get())
 
-        t, ta = motion(d, interval, al, vl)
-        pos, vel, acc = profile(d, s, t, ta)
+        t, ta = self.cache.motion(d, interval, al, vl)
+        pos, vel, acc = self.cache.profile(d, s, t, ta)
 
         self.motion_info.config(text=f"  Ta: {ta:.3f}s | Total: {t[-1]:.3f}s  ")
 
@@ -555,7 +528,9 @@ class MotionProfileUI:
         alb = float(self.j_accel_b.get())
         vlb = float(self.j_velo_b.get())
 
-        eoma, eomb, t = jointInterpolation(da, sa, db, sb, interval, ala, vla, alb, vlb)
+        eoma, eomb, t = self.cache.jointInterpolation(
+            da, sa, db, sb, interval, ala, vla, alb, vlb
+        )
 
         self.joint_info.config(text=f"  Total: {t[-1]:.3f}s  ")
 
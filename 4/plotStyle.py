@@ -0,0 +1,44 @@
+"""
+Shared plot styling for the Tk UI and the headless report renderer.
+Nothing here imports a GUI toolkit, so it is safe to use under Agg.
+"""
+
+FIGURE_BG = "#252526"
+AXES_BG = "#1e1e1e"
+BORDER = "#3e3e42"
+TEXT = "#cccccc"
+MUTED = "#858585"
+
+POSITION_COLOR = "#4fc3f7"
+VELOCITY_COLOR = "#ce93d8"
+ACCELERATION_COLOR = "#80cbc4"
+JOINT_A_COLOR = "#4fc3f7"
+JOINT_B_COLOR = "#ce93d8"
+
+
+def style_axes(ax, title, ylabel):
+    ax.set_title(title, color=TEXT, fontsize=11, pad=10)
+    ax.set_xlabel("Time (s)", color=MUTED, fontsize=9)
+    ax.set_ylabel(ylabel, color=MUTED, fontsize=9)
+
+    ax.tick_params(colors=MUTED, labelsize=8)
+    ax.grid(True, color=BORDER, linewidth=0.5, alpha=0.5)
+    ax.spines["bottom"].set_color(BORDER)
+    ax.spines["top"].set_color(BORDER)
+    ax.spines["left"].set_color(BORDER)
+    ax.spines["right"].set_color(BORDER)
+
+
+def draw_plot(ax, t, data, title, ylabel, color):
+    ax.plot(t, data, color=color, linewidth=2, alpha=0.8)
+    ax.fill_between(t, data, alpha=0.1, color=color)
+    style_axes(ax, title, ylabel)
+
+
+def draw_dual_plot(ax, t, data_a, data_b, title, ylabel):
+    ax.plot(t, data_a, color=JOINT_A_COLOR, linewidth=2, alpha=0.8, label="Joint A")
+    ax.plot(t, data_b, color=JOINT_B_COLOR, linewidth=2, alpha=0.8, label="Joint B")
+    ax.fill_between(t, data_a, alpha=0.1, color=JOINT_A_COLOR)
+    ax.fill_between(t, data_b, alpha=0.1, color=JOINT_B_COLOR)
+    style_axes(ax, title, ylabel)
+    ax.legend(facecolor=FIGURE_BG, edgecolor=BORDER, labelcolor=TEXT, fontsize=8)
@@ -0,0 +1,134 @@
+"""
+Vectorized equivalents of motion, profile and jointInterpolation.
+Every function accepts scalars or NumPy arrays and broadcasts over moves.
+"""
+
+import numpy as np
+
+
+def motionArray(displacement, accelLimit, veloLimit):
+    """
+    Closed-form move time for a batch of moves, matching motion().
+
+    Args:
+        displacement (float or array): The total change in position
+        accelLimit (float or array): The acceleration limit
+        veloLimit (float or array): The velocity limit
+
+    Returns:
+        tuple: Two arrays (Tf, Ta) with the total move time and the
+            duration of the acceleration and deceleration
+    """
+    d = np.abs(np.asarray(displacement, dtype=float))
+    accelLimit = np.asarray(accelLimit, dtype=float)
+    veloLimit = np.asarray(veloLimit, dtype=float)
+
+    triangular = d <= veloLimit**2 / accelLimit
+    Ta = np.where(triangular, np.sqrt(d / accelLimit), veloLimit / accelLimit)
+    Tf = np.where(triangular, 2 * Ta, d / veloLimit + Ta)
+
+    return (Tf, Ta)
+
+
+def timeArray(finalTime, interval):
+    """
+    Sample grid 0, interval, 2*interval, ... closed with finalTime.
+
+    Each sample is index * interval, so the grid does not drift. motion()
+    accumulates the interval instead, and when finalTime is a multiple of
+    interval that drift can leave a sample just below finalTime followed by
+    finalTime itself, one more sample than this grid. Otherwise the two
+    grids agree.
+
+    The last sample is always finalTime itself: index * interval can round
+    to just above finalTime, and is then replaced rather than kept.
+    """
+    return timeSlice(finalTime, interval, 0, sampleCount(finalTime, interval))
+
+
+def sampleCount(finalTime, interval):
+    """Length of the timeArray() grid for a move of finalTime."""
+    steps = int(np.floor(finalTime / interval))
+    return steps + 1 + (steps * interval < finalTime)
+
+
+def timeSlice(finalTime, interval, first, last):
+    """Samples first to last - 1 of the timeArray() grid, e.g. one block of it."""
+    time = np.arange(first, last, dtype=float) * interval
+    if last == sampleCount(finalTime, interval):
+        time[-1] = finalTime
+    return time
+
+
+def syncArray(displacement, finalTime, accelLimit, Tf, Ta):
+    """
+    Acceleration time that stretches each move to finalTime at its
+    acceleration limit, as jointInterpolation() does for the faster joint.
+    """
+    d = np.abs(np.asarray(displacement, dtype=float))
+    finalTime = np.asarray(finalTime, dtype=float)
+
+    discriminant = finalTime**2 - 4 * d / accelLimit
+    stretched = np.where(
+        discriminant >= 0,
+        (finalTime - np.sqrt(np.maximum(discriminant, 0))) / 2,
+        finalTime / 2,  # Fallback to triangular profile
+    )
+    return np.where((d > 0) & (Tf < finalTime), stretched, Ta)
+
+
+def _column(value):
+    # Trailing axis so per-move parameters broadcast against the time axis
+    return np.asarray(value, dtype=float)[..., np.newaxis]
+
+
+def profileArray(displacement, start, time, Ta, totalTime=None):
+    """
+    Evaluate the trapezoidal profile of profile() on NumPy arrays.
+
+    Args:
+        displacement (float or array of shape (m,)): The total change in position
+        start (float or array of shape (m,)): The initial position for a move
+        time (array of shape (n,) or (m, n)): Each value of time to evaluate
+        Ta (float or array of shape (m,)): The duration of the acceleration
+        totalTime (float or array of shape (m,)): Move duration, defaults to
+            the last entry of time
+
+    Returns:
+        tuple: Three arrays (pos, vel, acc) shaped like the broadcast of
+            time against the per-move parameters
+    """
+    time = np.asarray(time, dtype=float)
+    if totalTime is None:
+        totalTime = time[..., -1]
+
+    d = _column(displacement)
+    s = _column(start)
+    Ta = _column(Ta)
+    T = _column(totalTime)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cruiseVelocity = np.where(T > Ta, d / (T - Ta), 0.0)
+        accel = np.where(Ta > 0, cruiseVelocity / Ta, 0.0)
+
+    timeFromEnd = time - T
+    accelPhase = time <= Ta
+    cruisePhase = time <= T - Ta
+
+    pos = np.where(
+        accelPhase,
+        0.5 * accel * time**2,
+        np.where(
+            cruisePhase,
+            cruiseVelocity * time - 0.5 * cruiseVelocity * Ta,
+            -0.5 * accel * timeFromEnd**2 + cruiseVelocity * (T - Ta),
+        ),
+    )
+    vel = np.where(
+        accelPhase,
+        accel * time,
+        np.where(cruisePhase, cruiseVelocity, -accel * timeFromEnd),
+    )
+    acc = np.where(accelPhase, accel, np.where(cruisePhase, 0.0, -accel))
+
+    return (s + pos, vel, acc)
@@ -0,0 +1,145 @@
+"""
+Asyncio setpoint publisher that streams planned frames over UDP against
+absolute deadlines on the event loop's monotonic clock.
+
+Each datagram carries one tick for every joint: a sequence number, a flags
+word, the trajectory time and then (pos, vel, acc) per joint, little-endian.
+"""
+
+import asyncio
+import struct
+
+import numpy as np
+
+HEADER = struct.Struct("<IId")
+FLAG_EXTRAPOLATED = 1
+
+
+def packFrame(sequence, frame, flags=0):
+    """Datagram for one frame row of t followed by pos/vel/acc per joint."""
+    return HEADER.pack(sequence, flags, frame[0]) + np.asarray(
+        frame[1:], dtype="<f8"
+    ).tobytes()
+
+
+def unpackFrame(datagram):
+    """Inverse of packFrame(): (sequence, flags, frame row)."""
+    sequence, flags, t = HEADER.unpack_from(datagram)
+    values = np.frombuffer(datagram, dtype="<f8", offset=HEADER.size)
+    return (sequence, flags, np.concatenate(([t], values)))
+
+
+def extrapolate(frame, dt):
+    """Advance every joint of a frame by dt using its velocity and acceleration."""
+    advanced = np.array(frame, dtype=float)
+    advanced[0] += dt
+    pos, vel, acc = advanced[1::3], advanced[2::3], advanced[3::3]
+    advanced[1::3] = pos + vel * dt + 0.5 * acc * dt**2
+    advanced[2::3] = vel + acc * dt
+    return advanced
+
+
+def jitterStats(lateness, sendTimes, period, missed, sent):
+    """Summarize lateness and inter-send jitter in seconds."""
+    lateness = np.asarray(lateness, dtype=float)
+    jitter = np.abs(np.diff(np.asarray(sendTimes, dtype=float)) - period)
+    stats = {"sent": sent, "missedDeadlines": missed}
+    for label, values in (("lateness", lateness), ("jitter", jitter)):
+        if len(values):
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            stats[label] = {
+                "mean": float(values.mean()),
+                "p50": float(p50),
+                "p90": float(p90),
+                "p99": float(p99),
+                "max": float(values.max()),
+            }
+        else:
+            stats[label] = None
+    return stats
+
+
+class _Sender(asyncio.DatagramProtocol):
+    def __init__(self):
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+
+async def publish(frames, address, period, mode="skip", lateTolerance=None):
+    """
+    Send one frame per period to address over UDP.
+
+    Args:
+        frames (array of shape (n, 1 + 3 * joints)): Rows of t then
+            pos/vel/acc per joint, e.g. ringBuffer.framesFromEoms() output
+        address (tuple): (host, port) of the receiver
+        period (float): Seconds between ticks
+        mode (str): What to do when behind schedule. "skip" drops frames
+            whose deadline has passed by more than lateTolerance. "extrapolate"
+            drops them too, and advances the frame that is sent by its
+            lateness using its velocity and acceleration.
+        lateTolerance (float): Lateness beyond which a tick counts as missed,
+            defaults to one period. Missed ticks are never sent, except the
+            final frame, which is sent however late so the receiver ends on
+            the target
+
+    Returns:
+        dict: Sent and missed-deadline counts plus lateness and jitter
+            percentiles, see jitterStats()
+    """
+    if mode not in ("skip", "extrapolate"):
+        raise ValueError(f"unknown mode {mode!r}")
+    if lateTolerance is None:
+        lateTolerance = period
+
+    frames = np.asarray(frames, dtype=float)
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(_Sender, remote_addr=address)
+
+    lateness = []
+    sendTimes = []
+    missed = 0
+    sent = 0
+    start = loop.time()
+    index = 0
+    try:
+        while index < len(frames):
+            deadline = start + index * period
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            now = loop.time()
+            late = now - deadline
+            if late > lateTolerance:
+                # Jump to the tick that is due now instead of sending a backlog
+                due = min(int((now - start) / period), len(frames) - 1)
+                if due > index:
+                    missed += due - index
+                    index = due
+                    deadline = start + index * period
+                    late = now - deadline
+                if late > lateTolerance and index < len(frames) - 1:
+                    # Even the tick due now is too late (lateTolerance below
+                    # one period): drop it and wait for the next deadline
+                    missed += 1
+                    index += 1
+                    continue
+
+            frame = frames[index]
+            flags = 0
+            if mode == "extrapolate" and late > 0:
+                frame = extrapolate(frame, late)
+                flags = FLAG_EXTRAPOLATED
+
+            transport.sendto(packFrame(index, frame, flags))
+            lateness.append(late)
+            sendTimes.append(now)
+            sent += 1
+            index += 1
+    finally:
+        transport.close()
+
+    return jitterStats(lateness, sendTimes, period, missed, sent)
@@ -0,0 +1,267 @@
+"""
+Render-latency benchmark for MotionProfileUI's plotting paths.
+
+Drives plot_profile(), plot_motion() and plot_joint() programmatically and
+splits each regeneration into
+
+    planning      the cache/planner calls
+    layout        Figure.tight_layout()
+    draw          the canvas draw()
+    construction  everything else: clearing, Figure, add_subplot, plot,
+                  fill_between and styling
+
+By default it runs headless: the UI's methods run unchanged, with Tk frames
+replaced by stubs and FigureCanvasTkAgg by an Agg canvas. With --tk it opens
+the real window instead, which needs a display (e.g. under xvfb-run). Memory
+growth across repeated regenerations is measured in a separate tracemalloc
+pass so tracing does not distort the timings.
+
+    python renderBench.py                 # headless Agg
+    xvfb-run python renderBench.py --tk   # real Tk widgets
+"""
+
+import gc
+import statistics
+import sys
+import time as clock
+import tracemalloc
+import types
+from contextlib import contextmanager
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import motionUI
+from jointInterpolation import jointInterpolation
+from motion import motion
+from profileArray import motionArray
+from trajectory import profile
+
+SAMPLE_COUNTS = (100, 1000, 10000)
+REPEATS = 5
+PHASES = ("planning", "construction", "layout", "draw")
+
+_phases = {}
+
+
+@contextmanager
+def _timed(phase):
+    started = clock.perf_counter()
+    try:
+        yield
+    finally:
+        _phases[phase] = _phases.get(phase, 0.0) + clock.perf_counter() - started
+
+
+class _TimedFigure(Figure):
+    def tight_layout(self, *args, **kwargs):
+        with _timed("layout"):
+            return super().tight_layout(*args, **kwargs)
+
+
+class _Widget:
+    # Stands in for Tk frames and widgets in headless runs
+    def __init__(self, parent=None, **options):
+        self.children = []
+        if parent is not None:
+            parent.children.append(self)
+        self.parent = parent
+
+    def pack(self, **options):
+        pass
+
+    def config(self, **options):
+        pass
+
+    def winfo_children(self):
+        return list(self.children)
+
+    def destroy(self):
+        if self.parent is not None:
+            self.parent.children.remove(self)
+
+
+class _AggCanvas(FigureCanvasAgg):
+    def __init__(self, figure, master=None):
+        super().__init__(figure)
+
+    def draw(self):
+        with _timed("draw"):
+            super().draw()
+
+    def get_tk_widget(self):
+        return _Widget()
+
+
+class _TimedTkCanvas(motionUI.FigureCanvasTkAgg):
+    def draw(self):
+        with _timed("draw"):
+            super().draw()
+
+
+class _Planner:
+    # Uncached planners, so every regeneration pays for the math
+    def motion(self, *args):
+        with _timed("planning"):
+            return motion(*args)
+
+    def profile(self, *args):
+        with _timed("planning"):
+            return profile(*args)
+
+    def jointInterpolation(self, *args):
+        with _timed("planning"):
+            return jointInterpolation(*args)
+
+
+class _Entry:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return str(self.value)
+
+
+def headlessUI():
+    """
+    A MotionProfileUI whose plotting methods run without a display.
+
+    The UI module's tk and FigureCanvasTkAgg names are swapped for stubs and
+    an Agg canvas; call restoreUI() to put them back.
+    """
+    motionUI.tk = types.SimpleNamespace(Frame=_Widget)
+    motionUI.FigureCanvasTkAgg = _AggCanvas
+    motionUI.Figure = _TimedFigure
+
+    ui = motionUI.MotionProfileUI.__new__(motionUI.MotionProfileUI)
+    ui.cache = _Planner()
+    ui.profile_canvas_frame = _Widget()
+    ui.motion_canvas_frame = _Widget()
+    ui.joint_canvas_frame = _Widget()
+    ui.motion_info = _Widget()
+    ui.joint_info = _Widget()
+    return ui
+
+
+def tkUI():
+    """The real window, instrumented; needs a display."""
+    import tkinter
+
+    motionUI.FigureCanvasTkAgg = _TimedTkCanvas
+    motionUI.Figure = _TimedFigure
+    root = tkinter.Tk()
+    root.geometry("1400x900")
+    ui = motionUI.MotionProfileUI(root)
+    ui.cache = _Planner()
+    return ui
+
+
+def restoreUI():
+    import tkinter
+
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    motionUI.tk = tkinter
+    motionUI.FigureCanvasTkAgg = FigureCanvasTkAgg
+    motionUI.Figure = Figure
+
+
+def configure(ui, samples):
+    """Fill the inputs so each plotting path produces about samples points."""
+    # Same moves as the UI defaults
+    ui.p_displacement, ui.p_start, ui.p_ta = _Entry(100), _Entry(0), _Entry(0.5)
+    ui.p_total_time = _Entry(2)
+    ui.p_interval = _Entry(2 / (samples - 1))
+
+    Tf, _ = motionArray(100, 50, 100)
+    ui.m_displacement, ui.m_start = _Entry(100), _Entry(0)
+    ui.m_accel_limit, ui.m_velo_limit = _Entry(50), _Entry(100)
+    ui.m_interval = _Entry(float(Tf) / (samples - 1))
+
+    Tf, _ = motionArray([100, 50], [100, 80], [200, 150])
+    ui.j_displacement_a, ui.j_start_a = _Entry(100), _Entry(0)
+    ui.j_accel_a, ui.j_velo_a = _Entry(100), _Entry(200)
+    ui.j_displacement_b, ui.j_start_b = _Entry(50), _Entry(0)
+    ui.j_accel_b, ui.j_velo_b = _Entry(80), _Entry(150)
+    ui.j_interval = _Entry(float(Tf.max()) / (samples - 1))
+
+
+def regenerate(ui, path):
+    """
+    One click of a Generate button.
+
+    Returns:
+        dict: Seconds spent in each of PHASES plus "total"
+    """
+    _phases.clear()
+    root = getattr(ui, "root", None)
+    started = clock.perf_counter()
+    getattr(ui, path)()
+    if root is not None:
+        root.update()
+    total = clock.perf_counter() - started
+
+    timings = {phase: _phases.get(phase, 0.0) for phase in PHASES}
+    timings["construction"] = total - timings["planning"] - timings["layout"] - timings["draw"]
+    timings["total"] = total
+    return timings
+
+
+def memoryGrowth(ui, path, repeats):
+    """
+    Bytes still allocated after each of repeats regenerations, relative
+    to a first reference regeneration.
+
+    Returns:
+        list of ints: One entry per repeat
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        retained = []
+        for _ in range(repeats + 1):
+            regenerate(ui, path)
+            gc.collect()
+            retained.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+    return [value - retained[0] for value in retained[1:]]
+
+
+def run(sampleCounts=SAMPLE_COUNTS, repeats=REPEATS, useTk=False):
+    """
+    Benchmark every plotting path at every sample count.
+
+    Returns:
+        list of dicts: path, samples, median seconds per phase and total,
+            and "growth", bytes retained after the last regeneration
+            relative to the first
+    """
+    ui = tkUI() if useTk else headlessUI()
+    rows = []
+    try:
+        for samples in sampleCounts:
+            configure(ui, samples)
+            for path in ("plot_profile", "plot_motion", "plot_joint"):
+                # Warm-up: font caches, first-use imports
+                regenerate(ui, path)
+                timings = [regenerate(ui, path) for _ in range(repeats)]
+                row = {"path": path, "samples": samples}
+                for key in PHASES + ("total",):
+                    row[key] = statistics.median(timing[key] for timing in timings)
+                row["growth"] = memoryGrowth(ui, path, repeats)[-1]
+                rows.append(row)
+    finally:
+        if useTk:
+            ui.root.destroy()
+        restoreUI()
+    return rows
+
+
+if __name__ == "__main__":
+    rows = run(useTk="--tk" in sys.argv)
+    header = "".join(f"{phase:>14}" for phase in PHASES + ("total",))
+    print(f"{'path':14} {'samples':>8}{header} {'growth B':>10}")
+    for row in rows:
+        phases = "".join(f"{row[phase] * 1000:>12.2f}ms" for phase in PHASES + ("total",))
+        print(f"{row['path']:14} {row['samples']:>8}{phases} {row['growth']:>10}")
@@ -0,0 +1,169 @@
+"""
+Headless report renderer for position/velocity/acceleration plots.
+Plots use the same styling as MotionProfileUI, are drawn with the Agg
+backend across a process pool, and are indexed by an HTML summary.
+"""
+
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from jointInterpolation import jointInterpolation
+from motion import motion
+from plotStyle import (
+    ACCELERATION_COLOR,
+    AXES_BG,
+    FIGURE_BG,
+    POSITION_COLOR,
+    VELOCITY_COLOR,
+    draw_dual_plot,
+    draw_plot,
+)
+from trajectory import profile
+
+# Figure template owned by each worker process, built once by _initWorker
+_template = None
+
+
+def planMove(move):
+    """
+    Plan one move described by a dict.
+
+    A move with "displacementA" is coordinated with jointInterpolation(),
+    any other move is planned with motion() and profile().
+
+    Returns:
+        tuple: (time, eoms, info) where eoms is a list of (pos, vel, acc)
+            tuples, one per joint, and info describes the timing
+    """
+    if "displacementA" in move:
+        eomA, eomB, time = jointInterpolation(
+            move["displacementA"],
+            move.get("startA", 0),
+            move["displacementB"],
+            move.get("startB", 0),
+            move["interval"],
+            move["accelLimitA"],
+            move["veloLimitA"],
+            move["accelLimitB"],
+            move["veloLimitB"],
+        )
+        return (time, [eomA, eomB], f"Total: {time[-1]:.3f}s")
+
+    time, Ta = motion(
+        move["displacement"], move["interval"], move["accelLimit"], move["veloLimit"]
+    )
+    eom = profile(move["displacement"], move.get("start", 0), time, Ta)
+    return (time, [eom], f"Ta: {Ta:.3f}s | Total: {time[-1]:.3f}s")
+
+
+def _createTemplate():
+    fig = Figure(figsize=(8, 9), facecolor=FIGURE_BG)
+    axes = [fig.add_subplot(3, 1, i + 1, facecolor=AXES_BG) for i in range(3)]
+    FigureCanvasAgg(fig)
+    return (fig, axes)
+
+
+def _initWorker():
+    global _template
+    _template = _createTemplate()
+
+
+def _renderMove(job):
+    index, move, outputDir, formats = job
+    if _template is None:
+        _initWorker()
+    fig, axes = _template
+
+    time, eoms, info = planMove(move)
+
+    titles = ("Position", "Velocity", "Acceleration")
+    colors = (POSITION_COLOR, VELOCITY_COLOR, ACCELERATION_COLOR)
+    for k, ax in enumerate(axes):
+        ax.cla()
+        if len(eoms) == 2:
+            draw_dual_plot(ax, time, eoms[0][k], eoms[1][k], titles[k], titles[k])
+        else:
+            draw_plot(ax, time, eoms[0][k], titles[k], titles[k], colors[k])
+    fig.tight_layout()
+
+    files = []
+    for fmt in formats:
+        name = f"move_{index:05d}.{fmt}"
+        fig.savefig(os.path.join(outputDir, name), format=fmt, facecolor=FIGURE_BG)
+        files.append(name)
+
+    return {
+        "index": index,
+        "name": move.get("name", f"Move {index}"),
+        "info": info,
+        "finalTime": time[-1],
+        "files": files,
+    }
+
+
+def renderReport(moves, outputDir, formats=("png",), workers=None, chunksize=8):
+    """
+    Render plots for every move and write an indexed HTML summary.
+
+    Args:
+        moves (list of dicts): Move parameters, see planMove()
+        outputDir (str): Directory for the images and index.html
+        formats (tuple of str): Image formats to save, e.g. ("png", "svg")
+        workers (int): Process pool size, None for os.cpu_count(), 0 to
+            render in the calling process
+        chunksize (int): Moves handed to a worker at a time
+
+    Returns:
+        list of dicts: One entry per move with its timing and image files
+    """
+    os.makedirs(outputDir, exist_ok=True)
+    jobs = [(i, move, outputDir, tuple(formats)) for i, move in enumerate(moves)]
+
+    if workers == 0:
+        entries = [_renderMove(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initWorker) as pool:
+            entries = list(pool.map(_renderMove, jobs, chunksize=chunksize))
+
+    writeIndex(entries, os.path.join(outputDir, "index.html"))
+    return entries
+
+
+def writeIndex(entries, path):
+    """Write an HTML table linking every rendered move."""
+    rows = []
+    for entry in entries:
+        image = html.escape(entry["files"][0]) if entry["files"] else ""
+        links = " ".join(
+            f'<a href="{html.escape(name)}">{html.escape(name.rsplit(".", 1)[-1])}</a>'
+            for name in entry["files"]
+        )
+        rows.append(
+            "<tr>"
+            f"<td>{entry['index']}</td>"
+            f"<td>{html.escape(str(entry['name']))}</td>"
+            f"<td>{html.escape(entry['info'])}</td>"
+            f"<td>{links}</td>"
+            f'<td><a href="{image}"><img src="{image}" width="240" loading="lazy"></a></td>'
+            "</tr>"
+        )
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(
+            "<!doctype html>\n<html lang=\"en\">\n<head>\n"
+            '<meta charset="UTF-8" />\n<title>Motion Profile Report</title>\n'
+            "<style>\n"
+            f"body {{ background: {AXES_BG}; color: #d4d4d4; font-family: Arial, sans-serif; }}\n"
+            "table { border-collapse: collapse; }\n"
+            "td, th { border: 1px solid #3e3e42; padding: 6px 12px; }\n"
+            "a { color: #4fc3f7; }\n"
+            "</style>\n</head>\n<body>\n"
+            f"<h1>Motion Profile Report</h1>\n<p>{len(entries)} moves</p>\n"
+            "<table>\n<tr><th>#</th><th>Move</th><th>Timing</th><th>Files</th><th>Plot</th></tr>\n"
+            + "\n".join(rows)
+            + "\n</table>\n</body>\n</html>\n"
+        )
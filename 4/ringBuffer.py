@@ -0,0 +1,206 @@
+"""
+Single-producer/single-consumer ring buffer of setpoint frames in
+multiprocessing.shared_memory.
+
+A frame is one row of float64: t followed by (pos, vel, acc) for each
+joint. The producer only ever advances the write sequence and the consumer
+only the read sequence, so no lock is needed: each counter has a single
+writer and is published after the frame data it covers.
+"""
+
+import sys
+import time as clock
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+# Header slots (int64)
+WRITE_SEQ = 0
+READ_SEQ = 1
+CAPACITY = 2
+JOINTS = 3
+CLOSED = 4
+STALLS = 5
+HEADER_SLOTS = 8
+
+
+class SetpointRing:
+    """
+    Shared setpoint ring. Use SetpointRing.create() in the planner and
+    SetpointRing.attach() with the same name in the controller.
+    """
+
+    def __init__(self, memory, owner):
+        self.memory = memory
+        self.owner = owner
+        self.header = np.ndarray((HEADER_SLOTS,), dtype=np.int64, buffer=memory.buf)
+        self.capacity = int(self.header[CAPACITY])
+        self.joints = int(self.header[JOINTS])
+        self.width = 1 + 3 * self.joints
+        self.frames = np.ndarray(
+            (self.capacity, self.width),
+            dtype=np.float64,
+            buffer=memory.buf,
+            offset=HEADER_SLOTS * 8,
+        )
+
+    @classmethod
+    def create(cls, capacity, joints=1, name=None):
+        """Allocate a new ring for capacity frames of the given joint count."""
+        width = 1 + 3 * joints
+        memory = shared_memory.SharedMemory(
+            name=name, create=True, size=HEADER_SLOTS * 8 + capacity * width * 8
+        )
+        header = np.ndarray((HEADER_SLOTS,), dtype=np.int64, buffer=memory.buf)
+        header[:] = 0
+        header[CAPACITY] = capacity
+        header[JOINTS] = joints
+        del header
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Open a ring created by another process.
+
+        The segment is not registered with this process's resource tracker.
+        Otherwise a separately launched consumer would unlink the producer's
+        ring when it exits (Python < 3.13 tracks every attach).
+        """
+        if sys.version_info >= (3, 13):
+            return cls(shared_memory.SharedMemory(name=name, track=False), owner=False)
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            memory = shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+        return cls(memory, owner=False)
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    def available(self):
+        """Frames written and not yet released by the consumer."""
+        return int(self.header[WRITE_SEQ] - self.header[READ_SEQ])
+
+    def free(self):
+        """Frames the producer can write without overwriting unread data."""
+        return self.capacity - self.available()
+
+    def pressure(self):
+        """Fill fraction; producers should slow down as it approaches 1."""
+        return self.available() / self.capacity
+
+    def stalls(self):
+        """Number of times the producer found the ring full."""
+        return int(self.header[STALLS])
+
+    # Producer side
+
+    def write(self, frames):
+        """
+        Copy as many frames as fit without blocking.
+
+        Args:
+            frames (array of shape (n, width)): Rows of t, then pos/vel/acc
+                per joint
+
+        Returns:
+            int: Frames written; fewer than n signals back-pressure
+        """
+        frames = np.asarray(frames, dtype=np.float64).reshape(-1, self.width)
+        writeSeq = int(self.header[WRITE_SEQ])
+        count = min(len(frames), self.capacity - (writeSeq - int(self.header[READ_SEQ])))
+        if count < len(frames):
+            self.header[STALLS] += 1
+
+        first = writeSeq % self.capacity
+        head = min(count, self.capacity - first)
+        self.frames[first : first + head] = frames[:head]
+        self.frames[: count - head] = frames[head:count]
+
+        # Publish only after the data is in place
+        self.header[WRITE_SEQ] = writeSeq + count
+        return count
+
+    def put(self, frames, timeout=None, poll=1e-4):
+        """
+        Write all frames, waiting for the consumer while the ring is full.
+
+        Returns:
+            int: Frames written, fewer than requested only on timeout
+        """
+        frames = np.asarray(frames, dtype=np.float64).reshape(-1, self.width)
+        deadline = None if timeout is None else clock.monotonic() + timeout
+        written = 0
+        while written < len(frames):
+            written += self.write(frames[written:])
+            if written < len(frames):
+                if deadline is not None and clock.monotonic() >= deadline:
+                    break
+                clock.sleep(poll)
+        return written
+
+    def close(self):
+        """Mark the stream finished; the consumer drains what is left."""
+        self.header[CLOSED] = 1
+
+    # Consumer side
+
+    def closed(self):
+        """True once the producer has closed and every frame was released."""
+        return bool(self.header[CLOSED]) and self.available() == 0
+
+    def read(self, maxFrames=None):
+        """
+        Zero-copy view of the next contiguous run of unread frames.
+
+        The view stays valid until release() is called for it. A run never
+        wraps, so a wrapped backlog is returned over two calls.
+
+        Returns:
+            array of shape (k, width): Possibly empty
+        """
+        readSeq = int(self.header[READ_SEQ])
+        count = int(self.header[WRITE_SEQ]) - readSeq
+        first = readSeq % self.capacity
+        count = min(count, self.capacity - first)
+        if maxFrames is not None:
+            count = min(count, maxFrames)
+        view = self.frames[first : first + count]
+        view.flags.writeable = False
+        return view
+
+    def release(self, count):
+        """Hand count frames back to the producer."""
+        self.header[READ_SEQ] += count
+
+    def detach(self):
+        """Close this process's mapping, unlinking it if this side created it."""
+        del self.header, self.frames
+        self.memory.close()
+        if self.owner:
+            try:
+                self.memory.unlink()
+            except FileNotFoundError:
+                # Already removed, e.g. by another process's resource tracker
+                pass
+
+
+def framesFromEoms(time, *eoms):
+    """
+    Pack profile()/jointInterpolation() output into ring frames.
+
+    Args:
+        time (list of floats): Sample times
+        *eoms (tuples of 3 lists): (pos, vel, acc) for each joint in order
+
+    Returns:
+        array of shape (n, 1 + 3 * joints)
+    """
+    columns = [np.asarray(time, dtype=float)]
+    for eom in eoms:
+        columns.extend(np.asarray(series, dtype=float) for series in eom)
+    return np.column_stack(columns)
@@ -0,0 +1,242 @@
+"""
+Jerk-limited seven-segment (S-curve) profiles.
+
+Mirrors motion/profile/jointInterpolation. A move is described by its phase
+durations (Tj, Ta, Tv): Tj is each jerk ramp, Ta the whole acceleration
+phase (two jerk ramps around a constant-acceleration stretch) and Tv the
+cruise. Deceleration mirrors acceleration, so the move lasts 2 * Ta + Tv.
+All functions broadcast over NumPy arrays of moves.
+"""
+
+import numpy as np
+
+from profileArray import timeArray
+
+
+def scurvePhases(displacement, accelLimit, veloLimit, jerkLimit):
+    """
+    Time-optimal phase durations in closed form.
+
+    Returns:
+        tuple: Three arrays (Tj, Ta, Tv)
+    """
+    d = np.abs(np.asarray(displacement, dtype=float))
+    a = np.asarray(accelLimit, dtype=float)
+    v = np.asarray(veloLimit, dtype=float)
+    j = np.asarray(jerkLimit, dtype=float)
+
+    # Phases when the velocity limit is reached
+    reachesAccel = v * j >= a**2
+    Tj = np.where(reachesAccel, a / j, np.sqrt(v / j))
+    Ta = np.where(reachesAccel, v / a + a / j, 2 * Tj)
+    Tv = d / v - Ta
+
+    # Too short to cruise: peak velocity below the limit
+    TjShort = a / j
+    TaShort = TjShort / 2 + np.sqrt(TjShort**2 / 4 + d / a)
+    jerkOnly = TaShort < 2 * TjShort
+    TjJerk = np.cbrt(d / (2 * j))
+    TjShort = np.where(jerkOnly, TjJerk, TjShort)
+    TaShort = np.where(jerkOnly, 2 * TjJerk, TaShort)
+
+    cruise = Tv >= 0
+    return (
+        np.where(cruise, Tj, TjShort),
+        np.where(cruise, Ta, TaShort),
+        np.where(cruise, Tv, 0.0),
+    )
+
+
+def scurveMotion(displacement, interval, accelLimit, veloLimit, jerkLimit):
+    """
+    Fastest jerk-limited move, the S-curve counterpart of motion().
+
+    Returns:
+        tuple: (time, phases) where time is the sample grid ending at the
+            move time and phases is the (Tj, Ta, Tv) tuple of floats
+    """
+    Tj, Ta, Tv = scurvePhases(displacement, accelLimit, veloLimit, jerkLimit)
+    phases = (float(Tj), float(Ta), float(Tv))
+    return (timeArray(2 * phases[1] + phases[2], interval), phases)
+
+
+def _accelPhase(tau, jerk, Tj, Ta, peakVelocity):
+    # Position, velocity and acceleration at tau into the acceleration phase
+    peakAccel = jerk * Tj
+    rampVelocity = 0.5 * jerk * Tj**2
+    rampPosition = jerk * Tj**3 / 6
+    untilEnd = Ta - tau
+    sinceRamp = tau - Tj
+
+    rising = tau <= Tj
+    constant = tau <= Ta - Tj
+
+    pos = np.where(
+        rising,
+        jerk * tau**3 / 6,
+        np.where(
+            constant,
+            rampPosition + rampVelocity * sinceRamp + 0.5 * peakAccel * sinceRamp**2,
+            0.5 * peakVelocity * Ta - peakVelocity * untilEnd + jerk * untilEnd**3 / 6,
+        ),
+    )
+    vel = np.where(
+        rising,
+        0.5 * jerk * tau**2,
+        np.where(
+            constant,
+            rampVelocity + peakAccel * sinceRamp,
+            peakVelocity - 0.5 * jerk * untilEnd**2,
+        ),
+    )
+    acc = np.where(rising, jerk * tau, np.where(constant, peakAccel, jerk * untilEnd))
+    return (pos, vel, acc)
+
+
+def scurveProfile(displacement, start, time, phases):
+    """
+    Evaluate an S-curve move at every time, the counterpart of profile().
+
+    Args:
+        displacement (float or array of shape (m,)): The total change in position
+        start (float or array of shape (m,)): The initial position for a move
+        time (array of shape (n,) or (m, n)): Each value of time to evaluate
+        phases (tuple): (Tj, Ta, Tv) floats or arrays of shape (m,); the
+            jerk and peak acceleration follow from them
+
+    Returns:
+        tuple: Three arrays (pos, vel, acc)
+    """
+    time = np.asarray(time, dtype=float)
+    column = lambda value: np.asarray(value, dtype=float)[..., np.newaxis]
+    d = column(displacement)
+    s = column(start)
+    Tj, Ta, Tv = (column(value) for value in phases)
+
+    sign = np.sign(d)
+    distance = np.abs(d)
+    totalTime = 2 * Ta + Tv
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        peakVelocity = np.where(Ta + Tv > 0, distance / (Ta + Tv), 0.0)
+        # Peak velocity is jerk * Tj * (Ta - Tj)
+        jerk = np.where(Tj > 0, peakVelocity / (Tj * (Ta - Tj)), 0.0)
+
+    t = np.clip(time, 0, totalTime)
+    fromEnd = totalTime - t
+
+    accelPos, accelVel, accelAcc = _accelPhase(t, jerk, Tj, Ta, peakVelocity)
+    decelPos, decelVel, decelAcc = _accelPhase(fromEnd, jerk, Tj, Ta, peakVelocity)
+
+    inAccel = t <= Ta
+    inCruise = t <= Ta + Tv
+
+    pos = np.where(
+        inAccel,
+        accelPos,
+        np.where(inCruise, 0.5 * peakVelocity * Ta + peakVelocity * (t - Ta), distance - decelPos),
+    )
+    vel = np.where(inAccel, accelVel, np.where(inCruise, peakVelocity, decelVel))
+    acc = np.where(inAccel, accelAcc, np.where(inCruise, 0.0, -decelAcc))
+
+    return (s + sign * pos, sign * vel, sign * acc)
+
+
+def stretchPhases(displacement, finalTime, accelLimit, jerkLimit):
+    """
+    Phases that take exactly finalTime at the same acceleration and jerk
+    limits, found by lowering the peak velocity (closed form).
+
+    finalTime must be at least the move's own fastest time.
+
+    Returns:
+        tuple: Three arrays (Tj, Ta, Tv)
+    """
+    d = np.abs(np.asarray(displacement, dtype=float))
+    T = np.asarray(finalTime, dtype=float)
+    a = np.asarray(accelLimit, dtype=float)
+    j = np.asarray(jerkLimit, dtype=float)
+
+    # Acceleration limit reached: d = vp * (T - a/j) - vp^2 / a
+    span = T - a / j
+    discriminant = np.maximum(span**2 - 4 * d / a, 0)
+    vpAccel = 0.5 * a * (span - np.sqrt(discriminant))
+
+    # Jerk only, u = sqrt(vp): u^3 - (T sqrt(j) / 2) u^2 + d sqrt(j) / 2 = 0
+    rootJ = np.sqrt(j)
+    b = -T * rootJ / 2
+    e = d * rootJ / 2
+    p = -(b**2) / 3
+    q = 2 * b**3 / 27 + e
+    with np.errstate(divide="ignore", invalid="ignore"):
+        angle = np.arccos(np.clip(1.5 * q / p * np.sqrt(-3 / p), -1, 1)) / 3
+    roots = np.stack(
+        [2 * np.sqrt(-p / 3) * np.cos(angle - 2 * np.pi * k / 3) - b / 3 for k in range(3)]
+    )
+    roots = np.where(roots > 0, roots, np.inf)
+    u = np.min(roots, axis=0)
+    vpJerk = np.where(np.isfinite(u), u**2, 0.0)
+
+    useAccel = vpAccel >= a**2 / j
+    vp = np.where(useAccel, vpAccel, vpJerk)
+    Tj = np.where(useAccel, a / j, np.sqrt(vp / j))
+    Ta = np.where(useAccel, vp / a + a / j, 2 * Tj)
+    Tv = np.maximum(T - 2 * Ta, 0.0)
+
+    moving = d > 0
+    return (
+        np.where(moving, Tj, 0.0),
+        np.where(moving, Ta, 0.0),
+        np.where(moving, Tv, T),
+    )
+
+
+def scurveSync(displacements, accelLimits, veloLimits, jerkLimits):
+    """
+    Synchronize any number of joints so they all finish together.
+
+    Returns:
+        tuple: (finalTime, (Tj, Ta, Tv)) with one phase entry per joint
+    """
+    Tj, Ta, Tv = scurvePhases(displacements, accelLimits, veloLimits, jerkLimits)
+    own = 2 * Ta + Tv
+    finalTime = float(np.max(own))
+
+    sTj, sTa, sTv = stretchPhases(displacements, finalTime, accelLimits, jerkLimits)
+    slower = own < finalTime
+    return (
+        finalTime,
+        (np.where(slower, sTj, Tj), np.where(slower, sTa, Ta), np.where(slower, sTv, Tv)),
+    )
+
+
+def scurveJointInterpolation(
+    displacementA,
+    startA,
+    displacementB,
+    startB,
+    interval,
+    accelLimitA,
+    veloLimitA,
+    accelLimitB,
+    veloLimitB,
+    jerkLimitA,
+    jerkLimitB,
+):
+    """
+    Coordinate two joints with S-curve profiles, the counterpart of
+    jointInterpolation().
+
+    Returns:
+        tuple: (eomA, eomB, time) where each eom is (pos, vel, acc) arrays
+    """
+    displacement = np.array([displacementA, displacementB], dtype=float)
+    finalTime, phases = scurveSync(
+        displacement,
+        [accelLimitA, accelLimitB],
+        [veloLimitA, veloLimitB],
+        [jerkLimitA, jerkLimitB],
+    )
+    time = timeArray(finalTime, interval)
+    pos, vel, acc = scurveProfile(displacement, [startA, startB], time, phases)
+    return ((pos[0], vel[0], acc[0]), (pos[1], vel[1], acc[1]), time)
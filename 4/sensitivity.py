@@ -0,0 +1,104 @@
+"""
+Closed-form sensitivities of move time to the limits and displacement.
+
+For a move of distance D = |displacement| the time motion() plans is
+
+    triangular  (D <= v^2 / a):  Tf = 2 sqrt(D / a)
+    trapezoidal (D >  v^2 / a):  Tf = D / v + v / a
+
+Both branches give 2 v / a at the switch and so do their first
+derivatives, so Tf is continuously differentiable and the gradient below is
+exact on both sides of the switch. What jumps there is the curvature (and
+Ta, whose velocity derivative changes from 0 to 1 / a); moves within
+kinkTolerance of the switch are flagged "atKink" so second-order or
+line-search methods can take care. At D = 0 the square root has a cusp and
+the displacement derivative is infinite.
+
+The synchronized time of jointInterpolation() is the largest joint time,
+so its gradient is the slowest joint's gradient. Where joints tie for
+slowest the maximum has a kink of its own; those are flagged "tied".
+"""
+
+import numpy as np
+
+KINK_TOLERANCE = 1e-9
+
+
+def moveTimeGradient(displacement, accelLimit, veloLimit, kinkTolerance=KINK_TOLERANCE):
+    """
+    Move time and its partial derivatives for a batch of moves.
+
+    Args:
+        displacement (float or array): The total change in position
+        accelLimit (float or array): The acceleration limit
+        veloLimit (float or array): The velocity limit
+        kinkTolerance (float): Relative distance from the triangular /
+            trapezoidal switch within which a move is flagged atKink
+
+    Returns:
+        dict: Arrays broadcast over the inputs: "time", "dDisplacement",
+            "dAccelLimit", "dVeloLimit", "triangular" and "atKink"
+    """
+    d = np.asarray(displacement, dtype=float)
+    a = np.asarray(accelLimit, dtype=float)
+    v = np.asarray(veloLimit, dtype=float)
+    d, a, v = np.broadcast_arrays(d, a, v)
+    D = np.abs(d)
+
+    switch = v**2 / a
+    triangular = D <= switch
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        timeTriangular = 2 * np.sqrt(D / a)
+        dDistance = np.where(
+            triangular,
+            np.where(D > 0, 1 / np.sqrt(a * D), np.inf),
+            1 / v,
+        )
+    time = np.where(triangular, timeTriangular, D / v + v / a)
+    dAccel = np.where(triangular, -time / (2 * a), -v / a**2)
+    dVelo = np.where(triangular, 0.0, 1 / a - D / v**2)
+
+    # Derivative with respect to the signed displacement
+    direction = np.where(d < 0, -1.0, 1.0)
+    return {
+        "time": time,
+        "dDisplacement": direction * dDistance,
+        "dAccelLimit": dAccel,
+        "dVeloLimit": dVelo,
+        "triangular": triangular,
+        "atKink": np.abs(D - switch) <= kinkTolerance * switch,
+    }
+
+
+def syncTimeGradient(displacements, accelLimits, veloLimits, tieTolerance=KINK_TOLERANCE):
+    """
+    Synchronized time of coordinated joints and its partial derivatives.
+
+    Args:
+        displacements (array of shape (..., joints)): Per-joint displacement,
+            leading axes index independent moves
+        accelLimits (array broadcastable to displacements): Acceleration limits
+        veloLimits (array broadcastable to displacements): Velocity limits
+        tieTolerance (float): Relative time difference within which joints
+            count as tied for slowest
+
+    Returns:
+        dict: "time" of shape (...); "dDisplacement", "dAccelLimit" and
+            "dVeloLimit" of shape (..., joints), nonzero only for the
+            slowest joint; "slowest" joint index, "tied" where more than
+            one joint is slowest, and the per-joint "joints" moveTimeGradient()
+    """
+    joints = moveTimeGradient(displacements, accelLimits, veloLimits)
+    times = joints["time"]
+    slowest = np.argmax(times, axis=-1)
+    time = np.take_along_axis(times, slowest[..., np.newaxis], axis=-1)[..., 0]
+
+    # Ties: the first slowest joint carries the gradient, a one-sided choice
+    tied = np.sum(times >= time[..., np.newaxis] * (1 - tieTolerance), axis=-1) > 1
+    active = np.arange(times.shape[-1]) == slowest[..., np.newaxis]
+
+    result = {"time": time, "slowest": slowest, "tied": tied, "joints": joints}
+    for key in ("dDisplacement", "dAccelLimit", "dVeloLimit"):
+        result[key] = np.where(active, joints[key], 0.0)
+    return result
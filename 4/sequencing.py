@@ -0,0 +1,167 @@
+"""
+Cycle-time-optimal ordering of pick-and-place targets.
+Pairwise move times come from the closed-form Tf of motion() and
+jointInterpolation(), then a nearest-neighbour tour is improved with
+2-opt and Or-opt.
+"""
+
+import numpy as np
+
+from profileArray import motionArray
+
+
+def costMatrix(targets, accelLimits, veloLimits):
+    """
+    Move time between every pair of targets, vectorized over all pairs.
+
+    Args:
+        targets (array of shape (m,) or (m, joints)): Joint positions of each
+            target; a 1D array is a single axis
+        accelLimits (float or array of shape (joints,)): Acceleration limits
+        veloLimits (float or array of shape (joints,)): Velocity limits
+
+    Returns:
+        array of shape (m, m): Synchronized move time from row to column,
+            the slowest joint's motion() Tf as in jointInterpolation()
+    """
+    targets = np.asarray(targets, dtype=float)
+    if targets.ndim == 1:
+        targets = targets[:, np.newaxis]
+
+    displacement = targets[np.newaxis, :, :] - targets[:, np.newaxis, :]
+    Tf, _ = motionArray(displacement, accelLimits, veloLimits)
+    return Tf.max(axis=2)
+
+
+def tourTime(cost, order, closed=False):
+    """Total move time visiting targets in order, optionally returning home."""
+    order = np.asarray(order)
+    total = cost[order[:-1], order[1:]].sum()
+    if closed and len(order) > 1:
+        total += cost[order[-1], order[0]]
+    return float(total)
+
+
+def nearestNeighbour(cost, start=0):
+    """Greedy tour that always moves to the quickest unvisited target."""
+    count = len(cost)
+    visited = np.zeros(count, dtype=bool)
+    order = [start]
+    visited[start] = True
+    for _ in range(count - 1):
+        times = np.where(visited, np.inf, cost[order[-1]])
+        nxt = int(np.argmin(times))
+        order.append(nxt)
+        visited[nxt] = True
+    return order
+
+
+def twoOpt(cost, order, closed=False):
+    """
+    Reverse segments while any reversal shortens the tour.
+
+    Each pass scores every reversal of order[i:j+1] at once; the first
+    target is kept fixed. Move times are symmetric so reversing a segment
+    only changes its two boundary moves.
+    """
+    order = np.array(order)
+    count = len(order)
+    if count < 4:
+        return order.tolist()
+
+    while True:
+        # Boundary moves before: (a -> b) and (c -> d); after: (a -> c), (b -> d)
+        i = np.arange(1, count - 1)[:, np.newaxis]
+        j = np.arange(1, count)[np.newaxis, :]
+        a, b, c = order[i - 1], order[i], order[j]
+        hasNext = (j + 1 < count) | closed
+        d = order[(j + 1) % count]
+
+        before = cost[a, b] + np.where(hasNext, cost[c, d], 0)
+        after = cost[a, c] + np.where(hasNext, cost[b, d], 0)
+        gain = np.where(j > i, before - after, 0)
+
+        best = np.unravel_index(np.argmax(gain), gain.shape)
+        if gain[best] <= 1e-12:
+            return order.tolist()
+        first, last = best[0] + 1, best[1] + 1
+        order[first : last + 1] = order[first : last + 1][::-1]
+
+
+def orOpt(cost, order, closed=False, segmentLengths=(1, 2, 3)):
+    """
+    Move short runs of targets to a better position until none helps.
+
+    For each run every insertion point is scored at once from the three
+    moves it removes and the three it adds. The first target is kept fixed.
+    """
+    order = np.array(order)
+    count = len(order)
+    improved = True
+    while improved:
+        improved = False
+        for length in segmentLengths:
+            for i in range(1, count - length + 1):
+                first, last = order[i], order[i + length - 1]
+                prev = order[i - 1]
+                if i + length < count:
+                    nxt = order[i + length]
+                elif closed:
+                    nxt = order[0]
+                else:
+                    nxt = None
+
+                removed = cost[prev, first]
+                if nxt is not None:
+                    removed += cost[last, nxt] - cost[prev, nxt]
+
+                # Insert between rest[k] and rest[k + 1] for k = 0..len(rest) - 1;
+                # the last slot wraps to rest[0] when closed, else appends
+                rest = np.concatenate((order[:i], order[i + length :]))
+                u = rest
+                v = np.roll(rest, -1)
+                added = cost[u, first] + cost[last, v] - cost[u, v]
+                if not closed:
+                    added[-1] = cost[u[-1], first]
+                added[i - 1] = np.inf  # Original position
+
+                k = int(np.argmin(added))
+                if added[k] < removed - 1e-12:
+                    order = np.concatenate(
+                        (rest[: k + 1], order[i : i + length], rest[k + 1 :])
+                    )
+                    improved = True
+    return order.tolist()
+
+
+def optimizeSequence(targets, accelLimits, veloLimits, start=0, closed=False):
+    """
+    Reorder targets to minimize predicted cycle time.
+
+    Args:
+        targets (array of shape (m,) or (m, joints)): Joint positions of each target
+        accelLimits (float or array of shape (joints,)): Acceleration limits
+        veloLimits (float or array of shape (joints,)): Velocity limits
+        start (int): Target the sequence must begin at
+        closed (bool): Include the move back to the first target
+
+    Returns:
+        dict: "order" and "cycleTime" for the optimized sequence, and
+            "originalCycleTime" for the file order
+    """
+    cost = costMatrix(targets, accelLimits, veloLimits)
+    count = len(cost)
+    original = list(range(count))
+
+    order = nearestNeighbour(cost, start)
+    previous = None
+    while previous != order:
+        previous = order
+        order = twoOpt(cost, order, closed)
+        order = orOpt(cost, order, closed)
+
+    return {
+        "order": order,
+        "cycleTime": tourTime(cost, order, closed),
+        "originalCycleTime": tourTime(cost, original, closed),
+    }
@@ -0,0 +1,221 @@
+"""
+Position-dependent speed zones.
+
+A zone caps the velocity while the axis is inside a position interval, e.g.
+near an operator station. Zones are indexed in a centered interval tree.
+The planner splits the path at zone boundaries, gives each piece the
+lowest cap covering it, and plans a trapezoid per piece whose entry and exit
+speeds come from a backward and forward pass, so the move only slows down
+where a zone requires it and brakes just in time to enter one.
+
+The result is a list of constant-acceleration phases. Samples are evaluated
+by locating each time's phase with a binary search, never by searching the
+zones per sample.
+"""
+
+import numpy as np
+
+from profileArray import timeArray
+
+
+class _Node:
+    __slots__ = ("center", "byLow", "byHigh", "left", "right")
+
+
+class ZoneTree:
+    """
+    Centered interval tree of velocity zones.
+
+    Args:
+        zones (list of tuples): (low, high, veloCap) position intervals,
+            closed at both ends
+
+    Raises:
+        ValueError: For an empty interval or a cap that is not positive
+    """
+
+    def __init__(self, zones):
+        self.zones = [(float(low), float(high), float(cap)) for low, high, cap in zones]
+        for low, high, cap in self.zones:
+            if not low < high:
+                raise ValueError(f"zone [{low}, {high}] is empty")
+            if not cap > 0:
+                raise ValueError(f"zone [{low}, {high}] has cap {cap}, must be positive")
+        self.root = self._build(self.zones)
+
+    def _build(self, zones):
+        if not zones:
+            return None
+        ends = sorted(end for low, high, _ in zones for end in (low, high))
+        node = _Node()
+        node.center = ends[len(ends) // 2]
+        here = [zone for zone in zones if zone[0] <= node.center <= zone[1]]
+        node.byLow = sorted(here, key=lambda zone: zone[0])
+        node.byHigh = sorted(here, key=lambda zone: zone[1], reverse=True)
+        node.left = self._build([zone for zone in zones if zone[1] < node.center])
+        node.right = self._build([zone for zone in zones if zone[0] > node.center])
+        return node
+
+    def stab(self, position):
+        """Zones containing position."""
+        found = []
+        node = self.root
+        while node is not None:
+            if position < node.center:
+                for zone in node.byLow:
+                    if zone[0] > position:
+                        break
+                    found.append(zone)
+                node = node.left
+            else:
+                for zone in node.byHigh:
+                    if zone[1] < position:
+                        break
+                    found.append(zone)
+                node = node.right
+        return found
+
+    def overlapping(self, low, high):
+        """Zones that intersect [low, high]."""
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            found.extend(zone for zone in node.byLow if zone[0] <= high and zone[1] >= low)
+            if low < node.center:
+                stack.append(node.left)
+            if high > node.center:
+                stack.append(node.right)
+        return found
+
+    def cap(self, position, default=np.inf):
+        """Lowest cap at position."""
+        return min([zone[2] for zone in self.stab(position)], default=default)
+
+
+def _segments(tree, start, displacement, veloLimit):
+    # Path split at zone boundaries: distances along the path and caps
+    end = start + displacement
+    low, high = min(start, end), max(start, end)
+    sign = 1.0 if displacement >= 0 else -1.0
+
+    boundaries = {low, high}
+    for zoneLow, zoneHigh, _ in tree.overlapping(low, high):
+        boundaries.update(edge for edge in (zoneLow, zoneHigh) if low < edge < high)
+    positions = sorted(boundaries, reverse=sign < 0)
+
+    distances = np.abs(np.array(positions) - start)
+    caps = np.array(
+        [
+            min(veloLimit, tree.cap(0.5 * (first + second), veloLimit))
+            for first, second in zip(positions[:-1], positions[1:])
+        ]
+    )
+    return (distances, caps)
+
+
+def planZoned(displacement, start, accelLimit, veloLimit, zones):
+    """
+    Fastest move that respects every zone's velocity cap.
+
+    Args:
+        displacement (float): The total change in position
+        start (float): The initial position
+        accelLimit (float): The acceleration limit
+        veloLimit (float): The velocity limit outside any zone
+        zones (ZoneTree or list of tuples): Velocity zones
+
+    Returns:
+        dict: "totalTime", the per-phase arrays "phaseTime", "phasePos",
+            "phaseVel" and "phaseAcc" (start time, position, velocity and
+            constant acceleration of each phase), the move's "start" and
+            "displacement", and "boundaries" and "caps" of the path pieces
+            in distance along the path
+    """
+    tree = zones if isinstance(zones, ZoneTree) else ZoneTree(zones)
+    sign = 1.0 if displacement >= 0 else -1.0
+    distances, caps = _segments(tree, start, displacement, veloLimit)
+    lengths = np.diff(distances)
+
+    # Speed at each piece boundary: bounded by both neighbouring caps, zero
+    # at the ends, then reachable by braking (backward) and accelerating
+    # (forward) at the acceleration limit
+    boundary = np.minimum(np.append(caps, 0.0), np.insert(caps, 0, 0.0))
+    for k in range(len(lengths) - 1, -1, -1):
+        boundary[k] = min(
+            boundary[k], np.sqrt(boundary[k + 1] ** 2 + 2 * accelLimit * lengths[k])
+        )
+    for k in range(len(lengths)):
+        boundary[k + 1] = min(
+            boundary[k + 1], np.sqrt(boundary[k] ** 2 + 2 * accelLimit * lengths[k])
+        )
+
+    phases = []
+    clock, distance = 0.0, 0.0
+    for length, cap, entry, exit in zip(lengths, caps, boundary[:-1], boundary[1:]):
+        # Trapezoid over this piece: up to peak, cruise, down to exit
+        peak = min(cap, np.sqrt(accelLimit * length + 0.5 * (entry**2 + exit**2)))
+        rising = (peak**2 - entry**2) / (2 * accelLimit)
+        falling = (peak**2 - exit**2) / (2 * accelLimit)
+        cruise = max(length - rising - falling, 0.0)
+        for duration, velocity, accel, travelled in (
+            ((peak - entry) / accelLimit, entry, accelLimit, rising),
+            (cruise / peak if peak > 0 else 0.0, peak, 0.0, cruise),
+            ((peak - exit) / accelLimit, peak, -accelLimit, falling),
+        ):
+            if duration > 1e-12:
+                phases.append((clock, distance, velocity, accel))
+                clock += duration
+                distance += travelled
+
+    phases = np.array(phases, dtype=float).reshape(-1, 4)
+    return {
+        "totalTime": clock,
+        "phaseTime": phases[:, 0],
+        "phasePos": start + sign * phases[:, 1],
+        "phaseVel": sign * phases[:, 2],
+        "phaseAcc": sign * phases[:, 3],
+        "start": float(start),
+        "displacement": float(displacement),
+        "boundaries": distances,
+        "caps": caps,
+    }
+
+
+def zonedProfile(plan, time):
+    """
+    Evaluate a planZoned() move at every time, the counterpart of profile().
+
+    Returns:
+        tuple: Three arrays (pos, vel, acc)
+    """
+    time = np.clip(np.asarray(time, dtype=float), 0, plan["totalTime"])
+    if len(plan["phaseTime"]) == 0:
+        rest = np.full(time.shape, plan["start"])
+        return (rest, np.zeros(time.shape), np.zeros(time.shape))
+
+    phase = np.searchsorted(plan["phaseTime"], time, side="right") - 1
+    dt = time - plan["phaseTime"][phase]
+    vel0, acc = plan["phaseVel"][phase], plan["phaseAcc"][phase]
+    pos = plan["phasePos"][phase] + vel0 * dt + 0.5 * acc * dt**2
+    vel = vel0 + acc * dt
+
+    # The last sample lands exactly on the target
+    end = time >= plan["totalTime"]
+    pos = np.where(end, plan["start"] + plan["displacement"], pos)
+    vel = np.where(end, 0.0, vel)
+    return (pos, vel, acc)
+
+
+def zonedMotion(displacement, start, interval, accelLimit, veloLimit, zones):
+    """
+    Sampled zoned move, the counterpart of motion() followed by profile().
+
+    Returns:
+        tuple: (time, eom, plan) where eom is (pos, vel, acc) arrays
+    """
+    plan = planZoned(displacement, start, accelLimit, veloLimit, zones)
+    time = timeArray(plan["totalTime"], interval)
+    return (time, zonedProfile(plan, time), plan)
@@ -0,0 +1,140 @@
+"""
+Parameter sweeps of move time over displacement x accel limit x velocity limit.
+The whole grid is evaluated in one broadcast motionArray() call.
+"""
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from plotStyle import AXES_BG, FIGURE_BG, MUTED, TEXT, style_axes
+from profileArray import motionArray
+
+
+def sweepGrid(displacements, accelLimits, veloLimits):
+    """
+    Evaluate every combination of displacement, accel limit and velocity limit.
+
+    Args:
+        displacements (array of shape (D,)): Move lengths
+        accelLimits (array of shape (A,)): Acceleration limits
+        veloLimits (array of shape (V,)): Velocity limits
+
+    Returns:
+        dict: The three axes plus (D, A, V) arrays "moveTime", "Ta",
+            "peakVelocity" and "triangular" (True where the profile never
+            reaches the velocity limit)
+    """
+    displacements = np.asarray(displacements, dtype=float)
+    accelLimits = np.asarray(accelLimits, dtype=float)
+    veloLimits = np.asarray(veloLimits, dtype=float)
+
+    d = np.abs(displacements)[:, np.newaxis, np.newaxis]
+    a = accelLimits[np.newaxis, :, np.newaxis]
+    v = veloLimits[np.newaxis, np.newaxis, :]
+
+    moveTime, Ta = motionArray(d, a, v)
+    triangular = d <= v**2 / a
+
+    return {
+        "displacements": displacements,
+        "accelLimits": accelLimits,
+        "veloLimits": veloLimits,
+        "moveTime": moveTime,
+        "Ta": Ta,
+        "peakVelocity": np.where(triangular, a * Ta, v),
+        "triangular": np.broadcast_to(triangular, moveTime.shape),
+    }
+
+
+def exportGrid(grid, path):
+    """
+    Save a sweep to .npz (compact, one array per field) or to CSV with one
+    row per combination.
+    """
+    if path.endswith(".npz"):
+        np.savez_compressed(path, **grid)
+        return
+
+    d, a, v = np.meshgrid(
+        grid["displacements"], grid["accelLimits"], grid["veloLimits"], indexing="ij"
+    )
+    columns = np.column_stack(
+        (
+            d.ravel(),
+            a.ravel(),
+            v.ravel(),
+            grid["moveTime"].ravel(),
+            grid["Ta"].ravel(),
+            grid["peakVelocity"].ravel(),
+            grid["triangular"].ravel(),
+        )
+    )
+    np.savetxt(
+        path,
+        columns,
+        delimiter=",",
+        fmt=["%.9g"] * 6 + ["%d"],
+        header="displacement,accelLimit,veloLimit,moveTime,Ta,peakVelocity,triangular",
+        comments="",
+    )
+
+
+def plotHeatmaps(grid, path, displacementIndices=None, cycleCounts=None):
+    """
+    Render move-time heatmaps over accel limit x velocity limit.
+
+    Args:
+        grid (dict): Output of sweepGrid()
+        path (str): Image file to write, format taken from the extension
+        displacementIndices (list of int): Displacements to plot, one panel
+            each; defaults to all of them (or a single panel for cycleCounts)
+        cycleCounts (array of shape (D,)): Moves of each displacement per
+            cycle; when given a single cycle-time panel is drawn instead
+
+    Returns:
+        Figure: The rendered figure
+    """
+    if cycleCounts is not None:
+        weights = np.asarray(cycleCounts, dtype=float)[:, np.newaxis, np.newaxis]
+        panels = [("Cycle Time (s)", (grid["moveTime"] * weights).sum(axis=0), None)]
+    else:
+        if displacementIndices is None:
+            displacementIndices = range(len(grid["displacements"]))
+        panels = [
+            (
+                f"Move Time (s), d = {grid['displacements'][i]:g}",
+                grid["moveTime"][i],
+                grid["triangular"][i],
+            )
+            for i in displacementIndices
+        ]
+
+    fig = Figure(figsize=(6, 4.5 * len(panels)), facecolor=FIGURE_BG)
+    FigureCanvasAgg(fig)
+
+    for k, (title, values, triangular) in enumerate(panels):
+        ax = fig.add_subplot(len(panels), 1, k + 1, facecolor=AXES_BG)
+        # Cells centred on the true sweep values, which need not be evenly
+        # spaced (e.g. geomspace), so the contour below lines up with them
+        image = ax.pcolormesh(
+            grid["veloLimits"], grid["accelLimits"], values, shading="nearest", cmap="viridis"
+        )
+        if triangular is not None and triangular.any() and not triangular.all():
+            # Boundary between the triangular and trapezoidal regimes
+            ax.contour(
+                grid["veloLimits"],
+                grid["accelLimits"],
+                triangular.astype(float),
+                levels=[0.5],
+                colors=TEXT,
+                linewidths=1,
+            )
+        style_axes(ax, title, "Acceleration Limit")
+        ax.set_xlabel("Velocity Limit", color=MUTED, fontsize=9)
+        colorbar = fig.colorbar(image, ax=ax)
+        colorbar.ax.tick_params(colors=MUTED, labelsize=8)
+
+    fig.tight_layout()
+    fig.savefig(path, facecolor=FIGURE_BG)
+    return fig
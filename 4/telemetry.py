@@ -0,0 +1,237 @@
+"""
+Live setpoint telemetry for index.html over server-sent events.
+
+Executed setpoints are published to a TelemetryHub in batches. Each batch is
+packed once into a compact binary frame, base64 encoded and fanned out to
+every connected browser on GET /stream as an "event: setpoints" message.
+Slow clients have a bounded backlog and lose their oldest batches rather
+than growing server memory.
+
+Batch layout, little-endian: uint32 sequence, uint32 joints, float64 base
+time, then float32 rows of (t - base, pos, vel, acc per joint).
+
+    python telemetry.py   # serve index.html and stream demo moves
+"""
+
+import base64
+import os
+import struct
+import threading
+import time as clock
+from collections import deque
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from ringBuffer import framesFromEoms
+
+HEADER = struct.Struct("<IId")
+DEFAULT_PORT = 8765
+DEFAULT_BACKLOG = 64
+KEEPALIVE = 15.0
+
+
+def packBatch(sequence, frames):
+    """
+    Binary batch for rows of t followed by pos/vel/acc per joint.
+
+    Times are sent relative to the first row so float32 keeps sub-millisecond
+    resolution however long the session runs.
+    """
+    frames = np.asarray(frames, dtype=float)
+    joints = (frames.shape[1] - 1) // 3
+    base = float(frames[0, 0])
+    rows = frames.astype("<f4")
+    rows[:, 0] = frames[:, 0] - base
+    return HEADER.pack(sequence, joints, base) + rows.tobytes()
+
+
+def unpackBatch(payload):
+    """Inverse of packBatch(): (sequence, frames) with absolute times."""
+    sequence, joints, base = HEADER.unpack_from(payload)
+    rows = np.frombuffer(payload, dtype="<f4", offset=HEADER.size)
+    frames = rows.reshape(-1, 1 + 3 * joints).astype(float)
+    frames[:, 0] += base
+    return (sequence, frames)
+
+
+class _Subscriber:
+    def __init__(self, backlog):
+        self.messages = deque(maxlen=backlog)
+        self.ready = threading.Condition()
+        self.dropped = 0
+
+    def put(self, message):
+        with self.ready:
+            if len(self.messages) == self.messages.maxlen:
+                self.dropped += 1
+            self.messages.append(message)
+            self.ready.notify()
+
+    def get(self, timeout=None):
+        """Next message, or None if nothing arrived within timeout."""
+        with self.ready:
+            if not self.messages:
+                self.ready.wait(timeout)
+            return self.messages.popleft() if self.messages else None
+
+
+class TelemetryHub:
+    """
+    Fan-out of setpoint batches to any number of stream subscribers.
+
+    Args:
+        backlog (int): Batches kept per subscriber before the oldest is dropped
+    """
+
+    def __init__(self, backlog=DEFAULT_BACKLOG):
+        self.backlog = backlog
+        self.sequence = 0
+        self.clock = 0.0
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        subscriber = _Subscriber(self.backlog)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    @property
+    def subscribers(self):
+        return len(self._subscribers)
+
+    def publish(self, frames):
+        """Pack one batch of frame rows and queue it for every subscriber."""
+        message = base64.b64encode(packBatch(self.sequence, frames)).decode("ascii")
+        self.sequence += 1
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.put(message)
+        return message
+
+
+def streamMove(hub, time, *eoms, batchSize=10, speed=1.0, realTime=True):
+    """
+    Publish one executed move in batches, paced to wall-clock time.
+
+    Moves are laid end to end on the hub's session clock, so successive moves
+    continue the same time axis in the browser.
+
+    Args:
+        hub (TelemetryHub): Where to publish
+        time (list or array): Sample times of the move
+        *eoms (tuples): (pos, vel, acc) per joint, e.g. from jointInterpolation()
+        batchSize (int): Samples per published batch
+        speed (float): Playback speed relative to real time
+        realTime (bool): Sleep until each batch's last sample is due
+
+    Returns:
+        float: Session time at the end of the move
+    """
+    frames = framesFromEoms(time, *eoms)
+    frames[:, 0] += hub.clock
+    started = clock.monotonic()
+    for first in range(0, len(frames), batchSize):
+        batch = frames[first : first + batchSize]
+        if realTime:
+            due = started + (batch[-1, 0] - frames[0, 0]) / speed
+            delay = due - clock.monotonic()
+            if delay > 0:
+                clock.sleep(delay)
+        hub.publish(batch)
+    hub.clock = float(frames[-1, 0])
+    return hub.clock
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=os.path.dirname(os.path.abspath(__file__)), **kwargs)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/stream":
+            return super().do_GET()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        hub = self.server.hub
+        subscriber = hub.subscribe()
+        try:
+            self.wfile.write(b"retry: 1000\n\n")
+            self.wfile.flush()
+            while not self.server.stopping.is_set():
+                message = subscriber.get(timeout=self.server.keepalive)
+                if message is None:
+                    self.wfile.write(b": keepalive\n\n")
+                else:
+                    self.wfile.write(f"event: setpoints\ndata: {message}\n\n".encode("ascii"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            hub.unsubscribe(subscriber)
+
+
+class TelemetryServer(ThreadingHTTPServer):
+    """
+    HTTP server for index.html and its /stream endpoint.
+
+    Args:
+        hub (TelemetryHub): Source of setpoint batches
+        address (tuple): (host, port); port 0 picks a free one
+        keepalive (float): Seconds between comments on an idle stream
+    """
+
+    daemon_threads = True
+
+    def __init__(self, hub, address=("127.0.0.1", DEFAULT_PORT), keepalive=KEEPALIVE):
+        self.hub = hub
+        self.keepalive = keepalive
+        self.stopping = threading.Event()
+        super().__init__(address, _Handler)
+
+    def start(self):
+        """Serve on a background thread."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self.stopping.set()
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    from jointInterpolation import jointInterpolation
+
+    hub = TelemetryHub()
+    server = TelemetryServer(hub)
+    server.start()
+    print(f"Open http://127.0.0.1:{DEFAULT_PORT}/index.html and the Live tab")
+
+    moves = [(100, 0, 50, 0), (-60, 100, 30, 50), (-40, 40, -80, 80)]
+    try:
+        while True:
+            for displacementA, startA, displacementB, startB in moves:
+                eoma, eomb, t = jointInterpolation(
+                    displacementA, startA, displacementB, startB, 0.01, 100, 200, 80, 150
+                )
+                streamMove(hub, t, eoma, eomb)
+                clock.sleep(0.5)
+                hub.clock += 0.5
+    except KeyboardInterrupt:
+        server.stop()
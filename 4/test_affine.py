@@ -0,0 +1,93 @@
+import numpy as np
+
+from affine import AffineTrajectory
+from motion import motion
+from trajectory import profile
+
+
+def test_start_offset_matches_profile():
+    """Test that shifting the start matches a full profile call"""
+    base = AffineTrajectory.plan(100, 0, 0.1, 50, 100)
+    pos, vel, acc, t = base.evaluate(start=25)
+
+    ref_t, ta = motion(100, 0.1, 50, 100)
+    ref = profile(100, 25, ref_t, ta)
+
+    assert np.allclose(pos, ref[0])
+    assert np.allclose(vel, ref[1])
+    assert vel is base.vel, "Velocity should be the cached array"
+    print("✓ Start offset matches profile")
+
+
+def test_reverse_move_reuses_timing():
+    """Test that reversing the move scales without a replan"""
+    base = AffineTrajectory.plan(100, 0, 0.1, 50, 100)
+    assert not base.requiresReplan(-100)
+
+    pos, vel, acc, t = base.evaluate(start=100, displacement=-100)
+    assert abs(pos[-1]) < 1e-9, "Reverse move should end at 0"
+    assert np.allclose(vel, -base.vel)
+    print("✓ Reverse move reuses timing")
+
+
+def test_new_length_replans():
+    """Test that a different move length triggers a full replan"""
+    base = AffineTrajectory.plan(100, 0, 0.1, 50, 100)
+    assert base.requiresReplan(300)
+
+    pos, vel, acc, t = base.evaluate(displacement=300)
+    ref_t, ta = motion(300, 0.1, 50, 100)
+    assert abs(t[-1] - ref_t[-1]) < 1e-9
+    assert max(abs(v) for v in vel) <= 100 + 1e-9
+    print(f"✓ Replan: tf={t[-1]:.2f}")
+
+
+def test_constructed_base_replans():
+    """Test a limit-planned base built through the constructor"""
+    ref_t, ta = motion(100, 0.1, 50, 100)
+    base = AffineTrajectory(100, 0, ref_t, ta, 50, 100)
+    assert abs(base.interval - 0.1) < 1e-12
+
+    pos, vel, acc, t = base.evaluate(displacement=200)
+    expected_t, _ = motion(200, 0.1, 50, 100)
+    assert abs(t[-1] - expected_t[-1]) < 1e-9 and abs(pos[-1] - 200) < 1e-9
+
+    single = AffineTrajectory(100, 0, [0.0], ta, 50, 100)
+    try:
+        single.evaluate(displacement=200)
+        assert False, "Replan without an interval should fail"
+    except ValueError:
+        pass
+    print("✓ Constructed base replans")
+
+
+def test_hand_timed_base_scales():
+    """Test that a hand-timed profile is linear in displacement"""
+    t = [0, 0.5, 1, 1.5, 2]
+    base = AffineTrajectory(100, 0, t, 0.5)
+    pos, vel, acc, _ = base.evaluate(start=10, displacement=40)
+
+    ref = profile(40, 10, t, 0.5)
+    assert np.allclose(pos, ref[0]) and np.allclose(acc, ref[2])
+    print("✓ Hand-timed base scales")
+
+
+def test_many_starts():
+    """Test evaluating one move from many pallet slots at once"""
+    base = AffineTrajectory.plan(50, 0, 0.05, 50, 100)
+    pos, vel, acc, t = base.evaluateStarts([0, 10, 20])
+
+    assert pos.shape == (3, len(t))
+    assert np.allclose(pos[2] - pos[0], 20)
+    assert vel.shape == pos.shape and vel.strides[0] == 0
+    print("✓ Many starts")
+
+
+if __name__ == "__main__":
+    test_start_offset_matches_profile()
+    test_reverse_move_reuses_timing()
+    test_new_length_replans()
+    test_constructed_base_replans()
+    test_hand_timed_base_scales()
+    test_many_starts()
+    print("\n✅ All affine tests passed!")
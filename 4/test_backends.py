@@ -0,0 +1,114 @@
+import numpy as np
+
+import backends
+from jointInterpolation import jointInterpolation
+from motion import motion
+from trajectory import profile
+
+
+def test_backends_agree():
+    """Test every backend against the reference implementation"""
+    t, ta = motion(100, 0.01, 50, 100)
+    ref = profile(100, 5, t, ta)
+    ref_joint = jointInterpolation(100, 0, 50, 10, 0.01, 100, 200, 80, 150)
+
+    for name in ("python", "MotionProfiles", "numpy", "chunked"):
+        # MotionProfiles rounds the grid up to a whole interval
+        tol = 0.01 if name == "MotionProfiles" else 1e-9
+        bt, bta = backends.motion(100, 0.01, 50, 100, backend=name)
+        assert abs(bt[-1] - t[-1]) < tol and abs(bta - ta) < 1e-9
+        assert np.allclose(backends.profile(100, 5, t, ta, backend=name), ref)
+
+        eoma, eomb, jt = backends.jointInterpolation(
+            100, 0, 50, 10, 0.01, 100, 200, 80, 150, backend=name
+        )
+        assert abs(jt[-1] - ref_joint[2][-1]) < tol
+        assert abs(eomb[0][-1] - 60) < 1e-6
+        if name != "MotionProfiles":  # Uses its own synchronization rule
+            assert np.allclose(eomb, ref_joint[1])
+    print("✓ Backends agree")
+
+
+def test_results_do_not_depend_on_backend():
+    """Test that the facade returns the same arrays whichever backend serves"""
+    # Tf = 1.0 is a multiple of 0.1, where motion()'s accumulated grid keeps
+    # an extra sample at 0.9999999999999999
+    reference, _ = motion(12.5, 0.1, 50, 100)
+    ref_joint = jointInterpolation(12.5, 0, 5, 0, 0.1, 50, 100, 50, 100)
+    for name in ("python", "numpy", "chunked"):
+        t, ta = backends.motion(12.5, 0.1, 50, 100, backend=name)
+        assert isinstance(t, np.ndarray) and t.dtype == float
+        assert np.array_equal(t, reference), name
+
+        pos, vel, acc = backends.profile(12.5, 0, t, ta, backend=name)
+        assert all(isinstance(values, np.ndarray) for values in (pos, vel, acc))
+
+        eoma, eomb, jt = backends.jointInterpolation(
+            12.5, 0, 5, 0, 0.1, 50, 100, 50, 100, backend=name
+        )
+        assert isinstance(eoma[0], np.ndarray) and np.array_equal(jt, ref_joint[2]), name
+        assert np.allclose(eomb, ref_joint[1])
+
+    # Automatic dispatch at any size gives arrays too
+    for interval in (0.1, 1e-4):
+        t, _ = backends.motion(100, interval, 50, 100)
+        assert np.array_equal(t, motion(100, interval, 50, 100)[0])
+    print("✓ Results do not depend on backend")
+
+
+def test_motion_grid_matches_motion():
+    """Test the accumulated grid against motion() for many moves"""
+    rng = np.random.default_rng(5)
+    for d, a, v, interval in zip(
+        rng.uniform(-300, 300, 300),
+        rng.uniform(1, 100, 300),
+        rng.uniform(1, 100, 300),
+        rng.choice([0.1, 0.05, 0.01, 0.003], 300),
+    ):
+        t, ta = motion(d, interval, a, v)
+        grid = backends.motionGrid(t[-1], interval)
+        assert np.array_equal(grid, t)
+    print("✓ Motion grid matches motion()")
+
+
+def test_chunked_profile_blocks():
+    """Test that the chunked backend fills outputs across many blocks"""
+    backend = backends.ChunkedBackend(blockSize=7)
+    t = np.linspace(0, 2, 100)
+    expected = backends.BACKENDS["numpy"].profile([100, -50], 0, t, 0.5)
+    assert np.allclose(backend.profile([100, -50], 0, t, 0.5), expected)
+    print("✓ Chunked profile blocks")
+
+
+def test_automatic_dispatch_by_size():
+    """Test that dispatch moves from python to numpy to chunked with size"""
+    crossover = backends.calibrate()
+    assert backends.chooseBackend(1) == "python" or crossover <= 1
+    assert backends.chooseBackend(crossover) == "numpy"
+    assert backends.chooseBackend(backends.CHUNKED_SAMPLES) == "chunked"
+    print(f"✓ Automatic dispatch, crossover at {crossover} samples")
+
+
+def test_override_and_report():
+    """Test global override and the dispatch report"""
+    backends.setBackend("numpy")
+    try:
+        backends.motion(100, 0.1, 50, 100)
+    finally:
+        backends.setBackend(None)
+    backends.profile(100, 0, [0, 1, 2], 0.5, backend="python")
+
+    calls = backends.dispatchReport()["calls"]
+    assert calls[-2][:2] == ("motion", "numpy")
+    assert calls[-1][:2] == ("profile", "python")
+    print("✓ Override and report")
+
+
+if __name__ == "__main__":
+    test_backends_agree()
+    test_results_do_not_depend_on_backend()
+    test_motion_grid_matches_motion()
+    test_chunked_profile_blocks()
+    test_automatic_dispatch_by_size()
+    test_override_and_report()
+    print("\n✅ All backend tests passed!")
@@ -0,0 +1,87 @@
+import numpy as np
+
+import cartesian
+from cartesian import cartesianInterpolation, forwardKinematics, inverseKinematics
+
+
+def test_ik_round_trip():
+    """Test that IK inverts FK on both elbow branches"""
+    theta1 = np.linspace(-1, 1, 7)
+    theta2 = np.linspace(0.3, 2.5, 7)
+    x, y = forwardKinematics(theta1, theta2, 1.0, 0.8)
+
+    t1, t2, ok = inverseKinematics(x, y, 1.0, 0.8)
+    assert ok.all() and np.allclose(t1, theta1) and np.allclose(t2, theta2)
+
+    t1, t2, ok = inverseKinematics(x, y, 1.0, 0.8, elbowUp=True)
+    assert np.allclose(forwardKinematics(t1, t2, 1.0, 0.8), (x, y))
+    print("✓ IK round trip")
+
+
+def test_tool_follows_line():
+    """Test that the tool stays on the straight line and hits the endpoints"""
+    eoma, eomb, t, report = cartesianInterpolation(
+        1.2, 0.2, 0.4, 1.1, 0.01, 2, 1, 1.0, 0.8, (20, 20), (5, 5)
+    )
+    x, y = forwardKinematics(eoma[0], eomb[0], 1.0, 0.8)
+
+    # Cross product with the direction vector is zero on the line
+    assert np.allclose((x - 1.2) * 0.9 - (y - 0.2) * -0.8, 0)
+    assert np.allclose([x[-1], y[-1]], [0.4, 1.1])
+    assert report["ok"], report
+    print(f"✓ Tool follows line: tf={t[-1]:.2f}")
+
+
+def test_joint_rates_match_finite_difference():
+    """Test the Jacobian velocities against differentiated joint angles"""
+    eoma, eomb, t, report = cartesianInterpolation(
+        1.2, 0.2, 0.4, 1.1, 0.001, 2, 1, 1.0, 0.8, (20, 20), (5, 5)
+    )
+    fd = np.gradient(eoma[0], t)
+    assert np.allclose(fd[1:-1], eoma[1][1:-1], atol=1e-2)
+    print("✓ Joint rates match finite difference")
+
+
+def test_joint_limit_reported():
+    """Test that tight joint limits are reported with a time scale"""
+    eoma, eomb, t, report = cartesianInterpolation(
+        1.2, 0.2, 0.4, 1.1, 0.01, 2, 1, 1.0, 0.8, (0.5, 0.5), (0.2, 0.2)
+    )
+    assert not report["ok"]
+    assert report["timeScale"] > 1
+    print(f"✓ Joint limit reported: timeScale={report['timeScale']:.2f}")
+
+
+def test_unreachable_reported():
+    """Test that a path leaving the workspace is flagged"""
+    eoma, eomb, t, report = cartesianInterpolation(
+        1.5, 0, 3, 0, 0.01, 2, 1, 1.0, 0.8, (20, 20), (5, 5)
+    )
+    assert not report["reachable"] and not report["ok"]
+    print("✓ Unreachable path reported")
+
+
+def test_negative_x_crossing_is_continuous(monkeypatch):
+    """Test that a line crossing the -x axis keeps the joint angles continuous"""
+    args = (-1, 0.5, -1, -0.5, 0.01, 2, 1, 1.0, 0.8, (20, 20), (5, 5))
+    eoma, eomb, t, report = cartesianInterpolation(*args)
+    steps = np.abs(np.diff([eoma[0], eomb[0]], axis=1))
+    assert steps.max() < 0.02, "No 2 pi jump between ticks"
+    assert np.allclose(np.diff(eoma[0]) / np.diff(t), eoma[1][1:], atol=0.05)
+    assert report["ok"]
+
+    # Without unwrapping the jump is caught by the joint-rate check
+    monkeypatch.setattr(cartesian, "unwrapPath", lambda theta: theta)
+    eoma, eomb, t, report = cartesianInterpolation(*args)
+    assert np.abs(np.diff(eoma[0])).max() > 6
+    assert report["peakJointVelocity"][0] > 600 and not report["ok"]
+    print("✓ -x crossing is continuous")
+
+
+if __name__ == "__main__":
+    test_ik_round_trip()
+    test_tool_follows_line()
+    test_joint_rates_match_finite_difference()
+    test_joint_limit_reported()
+    test_unreachable_reported()
+    print("\n✅ All cartesian tests passed!")
@@ -0,0 +1,75 @@
+import io
+
+import numpy as np
+
+from chunked import blockSizeFor, jointBlocks, motionBlocks, reduceBlocks, timeBlocks, writeBlocks
+from jointInterpolation import jointInterpolation
+from motion import motion
+from profileArray import timeArray
+from trajectory import profile
+
+
+def test_blocks_match_profile():
+    """Test that concatenated blocks reproduce motion/profile"""
+    t, ta = motion(100, 0.01, 50, 100)
+    pos, vel, acc = profile(100, 5, t, ta)
+
+    blocks = list(motionBlocks(100, 5, 0.01, 50, 100, blockSize=64))
+    assert all(len(b[0]) <= 64 for b in blocks), "Blocks respect blockSize"
+
+    bt, bpos, bvel, bacc = (np.concatenate([b[k] for b in blocks]) for k in range(4))
+    assert len(bt) == len(t)
+    assert np.allclose(bt, t) and np.allclose(bpos, pos) and np.allclose(bvel, vel)
+    print(f"✓ Blocks match profile: {len(blocks)} blocks")
+
+
+def test_blocks_equal_time_array():
+    """Test that concatenated time blocks are exactly timeArray(), closing sample included"""
+    rng = np.random.default_rng(1)
+    cases = [(14.363999999999999, 0.003), (1.0, 0.1), (0.0, 0.01)]
+    cases += zip(np.round(rng.uniform(0.1, 20, 200), 3), rng.choice([0.001, 0.003, 0.007], 200))
+    for finalTime, interval in cases:
+        for blockSize in (7, 64, 4096):
+            blocks = np.concatenate(list(timeBlocks(finalTime, interval, blockSize)))
+            assert np.array_equal(blocks, timeArray(finalTime, interval))
+    print("✓ Blocks equal timeArray")
+
+
+def test_memory_budget():
+    """Test that maxBytes bounds the block size"""
+    budget = 1 << 16
+    blocks = motionBlocks(1000, 0, 1e-4, 50, 100, maxBytes=budget)
+    assert all(len(b[0]) <= blockSizeFor(budget) for b in blocks)
+    print(f"✓ Memory budget: {blockSizeFor(budget)} samples per block")
+
+
+def test_reduce_and_write():
+    """Test streaming blocks into a reducer and a file writer"""
+    summary = reduceBlocks(motionBlocks(100, 0, 0.001, 50, 100, blockSize=500))
+    assert abs(summary["finalPosition"] - 100) < 1e-9
+    assert summary["maxVelocity"] <= 100 + 1e-9
+
+    buffer = io.BytesIO()
+    count = writeBlocks(motionBlocks(100, 0, 0.001, 50, 100, blockSize=500), buffer)
+    rows = np.frombuffer(buffer.getvalue()).reshape(-1, 4)
+    assert count == summary["samples"] == len(rows)
+    print(f"✓ Reduce and write: {count} samples")
+
+
+def test_joint_blocks():
+    """Test that joint blocks reproduce jointInterpolation"""
+    eoma, eomb, t = jointInterpolation(100, 0, 50, 10, 0.01, 100, 200, 80, 150)
+    blocks = list(jointBlocks(100, 0, 50, 10, 0.01, 100, 200, 80, 150, blockSize=32))
+    posB = np.concatenate([b[2][0] for b in blocks])
+
+    assert np.allclose(posB, eomb[0])
+    print("✓ Joint blocks")
+
+
+if __name__ == "__main__":
+    test_blocks_match_profile()
+    test_blocks_equal_time_array()
+    test_memory_budget()
+    test_reduce_and_write()
+    test_joint_blocks()
+    print("\n✅ All chunked tests passed!")
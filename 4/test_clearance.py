@@ -0,0 +1,101 @@
+import numpy as np
+
+from clearance import armClearance, checkInterference, segmentDistance, sweptMove
+from jointInterpolation import jointInterpolation
+
+ARM_A = {"base": (0.0, 0.0), "link1": 1.0, "link2": 0.8, "radius": 0.05}
+ARM_B = {"base": (2.5, 0.0), "link1": 1.0, "link2": 0.8, "radius": 0.05}
+
+
+def _move(arm, startTime, theta1, displacement1, theta2, displacement2, interval=0.002):
+    eoma, eomb, t = jointInterpolation(
+        displacement1, theta1, displacement2, theta2, interval, 4, 2, 4, 2
+    )
+    return sweptMove(arm, startTime, t, eoma[0], eomb[0])
+
+
+def test_segment_distance():
+    """Test parallel, crossing and end-to-end segments"""
+    p0 = np.array([[0, 0], [0, 0], [0, 0]], dtype=float)
+    p1 = np.array([[1, 0], [1, 1], [1, 0]], dtype=float)
+    q0 = np.array([[0, 1], [0, 1], [2, 0]], dtype=float)
+    q1 = np.array([[1, 1], [1, 0], [3, 0]], dtype=float)
+    assert np.allclose(segmentDistance(p0, p1, q0, q1), [1, 0, 1])
+    print("✓ Segment distance")
+
+
+def test_reaching_arms_conflict():
+    """Test that arms reaching towards each other match a brute-force check"""
+    moveA = _move(ARM_A, 0.0, np.pi / 2, -np.pi / 2, 0.0, 0.1)
+    moveB = _move(ARM_B, 0.3, np.pi / 2, np.pi / 2, 0.0, -0.1)
+    (report,) = checkInterference([moveA], [moveB], clearance=0.1, parked=False)
+
+    # Brute force on moveA's samples within the shared window
+    time = moveA["time"][(moveA["time"] >= report["start"]) & (moveA["time"] <= report["end"])]
+    points = [
+        sweptMove(
+            move["arm"],
+            0,
+            time,
+            np.interp(time, move["time"], move["theta1"]),
+            np.interp(time, move["time"], move["theta2"]),
+        )["points"]
+        for move in (moveA, moveB)
+    ]
+    gap = armClearance(points[0], 0.05, points[1], 0.05)
+
+    assert report["firstConflict"] is not None and report["exact"]
+    assert 0 < report["checked"] < len(time)
+    assert abs(report["firstConflict"] - time[np.argmax(gap < 0.1)]) < 0.01
+    assert report["minClearance"] < 0 and abs(report["minClearance"] - gap.min()) < 1e-3
+    print(
+        f"✓ First conflict at {report['firstConflict']:.3f}s, "
+        f"clearance {report['minClearance']:.3f}"
+    )
+
+
+def test_pruning():
+    """Test time-window and bounding-box pruning"""
+    early = _move(ARM_A, 0.0, np.pi / 2, -np.pi / 2, 0.0, 0.1)
+    late = _move(ARM_B, 10.0, np.pi / 2, np.pi / 2, 0.0, -0.1)
+    assert checkInterference([early], [late], parked=False) == []
+
+    # Both arms folded upwards never come near each other
+    away = _move(ARM_A, 0.0, np.pi / 2, 0.5, 0.0, 0.5)
+    other = _move(ARM_B, 0.0, np.pi / 2, 0.2, 0.0, -0.3)
+    (report,) = checkInterference([away], [other], clearance=0.1, parked=False)
+    assert report["firstConflict"] is None and report["minClearance"] > 0.1
+    assert report["checked"] < len(away["time"])
+    print(f"✓ Pruned pair with clearance >= {report['minClearance']:.3f}")
+
+
+def test_schedule_pairs():
+    """Test that only concurrent move pairs are reported"""
+    movesA = [_move(ARM_A, start, np.pi / 2, 0.1, 0.0, 0.1) for start in (0, 5, 10)]
+    movesB = [_move(ARM_B, start, np.pi / 2, 0.1, 0.0, 0.1) for start in (10.1, 0.1, 20)]
+    pairs = [(r["a"], r["b"]) for r in checkInterference(movesA, movesB, parked=False)]
+    assert pairs == [(0, 1), (2, 0)]
+    print("✓ Schedule pairs")
+
+
+def test_parked_arm_is_checked():
+    """Test an arm parked after its move against the other arm sweeping into it"""
+    reach = _move(ARM_A, 0.0, np.pi / 2, -np.pi / 2, 0.0, 0.1)
+    sweep = _move(ARM_B, reach["endTime"] + 1.0, np.pi / 2, np.pi / 2, 0.0, 0.1)
+    assert checkInterference([reach], [sweep], parked=False) == []
+
+    reports = checkInterference([reach], [sweep], clearance=0.1)
+    (report,) = [r for r in reports if r["firstConflict"] is not None]
+    assert report["parkedA"] and not report["parkedB"] and (report["a"], report["b"]) == (0, 0)
+    assert report["start"] == sweep["startTime"] and report["minClearance"] < 0
+    assert all(r["parkedA"] or r["parkedB"] for r in reports)
+    print(f"✓ Parked arm hit at {report['firstConflict']:.3f}s")
+
+
+if __name__ == "__main__":
+    test_segment_distance()
+    test_reaching_arms_conflict()
+    test_pruning()
+    test_schedule_pairs()
+    test_parked_arm_is_checked()
+    print("\n✅ All clearance tests passed!")
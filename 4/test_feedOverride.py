@@ -0,0 +1,99 @@
+import numpy as np
+
+from feedOverride import RetimedTrajectory, sample
+from motion import motion
+from profileArray import motionArray
+from trajectory import profile
+
+
+def _run(trajectory, dt, overrides):
+    ticks = []
+    step = 0
+    while not trajectory.done and step < 100000:
+        if step in overrides:
+            trajectory.setOverride(overrides[step])
+        ticks.append(trajectory.tick(dt))
+        step += 1
+    return ticks
+
+
+def test_sample_matches_profile():
+    """Test single-time evaluation against profile()"""
+    t, ta = motion(100, 0.1, 50, 100)
+    pos, vel, acc = profile(100, 5, t, ta)
+    for k in range(len(t)):
+        assert np.allclose(sample(100, 5, ta, t[-1], t[k]), (pos[k], vel[k], acc[k]))
+    print("✓ Sample matches profile")
+
+
+def test_full_speed_is_unchanged():
+    """Test that 100% override reproduces the planned move time"""
+    trajectory = RetimedTrajectory.fromMotion(100, 0, 50, 100)
+    ticks = _run(trajectory, 0.001, {})
+    assert abs(len(ticks) * 0.001 - trajectory.totalTime) < 0.002
+    print(f"✓ Full speed: {len(ticks)} ticks")
+
+
+def test_override_stays_within_limits():
+    """Test slowing down and speeding up mid-move within the original limits"""
+    trajectory = RetimedTrajectory.fromMotion(100, 0, 50, 100, transitionTime=0.05)
+    dt = 0.001
+    ticks = _run(trajectory, dt, {300: 25, 2500: 100, 4000: 10, 4300: 80})
+
+    pos = np.array([setpoints[0][0] for _, _, setpoints in ticks])
+    vel = np.array([setpoints[0][1] for _, _, setpoints in ticks])
+    acc = np.array([setpoints[0][2] for _, _, setpoints in ticks])
+    assert abs(pos[-1] - 100) < 1e-9
+    assert np.abs(vel).max() <= 100 + 1e-9
+    assert np.abs(acc).max() <= 50 + 1e-6
+    assert len(ticks) * dt > trajectory.totalTime * 1.5, "Override should slow the move"
+    # Reported velocity is consistent with the position it produces
+    assert np.allclose(np.diff(pos) / dt, 0.5 * (vel[1:] + vel[:-1]), atol=0.05)
+    print(f"✓ Override within limits: {len(ticks) * dt:.2f}s vs {trajectory.totalTime:.2f}s")
+
+
+def test_override_changes_across_phases():
+    """Test override changes swept across the phase boundaries stay within the limits"""
+    for first in range(1000, 2000, 50):
+        trajectory = RetimedTrajectory.fromMotion(100, 0, 50, 100)
+        ticks = _run(trajectory, 0.001, {first: 10, first + 300: 100})
+        acc = np.array([setpoints[0][2] for _, _, setpoints in ticks])
+        assert np.abs(acc).max() <= 50 + 1e-9, f"Switching at tick {first}"
+
+    for first in range(0, 3000, 150):
+        trajectory = RetimedTrajectory.fromJoints([100, -40, 70], [0, 0, 0], [60, 90, 30], [80, 50, 120])
+        ticks = _run(trajectory, 0.001, {first: 10, first + 200: 100, first + 900: 35})
+        acc = np.array([[axis[2] for axis in setpoints] for _, _, setpoints in ticks])
+        assert np.all(np.abs(acc) <= np.array([60, 90, 30]) + 1e-9), f"Switching at tick {first}"
+    print("✓ Override changes across phases")
+
+
+def test_velocity_limit_caps_scale():
+    """Test that a plan faster than its velocity limit is slowed to fit"""
+    # Planned for a 100 limit, retimed under 40
+    Tf, Ta = motionArray(100, 50, 100)
+    trajectory = RetimedTrajectory([100], [0], [float(Ta)], float(Tf), [50], [40])
+    ticks = _run(trajectory, 0.001, {500: 100})
+    vel = np.array([setpoints[0][1] for _, _, setpoints in ticks])
+    assert np.abs(vel).max() <= 40 + 1e-9 and abs(ticks[-1][2][0][0] - 100) < 1e-9
+    assert RetimedTrajectory.fromMotion(100, 0, 50, 100).maxScale == 1.0
+    print("✓ Velocity limit caps scale")
+
+
+def test_joints_retimed_together():
+    """Test that synchronized joints stay synchronized under override"""
+    trajectory = RetimedTrajectory.fromJoints([100, 50], [0, 10], [100, 80], [200, 150])
+    ticks = _run(trajectory, 0.001, {100: 30})
+    tau, scale, setpoints = ticks[-1]
+    assert abs(setpoints[0][0] - 100) < 1e-9 and abs(setpoints[1][0] - 60) < 1e-9
+    print("✓ Joints retimed together")
+
+
+if __name__ == "__main__":
+    test_sample_matches_profile()
+    test_full_speed_is_unchanged()
+    test_override_stays_within_limits()
+    test_override_changes_across_phases()
+    test_velocity_limit_caps_scale()
+    test_joints_retimed_together()
+    print("\n✅ All feed override tests passed!")
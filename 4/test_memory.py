@@ -0,0 +1,24 @@
+from memoryBench import loadBaseline, regressions, run, summarize
+
+
+def test_no_memory_regressions():
+    """Test bytes-per-sample against memory_baseline.json"""
+    rows = run((1000, 10000))
+    failures = regressions(rows, loadBaseline())
+
+    assert not failures, "\n".join(failures)
+    print(f"✓ No memory regressions across {len(rows)} measurements")
+
+
+def test_profile_peak_close_to_result():
+    """Test that profile() does not hold an intermediate copy of every sample"""
+    summary = summarize(run((10000,)))["profile"]
+
+    assert summary["peakPerSample"] < 1.2 * summary["retainedPerSample"]
+    print(f"✓ profile peak {summary['peakPerSample']:.1f} B/sample")
+
+
+if __name__ == "__main__":
+    test_no_memory_regressions()
+    test_profile_peak_close_to_result()
+    print("\n✅ All memory tests passed!")
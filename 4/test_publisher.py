@@ -0,0 +1,80 @@
+import asyncio
+
+import numpy as np
+
+from jointInterpolation import jointInterpolation
+from publisher import extrapolate, packFrame, publish, unpackFrame
+from ringBuffer import framesFromEoms
+
+
+class _Receiver(asyncio.DatagramProtocol):
+    def __init__(self):
+        self.datagrams = []
+
+    def datagram_received(self, data, addr):
+        self.datagrams.append(unpackFrame(data))
+
+
+async def _run(frames, period, mode, lateTolerance=None):
+    loop = asyncio.get_running_loop()
+    transport, receiver = await loop.create_datagram_endpoint(
+        _Receiver, local_addr=("127.0.0.1", 0)
+    )
+    address = transport.get_extra_info("sockname")
+    stats = await publish(frames, address, period, mode=mode, lateTolerance=lateTolerance)
+    await asyncio.sleep(0.05)
+    transport.close()
+    return stats, receiver.datagrams
+
+
+def test_pack_round_trip():
+    """Test that a two-joint frame survives packing"""
+    frame = np.array([0.5, 1, 2, 3, 4, 5, 6], dtype=float)
+    sequence, flags, unpacked = unpackFrame(packFrame(7, frame, 1))
+    assert (sequence, flags) == (7, 1) and np.array_equal(unpacked, frame)
+    print("✓ Pack round trip")
+
+
+def test_extrapolate():
+    """Test extrapolation with constant acceleration"""
+    frame = np.array([1.0, 10.0, 2.0, 4.0])
+    advanced = extrapolate(frame, 0.5)
+    assert np.allclose(advanced, [1.5, 10 + 1 + 0.5, 4.0, 4.0])
+    print("✓ Extrapolate")
+
+
+def test_publish_on_schedule():
+    """Test streaming jointInterpolation frames over loopback"""
+    eoma, eomb, t = jointInterpolation(100, 0, 50, 10, 0.01, 100, 200, 80, 150)
+    frames = framesFromEoms(t, eoma, eomb)[:60]
+    stats, datagrams = asyncio.run(_run(frames, 0.005, "skip"))
+
+    assert stats["sent"] + stats["missedDeadlines"] == len(frames)
+    assert len(datagrams) == stats["sent"]
+    sequences = [d[0] for d in datagrams]
+    assert sequences == sorted(sequences) and sequences[-1] == len(frames) - 1
+    assert stats["lateness"]["p99"] >= stats["lateness"]["p50"]
+    print(f"✓ Published {stats['sent']} frames, p99 lateness {stats['lateness']['p99']:.4f}s")
+
+
+def test_falling_behind_skips():
+    """Test that an impossible period skips or extrapolates frames"""
+    frames = np.column_stack([np.arange(2000) * 1e-6] + [np.zeros(2000)] * 3)
+    for mode in ("skip", "extrapolate"):
+        stats, datagrams = asyncio.run(_run(frames, 1e-6, mode))
+        assert stats["missedDeadlines"] > 0
+        assert stats["sent"] + stats["missedDeadlines"] == len(frames)
+    assert any(d[1] for d in datagrams), "Late frames should be flagged"
+    print("✓ Falling behind skips frames")
+
+
+def test_tolerance_below_period():
+    """Test that ticks late beyond a sub-period tolerance are missed, not sent late"""
+    frames = np.column_stack([np.arange(40) * 0.005] + [np.zeros(40)] * 3)
+    for mode in ("skip", "extrapolate"):
+        # Every wake-up overshoots a nanosecond
+        stats, datagrams = asyncio.run(_run(frames, 0.005, mode, lateTolerance=1e-9))
+        assert stats["missedDeadlines"] > 0
+        assert stats["sent"] + stats["missedDeadlines"] == len(frames)
+        assert datagrams[-1][0] == len(frames) - 1, "The final frame is always sent"
+    print("✓ Tolerance below period")
@@ -0,0 +1,33 @@
+import motionUI
+from renderBench import PHASES, configure, headlessUI, regenerate, restoreUI, run
+
+
+def test_headless_breakdown():
+    """Test that every plotting path runs headless with a full phase breakdown"""
+    rows = run(sampleCounts=(50,), repeats=1)
+    assert [row["path"] for row in rows] == ["plot_profile", "plot_motion", "plot_joint"]
+    for row in rows:
+        assert all(row[phase] >= 0 for phase in PHASES)
+        assert abs(sum(row[phase] for phase in PHASES) - row["total"]) < 1e-9
+        assert row["draw"] > 0 and row["layout"] > 0
+    print(f"✓ plot_joint total {rows[-1]['total'] * 1000:.1f}ms")
+
+
+def test_regeneration_replaces_plots():
+    """Test that repeated clicks keep three plots and restore the UI module"""
+    ui = headlessUI()
+    try:
+        configure(ui, 20)
+        for _ in range(3):
+            regenerate(ui, "plot_motion")
+        assert len(ui.motion_canvas_frame.winfo_children()) == 3
+    finally:
+        restoreUI()
+    assert motionUI.tk.__name__ == "tkinter"
+    print("✓ Regeneration replaces plots")
+
+
+if __name__ == "__main__":
+    test_headless_breakdown()
+    test_regeneration_replaces_plots()
+    print("\n✅ All render benchmark tests passed!")
@@ -0,0 +1,43 @@
+import os
+
+from report import renderReport
+
+
+def test_render_in_process(tmp_path):
+    """Test rendering single-axis and joint moves without a pool"""
+    moves = [
+        {"displacement": 100, "interval": 0.1, "accelLimit": 50, "veloLimit": 100},
+        {
+            "name": "Pick",
+            "displacementA": 100,
+            "displacementB": 50,
+            "interval": 0.1,
+            "accelLimitA": 100,
+            "veloLimitA": 200,
+            "accelLimitB": 80,
+            "veloLimitB": 150,
+        },
+    ]
+    entries = renderReport(moves, str(tmp_path), formats=("png", "svg"), workers=0)
+
+    assert [e["files"] for e in entries][1] == ["move_00001.png", "move_00001.svg"]
+    for entry in entries:
+        for name in entry["files"]:
+            assert os.path.getsize(tmp_path / name) > 0
+    index = (tmp_path / "index.html").read_text()
+    assert "Pick" in index and "move_00000.png" in index
+    print(f"✓ Rendered {len(entries)} moves in process")
+
+
+def test_render_process_pool(tmp_path):
+    """Test rendering across a process pool keeps move order"""
+    moves = [
+        {"displacement": d, "interval": 0.1, "accelLimit": 50, "veloLimit": 100}
+        for d in (10, 50, 100, 200)
+    ]
+    entries = renderReport(moves, str(tmp_path), workers=2, chunksize=1)
+
+    assert [e["index"] for e in entries] == [0, 1, 2, 3]
+    assert entries[0]["finalTime"] < entries[-1]["finalTime"]
+    assert all((tmp_path / e["files"][0]).exists() for e in entries)
+    print("✓ Rendered moves across a process pool")
@@ -0,0 +1,109 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from jointInterpolation import jointInterpolation
+from ringBuffer import SetpointRing, framesFromEoms
+
+
+def test_wraparound_and_back_pressure():
+    """Test partial writes when full and reads across the wrap point"""
+    ring = SetpointRing.create(capacity=8, joints=1)
+    try:
+        frames = np.arange(40, dtype=float).reshape(10, 4)
+        assert ring.write(frames) == 8, "Only capacity frames fit"
+        assert ring.free() == 0 and ring.stalls() == 1
+
+        view = ring.read(5)
+        assert np.array_equal(view, frames[:5])
+        ring.release(5)
+
+        assert ring.write(frames[8:]) == 2
+        first = ring.read()
+        ring.release(len(first))
+        second = ring.read()
+        ring.release(len(second))
+        assert np.array_equal(np.vstack((first, second)), frames[5:])
+        print("✓ Wraparound and back-pressure")
+    finally:
+        ring.detach()
+
+
+def _consume(name, queue):
+    ring = SetpointRing.attach(name)
+    received = []
+    while not ring.closed():
+        view = ring.read()
+        if len(view):
+            received.append(view.copy())
+            ring.release(len(view))
+    queue.put(np.vstack(received))
+    ring.detach()
+
+
+def test_cross_process_stream():
+    """Test streaming jointInterpolation frames to another process"""
+    eoma, eomb, t = jointInterpolation(100, 0, 50, 10, 0.001, 100, 200, 80, 150)
+    frames = framesFromEoms(t, eoma, eomb)
+
+    ring = SetpointRing.create(capacity=64, joints=2)
+    queue = multiprocessing.Queue()
+    consumer = multiprocessing.Process(target=_consume, args=(ring.name, queue))
+    consumer.start()
+    try:
+        assert ring.put(frames, timeout=10) == len(frames)
+        ring.close()
+        received = queue.get(timeout=10)
+        consumer.join(timeout=10)
+    finally:
+        ring.detach()
+
+    assert np.array_equal(received, frames)
+    print(f"✓ Cross-process stream: {len(frames)} frames")
+
+
+CONTROLLER = """
+import sys
+from ringBuffer import SetpointRing
+ring = SetpointRing.attach(sys.argv[1])
+view = ring.read()
+print(len(view), view[-1, 0])
+ring.release(len(view))
+ring.detach()
+"""
+
+
+def test_separate_process_does_not_unlink():
+    """Test that a separately launched consumer leaves the producer's ring alone"""
+    ring = SetpointRing.create(capacity=8, joints=1)
+    try:
+        ring.write(np.arange(12, dtype=float).reshape(3, 4))
+        # Not a multiprocessing child, so it has its own resource tracker;
+        # run() waits for the tracker too, which holds the output pipes
+        result = subprocess.run(
+            [sys.executable, "-c", CONTROLLER, ring.name],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["3", "8.0"]
+        assert "leaked" not in result.stderr
+
+        again = SetpointRing.attach(ring.name)
+        assert again.available() == 0, "The consumer's release is visible"
+        again.detach()
+    finally:
+        ring.detach()
+    print("✓ Separate process does not unlink")
+
+
+if __name__ == "__main__":
+    test_wraparound_and_back_pressure()
+    test_cross_process_stream()
+    test_separate_process_does_not_unlink()
+    print("\n✅ All ring buffer tests passed!")
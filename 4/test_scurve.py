@@ -0,0 +1,61 @@
+import numpy as np
+
+from motion import motion
+from scurve import scurveJointInterpolation, scurveMotion, scurveProfile, scurveSync
+
+
+def _check(d, s, t, eom, al, vl, jl):
+    pos, vel, acc = eom
+    jerk = np.diff(acc) / np.diff(t)
+    assert abs(pos[0] - s) < 1e-9 and abs(pos[-1] - (s + d)) < 1e-9
+    assert abs(vel[0]) < 1e-9 and abs(vel[-1]) < 1e-9
+    assert np.abs(vel).max() <= vl + 1e-9
+    assert np.abs(acc).max() <= al + 1e-9
+    assert np.abs(jerk).max() <= jl * (1 + 1e-6)
+
+
+def test_limits_respected():
+    """Test cruise, no-cruise and jerk-only moves against all three limits"""
+    for d, al, vl, jl in [(1000, 50, 100, 500), (100, 50, 100, 500), (0.01, 50, 100, 500), (-40, 30, 15, 60)]:
+        t, phases = scurveMotion(d, 1e-4, al, vl, jl)
+        _check(d, 3, t, scurveProfile(d, 3, t, phases), al, vl, jl)
+    print("✓ Limits respected")
+
+
+def test_slower_than_trapezoid_only_by_jerk_ramps():
+    """Test that the S-curve costs at most one jerk ramp over the trapezoid"""
+    t, ta = motion(1000, 0.01, 50, 100)
+    st, (Tj, Ta, Tv) = scurveMotion(1000, 0.01, 50, 100, 500)
+
+    assert st[-1] >= t[-1]
+    assert abs(st[-1] - (t[-1] + 50 / 500)) < 1e-9, "Cruising moves lose a/j"
+    print(f"✓ S-curve tf={st[-1]:.3f}s vs trapezoid tf={t[-1]:.3f}s")
+
+
+def test_joint_sync():
+    """Test that synchronized joints finish together within their limits"""
+    eoma, eomb, t = scurveJointInterpolation(100, 0, 10, 5, 1e-4, 50, 100, 40, 80, 500, 300)
+    _check(100, 0, t, eoma, 50, 100, 500)
+    _check(10, 5, t, eomb, 40, 80, 300)
+    print(f"✓ Joint sync: tf={t[-1]:.3f}s")
+
+
+def test_multi_joint_sync():
+    """Test that every joint of a batch is stretched to the slowest"""
+    displacements = np.array([100, 50, 5, 0.5, 0])
+    finalTime, (Tj, Ta, Tv) = scurveSync(displacements, 50, 100, 500)
+
+    assert np.allclose(2 * Ta + Tv, finalTime)
+    t = np.linspace(0, finalTime, 100001)
+    pos, vel, acc = scurveProfile(displacements, 0, t, (Tj, Ta, Tv))
+    assert np.allclose(pos[:, -1], displacements)
+    assert np.abs(acc).max() <= 50 + 1e-9
+    print(f"✓ Multi-joint sync: tf={finalTime:.3f}s")
+
+
+if __name__ == "__main__":
+    test_limits_respected()
+    test_slower_than_trapezoid_only_by_jerk_ramps()
+    test_joint_sync()
+    test_multi_joint_sync()
+    print("\n✅ All S-curve tests passed!")
@@ -0,0 +1,88 @@
+import numpy as np
+
+from profileArray import motionArray
+from sensitivity import moveTimeGradient, syncTimeGradient
+
+KEYS = ("dDisplacement", "dAccelLimit", "dVeloLimit")
+
+
+def _finiteDifference(function, args, direction=1.0, step=1e-6):
+    # Central differences of function(*args) along direction in each argument
+    gradients = []
+    for k in range(len(args)):
+        up = [np.array(arg, dtype=float) for arg in args]
+        down = [np.array(arg, dtype=float) for arg in args]
+        up[k] = up[k] + step * direction
+        down[k] = down[k] - step * direction
+        gradients.append((function(*up) - function(*down)) / (2 * step))
+    return gradients
+
+
+def test_matches_finite_differences():
+    """Test both regimes and negative displacements against central differences"""
+    displacement = np.array([1.0, -8.0, 100.0, -400.0, 0.3])
+    accelLimit = np.array([50.0, 20.0, 50.0, 80.0, 10.0])
+    veloLimit = np.array([100.0, 10.0, 40.0, 60.0, 2.0])
+    result = moveTimeGradient(displacement, accelLimit, veloLimit)
+
+    assert np.allclose(result["time"], motionArray(displacement, accelLimit, veloLimit)[0])
+    assert list(result["triangular"]) == [True, False, False, False, True]
+
+    expected = _finiteDifference(
+        lambda d, a, v: motionArray(d, a, v)[0], (displacement, accelLimit, veloLimit)
+    )
+    for key, fd in zip(KEYS, expected):
+        assert np.allclose(result[key], fd, rtol=1e-5, atol=1e-8), key
+    print("✓ Gradient matches finite differences")
+
+
+def test_kink_is_flagged_and_continuous():
+    """Test the triangular/trapezoidal switch from both sides"""
+    accelLimit, veloLimit = 50.0, 100.0
+    switch = veloLimit**2 / accelLimit
+    at = moveTimeGradient(switch, accelLimit, veloLimit)
+    below = moveTimeGradient(switch * (1 - 1e-6), accelLimit, veloLimit)
+    above = moveTimeGradient(switch * (1 + 1e-6), accelLimit, veloLimit)
+
+    assert at["atKink"] and not below["atKink"] and not above["atKink"]
+    assert below["triangular"] and not above["triangular"]
+    for key in KEYS:
+        assert np.isclose(below[key], above[key], rtol=1e-5, atol=1e-6), key
+        assert np.isclose(at[key], above[key], rtol=1e-5, atol=1e-6), key
+    print("✓ Kink flagged, gradient continuous")
+
+
+def test_zero_displacement():
+    """Test the square-root cusp at zero displacement"""
+    result = moveTimeGradient([0.0, 0.0], 10.0, 5.0)
+    assert np.all(result["time"] == 0) and np.all(np.isinf(result["dDisplacement"]))
+    assert np.all(result["dAccelLimit"] == 0)
+    print("✓ Zero displacement")
+
+
+def test_sync_gradient_follows_slowest_joint():
+    """Test batched synchronized time against finite differences and ties"""
+    displacements = np.array([[100.0, 50.0], [10.0, -90.0], [20.0, 20.0]])
+    accelLimits = np.array([[100.0, 80.0], [50.0, 50.0], [40.0, 40.0]])
+    veloLimits = np.array([[200.0, 150.0], [30.0, 30.0], [10.0, 10.0]])
+    result = syncTimeGradient(displacements, accelLimits, veloLimits)
+
+    sync = lambda d, a, v: motionArray(d, a, v)[0].max(axis=-1)
+    assert np.allclose(result["time"], sync(displacements, accelLimits, veloLimits))
+    assert list(result["slowest"]) == [0, 1, 0] and list(result["tied"]) == [False, False, True]
+
+    for row in range(2):
+        args = (displacements[row], accelLimits[row], veloLimits[row])
+        for joint in range(2):
+            expected = _finiteDifference(sync, args, direction=np.eye(2)[joint])
+            for key, fd in zip(KEYS, expected):
+                assert np.isclose(result[key][row, joint], fd, rtol=1e-5, atol=1e-8), key
+    print("✓ Sync gradient")
+
+
+if __name__ == "__main__":
+    test_matches_finite_differences()
+    test_kink_is_flagged_and_continuous()
+    test_zero_displacement()
+    test_sync_gradient_follows_slowest_joint()
+    print("\n✅ All sensitivity tests passed!")
@@ -0,0 +1,64 @@
+import itertools
+
+import numpy as np
+
+from jointInterpolation import jointInterpolation
+from motion import motion
+from sequencing import costMatrix, optimizeSequence, tourTime
+
+
+def test_cost_matches_motion():
+    """Test that the cost matrix uses motion() move times"""
+    targets = [0, 100, 30]
+    cost = costMatrix(targets, 50, 100)
+
+    t, ta = motion(100, 0.1, 50, 100)
+    assert abs(cost[0, 1] - t[-1]) < 1e-9
+    assert np.allclose(cost, cost.T) and np.all(np.diag(cost) == 0)
+    print("✓ Cost matches motion()")
+
+
+def test_cost_matches_joint_interpolation():
+    """Test that two-joint costs use the synchronized time"""
+    targets = [[0, 0], [100, 50]]
+    cost = costMatrix(targets, [100, 80], [200, 150])
+
+    eoma, eomb, t = jointInterpolation(100, 0, 50, 0, 0.1, 100, 200, 80, 150)
+    assert abs(cost[0, 1] - t[-1]) < 1e-9
+    print("✓ Cost matches jointInterpolation()")
+
+
+def test_optimized_beats_file_order():
+    """Test that a shuffled line of targets is put back in order"""
+    rng = np.random.default_rng(0)
+    targets = rng.permutation(np.arange(0, 400, 20.0))
+    targets = np.concatenate(([0.0], targets[targets != 0]))
+    result = optimizeSequence(targets, 50, 100)
+
+    assert result["cycleTime"] < result["originalCycleTime"]
+    assert np.all(np.diff(targets[result["order"]]) > 0), "Line should be swept once"
+    print(f"✓ Optimized: {result['originalCycleTime']:.1f}s → {result['cycleTime']:.1f}s")
+
+
+def test_small_instance_is_optimal():
+    """Test against brute force on a small 2D instance"""
+    rng = np.random.default_rng(1)
+    targets = rng.uniform(-100, 100, size=(7, 2))
+    cost = costMatrix(targets, [50, 40], [100, 80])
+    result = optimizeSequence(targets, [50, 40], [100, 80], closed=True)
+
+    best = min(
+        tourTime(cost, [0] + list(p), closed=True)
+        for p in itertools.permutations(range(1, 7))
+    )
+    assert result["order"][0] == 0 and sorted(result["order"]) == list(range(7))
+    assert result["cycleTime"] <= best * 1.05
+    print(f"✓ Small instance: {result['cycleTime']:.2f}s vs optimum {best:.2f}s")
+
+
+if __name__ == "__main__":
+    test_cost_matches_motion()
+    test_cost_matches_joint_interpolation()
+    test_optimized_beats_file_order()
+    test_small_instance_is_optimal()
+    print("\n✅ All sequencing tests passed!")
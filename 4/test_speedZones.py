@@ -0,0 +1,70 @@
+import numpy as np
+
+from profileArray import motionArray, profileArray
+from speedZones import ZoneTree, planZoned, zonedMotion, zonedProfile
+
+
+def test_tree_queries_match_brute_force():
+    """Test stabbing and overlap queries against a linear scan"""
+    rng = np.random.default_rng(3)
+    lows, widths, caps = rng.uniform(0, 100, 40), rng.uniform(1, 10, 40), rng.uniform(1, 5, 40)
+    zones = [(low, low + width, cap) for low, width, cap in zip(lows, widths, caps)]
+    tree = ZoneTree(zones)
+    for position in rng.uniform(-5, 115, 50):
+        expected = {zone for zone in tree.zones if zone[0] <= position <= zone[1]}
+        assert set(tree.stab(position)) == expected
+    for low, high in rng.uniform(0, 100, (20, 2)):
+        low, high = min(low, high), max(low, high)
+        expected = {zone for zone in tree.zones if zone[0] <= high and zone[1] >= low}
+        assert set(tree.overlapping(low, high)) == expected
+    print("✓ Tree queries")
+
+
+def test_no_zones_matches_trapezoid():
+    """Test that without zones the plan is the ordinary trapezoid"""
+    time, (pos, vel, acc), plan = zonedMotion(100, 5, 0.01, 50, 40, [])
+    Tf, Ta = motionArray(100, 50, 40)
+    assert np.isclose(plan["totalTime"], Tf)
+    expected = profileArray(100, 5, time, Ta)
+    assert np.allclose(pos, expected[0]) and np.allclose(vel, expected[1])
+    print(f"✓ No zones: tf={plan['totalTime']:.3f}")
+
+
+def test_zone_slows_only_inside():
+    """Test the cap inside a zone, full speed outside and the limits throughout"""
+    zones = [(40, 60, 5), (50, 55, 2)]
+    time, (pos, vel, acc), plan = zonedMotion(100, 0, 0.001, 50, 40, zones)
+
+    assert np.isclose(pos[-1], 100) and vel[-1] == 0
+    assert np.all(np.abs(acc) <= 50 + 1e-9) and np.all(np.abs(vel) <= 40 + 1e-9)
+    assert np.all(np.abs(vel[(pos >= 40) & (pos <= 60)]) <= 5 + 1e-9)
+    assert np.all(np.abs(vel[(pos >= 50) & (pos <= 55)]) <= 2 + 1e-9)
+    assert np.isclose(np.abs(vel).max(), 40)
+
+    # Faster than crawling at the zone cap everywhere, slower than no zones
+    crawl, _ = motionArray(100, 50, 2)
+    free, _ = motionArray(100, 50, 40)
+    assert free < plan["totalTime"] < crawl
+
+    # Position is the integral of velocity
+    assert np.allclose(np.gradient(pos, time)[1:-1], vel[1:-1], atol=0.05)
+    print(f"✓ Zoned move: tf={plan['totalTime']:.3f}s")
+
+
+def test_negative_move_and_zone_at_start():
+    """Test a move in the negative direction that starts inside a zone"""
+    plan = planZoned(-30, 10, 20, 15, [(0, 12, 3)])
+    time = np.linspace(0, plan["totalTime"], 2001)
+    pos, vel, _ = zonedProfile(plan, time)
+    assert np.isclose(pos[-1], -20) and np.all(vel <= 1e-12)
+    assert np.all(np.abs(vel[pos >= 0]) <= 3 + 1e-9)
+    assert np.isclose(vel.min(), -15)
+    print("✓ Negative move")
+
+
+if __name__ == "__main__":
+    test_tree_queries_match_brute_force()
+    test_no_zones_matches_trapezoid()
+    test_zone_slows_only_inside()
+    test_negative_move_and_zone_at_start()
+    print("\n✅ All speed zone tests passed!")
@@ -0,0 +1,60 @@
+import numpy as np
+
+from motion import motion
+from sweep import exportGrid, plotHeatmaps, sweepGrid
+
+
+def test_grid_matches_motion():
+    """Test sampled grid points against motion()"""
+    grid = sweepGrid([10, 100, 1000], [20, 50], [50, 100, 200])
+    assert grid["moveTime"].shape == (3, 2, 3)
+
+    for i, d in enumerate(grid["displacements"]):
+        for j, al in enumerate(grid["accelLimits"]):
+            for k, vl in enumerate(grid["veloLimits"]):
+                t, ta = motion(d, 0.1, al, vl)
+                assert abs(grid["moveTime"][i, j, k] - t[-1]) < 1e-9
+                assert abs(grid["Ta"][i, j, k] - ta) < 1e-9
+    print("✓ Grid matches motion()")
+
+
+def test_regime_and_peak_velocity():
+    """Test the triangular flag and peak velocity"""
+    grid = sweepGrid([10, 1000], [50], [100])
+    assert grid["triangular"][0, 0, 0] and not grid["triangular"][1, 0, 0]
+    assert abs(grid["peakVelocity"][0, 0, 0] - (10 * 50) ** 0.5) < 1e-9
+    assert grid["peakVelocity"][1, 0, 0] == 100
+    print("✓ Regime and peak velocity")
+
+
+def test_export_and_heatmap(tmp_path):
+    """Test CSV/NPZ export and heatmap rendering"""
+    grid = sweepGrid(
+        np.linspace(10, 500, 4), np.linspace(10, 100, 20), np.linspace(10, 200, 25)
+    )
+    exportGrid(grid, str(tmp_path / "grid.csv"))
+    exportGrid(grid, str(tmp_path / "grid.npz"))
+    rows = np.loadtxt(tmp_path / "grid.csv", delimiter=",", skiprows=1)
+    assert rows.shape == (4 * 20 * 25, 7)
+    assert np.allclose(np.load(tmp_path / "grid.npz")["moveTime"], grid["moveTime"])
+
+    plotHeatmaps(grid, str(tmp_path / "map.png"), [0, 3])
+    plotHeatmaps(grid, str(tmp_path / "cycle.png"), cycleCounts=[4, 3, 2, 1])
+    assert (tmp_path / "map.png").stat().st_size > 0
+    assert (tmp_path / "cycle.png").stat().st_size > 0
+    print("✓ Export and heatmap")
+
+
+def test_heatmap_on_uneven_axes(tmp_path):
+    """Test that heatmap cells sit on geomspace sweep values, like the contour"""
+    veloLimits = np.geomspace(5, 500, 30)
+    accelLimits = np.geomspace(5, 500, 20)
+    grid = sweepGrid([100.0], accelLimits, veloLimits)
+    fig = plotHeatmaps(grid, str(tmp_path / "uneven.png"))
+
+    # Each sweep value lies inside its own cell
+    edges = fig.axes[0].collections[0].get_coordinates()
+    veloEdges, accelEdges = edges[0, :, 0], edges[:, 0, 1]
+    assert np.all((veloEdges[:-1] < veloLimits) & (veloLimits < veloEdges[1:]))
+    assert np.all((accelEdges[:-1] < accelLimits) & (accelLimits < accelEdges[1:]))
+    print("✓ Heatmap on uneven axes")
@@ -0,0 +1,83 @@
+import base64
+import urllib.request
+
+import numpy as np
+
+from jointInterpolation import jointInterpolation
+from telemetry import TelemetryHub, TelemetryServer, packBatch, streamMove, unpackBatch
+
+
+def test_pack_round_trip():
+    """Test that a batch keeps absolute times and float32 values"""
+    frames = np.array([[1000.0, 1, 2, 3], [1000.001, 4, 5, 6]])
+    sequence, unpacked = unpackBatch(packBatch(3, frames))
+    assert sequence == 3 and unpacked.shape == (2, 4)
+    assert np.allclose(unpacked[:, 0], frames[:, 0], atol=1e-6)
+    assert np.allclose(unpacked[:, 1:], frames[:, 1:])
+    print("✓ Pack round trip")
+
+
+def test_hub_drops_oldest_for_slow_subscriber():
+    """Test that a subscriber's backlog stays bounded"""
+    hub = TelemetryHub(backlog=4)
+    fast, slow = hub.subscribe(), hub.subscribe()
+    for k in range(10):
+        hub.publish([[k, 0.0, 0.0, 0.0]])
+        fast.get(timeout=0)
+
+    assert slow.dropped == 6 and len(slow.messages) == 4
+    sequence, _ = unpackBatch(base64.b64decode(slow.get(timeout=0)))
+    assert sequence == 6
+    hub.unsubscribe(fast)
+    assert hub.subscribers == 1
+    print("✓ Slow subscriber dropped oldest batches")
+
+
+def test_stream_move_continues_session_clock():
+    """Test that consecutive moves share one time axis"""
+    hub = TelemetryHub()
+    subscriber = hub.subscribe()
+    eoma, eomb, t = jointInterpolation(100, 0, 50, 0, 0.01, 100, 200, 80, 150)
+    end = streamMove(hub, t, eoma, eomb, batchSize=25, realTime=False)
+    streamMove(hub, t, eoma, eomb, batchSize=25, realTime=False)
+
+    times = []
+    while (message := subscriber.get(timeout=0)) is not None:
+        times.extend(unpackBatch(base64.b64decode(message))[1][:, 0])
+    assert len(times) == 2 * len(t)
+    assert np.all(np.diff(times) >= -1e-6)
+    assert abs(times[-1] - 2 * end) < 1e-5
+    print(f"✓ Streamed {len(times)} samples over {times[-1]:.3f}s")
+
+
+def test_event_stream_round_trip():
+    """Test receiving a published batch over /stream"""
+    hub = TelemetryHub()
+    server = TelemetryServer(hub, ("127.0.0.1", 0), keepalive=0.05)
+    server.start()
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/stream", timeout=5) as response:
+            assert response.headers["Content-Type"] == "text/event-stream"
+            assert response.readline() == b"retry: 1000\n"
+            frames = np.array([[0.0, 1, 0, 0, 2, 0, 0], [0.01, 1.5, 50, 0, 2.5, 40, 0]])
+            hub.publish(frames)
+
+            data = None
+            while data is None:
+                line = response.readline().decode("ascii").strip()
+                if line.startswith("data: "):
+                    data = line[len("data: ") :]
+            _, received = unpackBatch(base64.b64decode(data))
+            assert np.allclose(received, frames)
+    finally:
+        server.stop()
+    print("✓ Event stream round trip")
+
+
+if __name__ == "__main__":
+    test_pack_round_trip()
+    test_hub_drops_oldest_for_slow_subscriber()
+    test_stream_move_continues_session_clock()
+    test_event_stream_round_trip()
+    print("\n✅ All telemetry tests passed!")
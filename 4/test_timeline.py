@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from motion import motion
+from timeline import holdPositions, mergedStream, schedule
+
+
+def _move(d, **extra):
+    return dict(displacement=d, accelLimit=50, veloLimit=100, **extra)
+
+
+def test_queue_order_and_dependencies():
+    """Test back-to-back queues, earliest starts and cross-resource waits"""
+    queues = {
+        "robot1": [_move(100, id="pick"), _move(-100, id="back")],
+        "robot2": [_move(50, earliest=0.5), _move(20, after=["pick"])],
+    }
+    entries = {e["id"]: e for e in schedule(queues)}
+    tf100 = motion(100, 0.1, 50, 100)[0][-1]
+
+    assert entries["pick"]["startTime"] == 0
+    assert abs(entries["back"]["startTime"] - tf100) < 1e-9
+    assert entries[("robot2", 0)]["startTime"] == 0.5
+    assert abs(entries[("robot2", 1)]["startTime"] - max(tf100, entries[("robot2", 0)]["endTime"])) < 1e-9
+    assert entries["back"]["start"] == 100, "Next move starts where the last ended"
+    print("✓ Queue order and dependencies")
+
+
+def test_cycle_detected():
+    """Test that circular waits are reported"""
+    queues = {"a": [_move(10, id="x", after=["y"])], "b": [_move(10, id="y", after=["x"])]}
+    with pytest.raises(ValueError):
+        schedule(queues)
+    print("✓ Cycle detected")
+
+
+def test_merged_stream_is_ordered_and_complete():
+    """Test the interleaved stream against each move's own profile"""
+    queues = {"r1": [_move(100), _move(-30)], "r2": [_move(40, earliest=0.3)]}
+    entries = schedule(queues)
+    frames = list(mergedStream(entries, 0.01, blockSize=16))
+
+    times = [f[0] for f in frames]
+    assert times == sorted(times)
+    r2 = np.array([f[2] for f in frames if f[1] == "r2"])
+    assert abs(r2[0]) < 1e-12 and abs(r2[-1] - 40) < 1e-9
+    r1 = [f[2] for f in frames if f[1] == "r1"]
+    assert abs(r1[-1] - 70) < 1e-9
+    print(f"✓ Merged stream: {len(frames)} frames")
+
+
+def test_stream_is_lazy():
+    """Test that later moves are not evaluated before the stream reaches them"""
+    queues = {"r1": [_move(100)] + [_move(1e9, start=0)]}
+    stream = mergedStream(schedule(queues), 0.01)
+    first = [next(stream) for _ in range(10)]
+    assert all(f[0] < 0.1 for f in first)
+    print("✓ Stream is lazy")
+
+
+def test_hold_positions():
+    """Test that idle resources hold their last position"""
+    queues = {"r1": [_move(10)], "r2": [_move(5, earliest=1.0)]}
+    entries = schedule(queues)
+    ticks = list(holdPositions(mergedStream(entries, 0.05), entries))
+    t, state = ticks[-1]
+    assert abs(state["r1"][0] - 10) < 1e-9 and state["r1"][1] == 0
+    print("✓ Hold positions")
+
+
+def test_running_moves_are_not_held():
+    """Test that a resource sampled off another's ticks keeps its motion state"""
+    queues = {"r1": [_move(100)], "r2": [_move(40, earliest=0.305)]}
+    entries = schedule(queues)
+    r1 = next(e for e in entries if e["resource"] == "r1")
+    ticks = list(holdPositions(mergedStream(entries, 0.01), entries))
+
+    times = np.array([t for t, _ in ticks])
+    assert np.all(np.diff(times) > 1e-9), "One tick grid, no near-duplicate times"
+    for t, state in ticks:
+        pos, vel, acc = state["r1"]
+        if 0 < t < r1["endTime"]:
+            assert vel > 0, f"r1 reported idle at {t} while still moving"
+        elif t > r1["endTime"]:
+            assert abs(pos - 100) < 1e-9 and vel == 0 and acc == 0
+    print("✓ Running moves are not held")
+
+
+def test_joint_moves():
+    """Test that multi-joint moves are synchronized like jointInterpolation()"""
+    from jointInterpolation import jointInterpolation
+
+    move = dict(displacement=[100, 50], accelLimit=[100, 80], veloLimit=[200, 150])
+    queues = {"arm": [move, dict(move, displacement=[-20, 10])], "r2": [_move(10)]}
+    entries = schedule(queues)
+    arm = [e for e in entries if e["resource"] == "arm"]
+    time = jointInterpolation(100, 0, 50, 0, 0.01, 100, 200, 80, 150)[2]
+    assert abs(arm[0]["endTime"] - time[-1]) < 1e-9
+    assert np.allclose(arm[1]["start"], [100, 50])
+
+    frames = [f for f in mergedStream(entries, 0.01) if f[1] == "arm"]
+    assert frames[0][2].shape == (2,)
+    assert np.allclose(frames[-1][2], [80, 60])
+    state = list(holdPositions(mergedStream(entries, 0.01), entries))[-1][1]
+    assert np.allclose(state["arm"][0], [80, 60]) and np.all(state["arm"][1] == 0)
+    print("✓ Joint moves")
+
+
+if __name__ == "__main__":
+    test_queue_order_and_dependencies()
+    test_cycle_detected()
+    test_merged_stream_is_ordered_and_complete()
+    test_stream_is_lazy()
+    test_hold_positions()
+    test_running_moves_are_not_held()
+    test_joint_moves()
+    print("\n✅ All timeline tests passed!")
@@ -0,0 +1,77 @@
+import numpy as np
+
+from timeline import schedule
+from trackingError import analyzeLog, commandedPosition, formatSummary, openLog
+
+QUEUES = {
+    "x": [
+        {"id": "a", "displacement": 100, "accelLimit": 200, "veloLimit": 100},
+        {"id": "b", "displacement": -40, "accelLimit": 200, "veloLimit": 100, "earliest": 2.0},
+        {"id": "c", "displacement": 10, "accelLimit": 200, "veloLimit": 100},
+    ]
+}
+
+
+def _log(moves, lag=0.01, rate=1000, duration=4.0):
+    # First-order lag behind the command, as a drive with finite bandwidth
+    t = np.arange(0, duration, 1 / rate)
+    commanded, _ = commandedPosition(moves, t)
+    actual = np.empty_like(commanded)
+    actual[0] = commanded[0]
+    blend = 1 / (1 + lag * rate)
+    for k in range(1, len(t)):
+        actual[k] = actual[k - 1] + blend * (commanded[k] - actual[k - 1])
+    return np.column_stack([t, actual]), commanded
+
+
+def test_commanded_position_matches_schedule():
+    """Test the evaluator at move boundaries and during holds"""
+    moves = schedule(QUEUES)
+    ends = [entry["endTime"] for entry in moves]
+    pos, index = commandedPosition(moves, [-1.0, ends[0], 1.9, ends[1] - 1e-9, 10.0])
+    assert np.allclose(pos, [0, 100, 100, 60, 70])
+    assert list(index) == [-1, 0, 0, 1, 2]
+    print("✓ Commanded position")
+
+
+def test_streamed_statistics_match_single_pass(tmp_path):
+    """Test that chunked analysis over a memory-mapped log matches brute force"""
+    moves = schedule(QUEUES)
+    log, commanded = _log(moves)
+    np.save(tmp_path / "log.npy", log)
+    mapped = openLog(tmp_path / "log.npy")
+    assert isinstance(mapped, np.memmap)
+
+    rows = analyzeLog(mapped, moves, tolerance=0.005, chunkRows=257)
+    whole = analyzeLog(log, moves, tolerance=0.005, chunkRows=len(log))
+    for row, expected in zip(rows, whole):
+        assert row.keys() == expected.keys()
+        for key in ("samples", "rms", "peak", "settled"):
+            assert np.isclose(row[key], expected[key])
+
+    _, index = commandedPosition(moves, log[:, 0])
+    error = log[:, 1] - commanded
+    for k, row in enumerate(rows):
+        assert row["samples"] == np.sum(index == k)
+        assert np.isclose(row["rms"], np.sqrt(np.mean(error[index == k] ** 2)))
+        assert np.isclose(row["peak"], np.abs(error[index == k]).max())
+
+    # b runs straight into c, so it has no hold in which to settle
+    assert [row["settled"] for row in rows] == [True, False, True]
+    assert 0 < rows[0]["settlingTime"] < 0.2 and rows[1]["settlingTime"] is None
+
+    print(formatSummary(rows))
+    print("✓ Streamed statistics")
+
+
+def test_raw_log_and_unsettled_move(tmp_path):
+    """Test a raw float64 log and a move cut off before it settles"""
+    moves = schedule(QUEUES)
+    log, _ = _log(moves, duration=moves[-1]["endTime"] + 0.002)
+    log.astype("<f8").tofile(tmp_path / "log.bin")
+
+    rows = analyzeLog(openLog(tmp_path / "log.bin", columns=2), moves, tolerance=0.001)
+    assert rows[0]["settled"] and not rows[-1]["settled"]
+    assert rows[-1]["settlingTime"] is None
+    assert "never" in formatSummary(rows)
+    print("✓ Raw log")
@@ -0,0 +1,101 @@
+import multiprocessing
+
+import numpy as np
+
+import trajectoryCache
+from jointInterpolation import jointInterpolation
+from motion import motion
+from trajectory import profile
+from trajectoryCache import TrajectoryCache, cacheKey
+
+
+def test_hit_returns_memory_map(tmp_path):
+    """Test that a second call is served from disk as a memory map"""
+    cache = TrajectoryCache(str(tmp_path))
+    t1, ta1 = cache.motion(100, 0.1, 50, 100)
+    t2, ta2 = TrajectoryCache(str(tmp_path)).motion(100.0, 0.1, 50.0, 100.0)
+
+    ref_t, ref_ta = motion(100, 0.1, 50, 100)
+    assert np.array_equal(t2, ref_t) and ta2 == ref_ta
+    assert isinstance(t2.base, np.memmap) or isinstance(t2, np.memmap)
+    assert cache.misses == 1
+    print("✓ Hit returns memory map")
+
+
+def test_profile_and_joint(tmp_path):
+    """Test profile and jointInterpolation results round trip"""
+    cache = TrajectoryCache(str(tmp_path))
+    t = [0, 0.5, 1, 1.5, 2]
+    for _ in range(2):
+        pos, vel, acc = cache.profile(100, 0, t, 0.5)
+        eoma, eomb, jt = cache.jointInterpolation(100, 0, 50, 0, 0.1, 100, 200, 80, 150)
+    assert cache.hits == 2
+
+    assert np.allclose(pos, profile(100, 0, t, 0.5)[0])
+    ref_a, ref_b, ref_t = jointInterpolation(100, 0, 50, 0, 0.1, 100, 200, 80, 150)
+    assert np.allclose(eomb[1], ref_b[1]) and np.allclose(jt, ref_t)
+    print("✓ Profile and joint round trip")
+
+
+def test_key_normalization():
+    """Test that keys ignore int/float spelling but not values"""
+    assert cacheKey("motion", 100, 0.1, 50, 100) == cacheKey("motion", 100.0, 0.1, 50.0, 100.0)
+    assert cacheKey("motion", 100, 0.1, 50, 100) != cacheKey("motion", 100, 0.1, 50, 101)
+    assert cacheKey("profile", 1, 0, [0, 1], 0.5) != cacheKey("profile", 1, 0, [0, 2], 0.5)
+    print("✓ Key normalization")
+
+
+def test_lru_eviction(tmp_path):
+    """Test that the size cap evicts the least recently used entry"""
+    cache = TrajectoryCache(str(tmp_path), maxBytes=4000)
+    cache.motion(100, 0.01, 50, 100)  # ~2.4 kB each, ~3.4 kB for the second
+    cache.motion(200, 0.01, 50, 100)
+
+    assert cache.size() <= 4000
+    cache.motion(200, 0.01, 50, 100)
+    assert cache.hits == 1, "Newest entry should survive"
+    print(f"✓ LRU eviction: {cache.size()} bytes")
+
+
+def test_entries_in_use_are_skipped(tmp_path, monkeypatch):
+    """Test that Windows-style PermissionErrors never reach the caller"""
+    cache = TrajectoryCache(str(tmp_path), maxBytes=4000)
+    cache.motion(100, 0.01, 50, 100)
+
+    def refuse(*args):
+        raise PermissionError("mapped by another process")
+
+    monkeypatch.setattr(trajectoryCache.os, "remove", refuse)
+    monkeypatch.setattr(trajectoryCache.os, "replace", refuse)
+
+    # Eviction cannot delete the mapped entry and the store cannot replace
+    t, ta = cache.motion(200, 0.01, 50, 100)
+    assert np.array_equal(t, motion(200, 0.01, 50, 100)[0])
+    t, ta = cache.motion(100, 0.01, 50, 100)
+    assert np.array_equal(t, motion(100, 0.01, 50, 100)[0])
+    print("✓ Entries in use are skipped")
+
+
+def _fill(directory, seed):
+    cache = TrajectoryCache(directory, maxBytes=20000)
+    for d in range(seed, seed + 40):
+        cache.motion(d, 0.05, 50, 100)
+
+
+def test_concurrent_processes(tmp_path):
+    """Test several processes writing and evicting the same directory"""
+    workers = [
+        multiprocessing.Process(target=_fill, args=(str(tmp_path), 10 * k))
+        for k in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    cache = TrajectoryCache(str(tmp_path), maxBytes=20000)
+    t, ta = cache.motion(45, 0.05, 50, 100)
+    assert np.array_equal(t, motion(45, 0.05, 50, 100)[0])
+    assert not list(tmp_path.glob("*.tmp"))
+    print("✓ Concurrent processes")
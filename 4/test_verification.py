@@ -0,0 +1,108 @@
+import numpy as np
+
+from jointInterpolation import jointInterpolation
+from motion import motion
+from profileArray import motionArray, profileArray, timeArray
+from trajectory import profile
+from verification import padMoves, verifyTrajectories
+
+
+def test_planned_moves_pass():
+    """Test that motion/profile output passes every check"""
+    moves = [(100, 0, 50, 100), (10, 5, 50, 100), (-40, 20, 30, 15)]
+    traces = []
+    for d, s, al, vl in moves:
+        t, ta = motion(d, 0.01, al, vl)
+        traces.append((t,) + profile(d, s, t, ta))
+
+    time, pos, vel, acc = (padMoves([tr[k] for tr in traces]) for k in range(4))
+    d, s, al, vl = np.array(moves, dtype=float).T
+    reports = verifyTrajectories(time, pos, vel, acc, d, s, al, vl)
+
+    assert all(r["ok"] for r in reports), [r["violations"] for r in reports]
+    print(f"✓ Planned moves pass: {len(reports)} moves")
+
+
+def test_joint_interpolation_passes():
+    """Test both synchronized joints against their own limits"""
+    eoma, eomb, t = jointInterpolation(100, 0, 50, 10, 0.01, 100, 200, 80, 150)
+    reports = verifyTrajectories(
+        t,
+        [eoma[0], eomb[0]],
+        [eoma[1], eomb[1]],
+        [eoma[2], eomb[2]],
+        [100, 50],
+        [0, 10],
+        [100, 80],
+        [200, 150],
+    )
+
+    assert all(r["ok"] for r in reports), [r["violations"] for r in reports]
+    print("✓ Joint interpolation passes")
+
+
+def test_limit_violation_detected():
+    """Test that a profile forced too short is flagged"""
+    t = timeArray(1.0, 0.01)
+    pos, vel, acc = profileArray(100, 0, t, 0.5)
+    report = verifyTrajectories(t, pos, vel, acc, 100, 0, 50, 100)[0]
+
+    assert not report["ok"]
+    assert "velocity limit" in report["violations"]
+    assert "acceleration limit" in report["violations"]
+    print(f"✓ Violation detected: {report['violations']}")
+
+
+def test_discontinuity_detected():
+    """Test that a position jump is flagged"""
+    Tf, Ta = motionArray(100, 50, 100)
+    t = timeArray(float(Tf), 0.01)
+    pos, vel, acc = profileArray(100, 0, t, Ta)
+    pos[40] += 5
+    report = verifyTrajectories(t, pos, vel, acc, 100, 0, 50, 100)[0]
+
+    assert "position continuity" in report["violations"]
+    assert "differentiated position" in report["violations"]
+    print("✓ Discontinuity detected")
+
+
+def test_time_grid_is_drift_free():
+    """Test timeArray() against motion()'s accumulated grid"""
+    # Tf = 1.0 is a multiple of the interval: motion() drifts to
+    # 0.9999999999999999 and then closes with 1.0, one extra sample
+    time, _ = motion(12.5, 0.1, 50, 100)
+    grid = timeArray(1.0, 0.1)
+    assert len(time) == 12 and time[-2] < 1.0 and time[-1] == 1.0
+    assert len(grid) == 11 and grid[-1] == 1.0
+    assert np.array_equal(grid, np.arange(11) * 0.1)
+    assert np.allclose(grid, time[:-2] + [time[-1]])
+
+    # Otherwise the grids match sample for sample
+    time, _ = motion(100, 0.1, 50, 100)
+    Tf, _ = motionArray(100, 50, 100)
+    assert np.allclose(timeArray(float(Tf), 0.1), time)
+    print("✓ Drift-free time grid")
+
+
+def test_time_grid_closes_at_final_time():
+    """Test that the grid ends exactly at finalTime for awkward intervals"""
+    # floor(Tf / interval) * interval rounds to 14.364 here
+    assert timeArray(14.363999999999999, 0.003)[-1] == 14.363999999999999
+
+    rng = np.random.default_rng(0)
+    intervals = rng.choice([0.001, 0.003, 0.007, 0.01, 0.1], 2000)
+    for finalTime, interval in zip(np.round(rng.uniform(0.1, 20, 2000), 3), intervals):
+        time = timeArray(finalTime, interval)
+        assert time[-1] == finalTime and np.all(np.diff(time) > 0)
+        assert np.all(time[:-1] < finalTime)
+    print("✓ Time grid closes at finalTime")
+
+
+if __name__ == "__main__":
+    test_planned_moves_pass()
+    test_joint_interpolation_passes()
+    test_limit_violation_detected()
+    test_discontinuity_detected()
+    test_time_grid_is_drift_free()
+    test_time_grid_closes_at_final_time()
+    print("\n✅ All verification tests passed!")
@@ -0,0 +1,268 @@
+"""
+Shared-timeline scheduling of move queues for several robots or axes.
+
+Each resource runs its moves in queue order. A move may also wait for an
+earliest start time and for other moves (on any resource) to finish. Start
+times come from a priority-queue event loop over move completions, and the
+cell stream is merged lazily: each move's samples are generated only when
+the stream reaches its start time.
+
+A move is either single-axis, planned like motion(), or multi-joint, with
+lists of displacements and limits synchronized like jointInterpolation();
+its pos, vel and acc are then arrays with one entry per joint.
+
+Every move is sampled on one cell-wide tick grid, k * interval on the shared
+clock, so resources that start at different times still share timestamps.
+Each move also emits its exact end time so it lands on its final position.
+"""
+
+import bisect
+import heapq
+import itertools
+import math
+
+import numpy as np
+
+from chunked import DEFAULT_BLOCK_SIZE
+from profileArray import motionArray, profileArray, syncArray
+
+
+def _plan(move):
+    # (finalTime, Ta) of a single-axis or synchronized multi-joint move
+    Tf, Ta = motionArray(move["displacement"], move["accelLimit"], move["veloLimit"])
+    if np.ndim(Tf) == 0:
+        return (float(Tf), Ta)
+    finalTime = float(Tf.max())
+    Ta = syncArray(move["displacement"], finalTime, move["accelLimit"], Tf, Ta)
+    return (finalTime, Ta)
+
+
+def moveDuration(move):
+    """Closed-form duration of a move dict planned like motion() or jointInterpolation()."""
+    return _plan(move)[0]
+
+
+def schedule(queues):
+    """
+    Compute start times for every move.
+
+    Args:
+        queues (dict): Resource name -> list of move dicts with
+            "displacement", "accelLimit", "veloLimit" (floats, or lists
+            with one entry per joint) and optionally "id",
+            "start" (initial position, defaults to where the previous move
+            ended), "earliest" (earliest start time) and "after" (list of
+            move ids that must finish first)
+
+    Returns:
+        list of dicts: One entry per move in start order with "id",
+            "resource", "index", "startTime", "endTime", "start" and "move"
+
+    Raises:
+        ValueError: On unknown dependencies or a dependency cycle
+    """
+    moves = {}
+    for resource, queue in queues.items():
+        for index, move in enumerate(queue):
+            moveId = move.get("id", (resource, index))
+            if moveId in moves:
+                raise ValueError(f"duplicate move id {moveId!r}")
+            moves[moveId] = (resource, index, move)
+
+    for moveId, (_, _, move) in moves.items():
+        for dependency in move.get("after", ()):
+            if dependency not in moves:
+                raise ValueError(f"move {moveId!r} waits for unknown move {dependency!r}")
+
+    nextIndex = {resource: 0 for resource in queues}
+    resourceFree = {resource: 0.0 for resource in queues}
+    position = {resource: None for resource in queues}
+    finished = {}
+    scheduled = []
+
+    # Completion events: (time, tiebreak, move id)
+    events = []
+    tiebreak = itertools.count()
+
+    def release(resource):
+        # Start the resource's next move if everything it waits for is done
+        queue = queues[resource]
+        index = nextIndex[resource]
+        if index >= len(queue):
+            return
+        move = queue[index]
+        moveId = move.get("id", (resource, index))
+        waits = move.get("after", ())
+        if any(dependency not in finished for dependency in waits):
+            return
+
+        startTime = max(
+            [resourceFree[resource], move.get("earliest", 0.0)]
+            + [finished[dependency] for dependency in waits]
+        )
+        start = move.get("start", position[resource])
+        if start is None:
+            start = np.zeros(np.shape(move["displacement"])) if np.ndim(move["displacement"]) else 0.0
+        endTime = startTime + moveDuration(move)
+
+        nextIndex[resource] = index + 1
+        resourceFree[resource] = endTime
+        position[resource] = np.add(start, move["displacement"])
+        scheduled.append(
+            {
+                "id": moveId,
+                "resource": resource,
+                "index": index,
+                "startTime": startTime,
+                "endTime": endTime,
+                "start": start,
+                "move": move,
+            }
+        )
+        heapq.heappush(events, (endTime, next(tiebreak), moveId))
+
+    for resource in queues:
+        release(resource)
+
+    while events:
+        endTime, _, moveId = heapq.heappop(events)
+        finished[moveId] = endTime
+        # A completion can unblock its own resource and any waiting resource
+        for resource in queues:
+            release(resource)
+
+    if len(scheduled) < len(moves):
+        started = {entry["id"] for entry in scheduled}
+        blocked = [moveId for moveId in moves if moveId not in started]
+        raise ValueError(f"dependency cycle or deadlock among moves {blocked!r}")
+
+    scheduled.sort(key=lambda entry: (entry["startTime"], str(entry["resource"])))
+    return scheduled
+
+
+def _moveFrames(entry, interval, blockSize):
+    # Lazily yield (t, resource, pos, vel, acc) for one scheduled move on the
+    # cell tick grid, then at its exact end time when that is off the grid
+    move = entry["move"]
+    finalTime, Ta = _plan(move)
+    startTime, endTime = entry["startTime"], entry["startTime"] + finalTime
+    first = math.ceil(startTime / interval)
+    if first * interval < startTime:
+        first += 1
+    last = math.floor(endTime / interval + 1e-9)
+    # A tick within rounding of the end time stands for it
+    onGrid = abs(last * interval - endTime) <= 1e-9 * interval
+
+    for block in range(first, last + 1, blockSize):
+        ticks = np.arange(block, min(block + blockSize, last + 1)) * interval
+        yield from _evaluate(entry, move, ticks, Ta, finalTime)
+    if not onGrid:
+        yield from _evaluate(entry, move, np.array([endTime]), Ta, finalTime)
+
+
+def _evaluate(entry, move, ticks, Ta, finalTime):
+    local = np.clip(ticks - entry["startTime"], 0, finalTime)
+    if ticks[-1] >= entry["startTime"] + finalTime - 1e-9 * finalTime:
+        local[-1] = finalTime
+    pos, vel, acc = profileArray(move["displacement"], entry["start"], local, Ta, finalTime)
+    if pos.ndim == 1:
+        for t, p, v, a in zip(ticks.tolist(), pos.tolist(), vel.tolist(), acc.tolist()):
+            yield (t, entry["resource"], p, v, a)
+    else:
+        for k, t in enumerate(ticks.tolist()):
+            yield (t, entry["resource"], pos[:, k], vel[:, k], acc[:, k])
+
+
+def mergedStream(scheduled, interval, blockSize=DEFAULT_BLOCK_SIZE):
+    """
+    Single time-ordered setpoint stream for every resource.
+
+    Moves are only evaluated once the stream reaches their start time, and
+    then one block at a time, so memory stays bounded by the number of
+    moves running at once.
+
+    Args:
+        scheduled (list of dicts): Output of schedule()
+        interval (float): Sample interval of every move
+
+    Yields:
+        tuple: (t, resource, pos, vel, acc) in non-decreasing t
+    """
+    heap = []
+    tiebreak = itertools.count()
+    pending = iter(sorted(scheduled, key=lambda entry: entry["startTime"]))
+    upcoming = next(pending, None)
+
+    def admit(entry):
+        frames = _moveFrames(entry, interval, blockSize)
+        first = next(frames, None)
+        if first is not None:
+            heapq.heappush(heap, (first[0], next(tiebreak), first, frames))
+
+    while heap or upcoming is not None:
+        # Open every move that starts no later than the earliest pending frame
+        while upcoming is not None and (not heap or upcoming["startTime"] <= heap[0][0]):
+            admit(upcoming)
+            upcoming = next(pending, None)
+
+        _, _, frame, frames = heapq.heappop(heap)
+        yield frame
+        following = next(frames, None)
+        if following is not None:
+            heapq.heappush(heap, (following[0], next(tiebreak), following, frames))
+
+
+def holdPositions(stream, scheduled):
+    """
+    Fill in every resource at every distinct time of a merged stream.
+
+    A resource without a sample at this time but with a move still running
+    is extrapolated from its last sample at constant acceleration; this only
+    happens at another move's off-grid end time, less than one interval
+    after that sample. Once its move has ended, a resource holds its final
+    position with zero velocity and acceleration, which is what a cell
+    controller expects each tick.
+
+    Args:
+        stream (iterable): mergedStream() output
+        scheduled (list of dicts): The schedule() output the stream came from
+
+    Yields:
+        tuple: (t, {resource: (pos, vel, acc)})
+    """
+    windows = {}
+    for entry in sorted(scheduled, key=lambda entry: entry["startTime"]):
+        starts, ends = windows.setdefault(entry["resource"], ([], []))
+        starts.append(entry["startTime"])
+        ends.append(entry["endTime"])
+
+    def endOf(resource, t):
+        starts, ends = windows[resource]
+        index = bisect.bisect_right(starts, t) - 1
+        return ends[max(index, 0)]
+
+    last = {}
+    current = None
+    sampled = {}
+
+    def snapshot(t):
+        state = dict(sampled)
+        for resource, (sampleTime, pos, vel, acc, end) in last.items():
+            if resource in state:
+                continue
+            if t < end:
+                dt = t - sampleTime
+                state[resource] = (pos + vel * dt + 0.5 * acc * dt**2, vel + acc * dt, acc)
+            else:
+                state[resource] = (pos, vel * 0.0, acc * 0.0)
+        return state
+
+    for t, resource, pos, vel, acc in stream:
+        if current is not None and t != current:
+            yield (current, snapshot(current))
+            sampled = {}
+        current = t
+        sampled[resource] = (pos, vel, acc)
+        last[resource] = (t, pos, vel, acc, endOf(resource, t))
+    if current is not None:
+        yield (current, snapshot(current))
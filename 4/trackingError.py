@@ -0,0 +1,166 @@
+"""
+Planned-versus-actual tracking error over recorded drive logs.
+
+A log is a table of rows (t, pos, ...) in time order, either a .npy file or
+raw little-endian float64. It is memory-mapped and read in fixed-size
+chunks, so a shift's worth of rows never has to fit in memory. For each
+chunk the commanded position is rebuilt at every logged timestamp with
+profileArray(), each sample evaluated against the move that was running at
+that time, and the error is accumulated per move.
+
+Samples between the end of one move and the start of the next belong to the
+earlier move, which holds its final position; that is where settling time is
+measured.
+
+    python trackingError.py log.npy moves.json [column]
+"""
+
+import json
+import sys
+
+import numpy as np
+
+from chunked import DEFAULT_BLOCK_SIZE
+from profileArray import motionArray, profileArray
+
+
+def openLog(path, columns=2):
+    """
+    Memory-map a log without reading it.
+
+    Args:
+        path (str): A .npy file, or raw float64 rows of columns values
+        columns (int): Values per row for raw files
+
+    Returns:
+        array of shape (rows, columns), read-only and backed by the file
+    """
+    if str(path).endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    return np.memmap(path, dtype="<f8", mode="r").reshape(-1, columns)
+
+
+def _moveArrays(moves):
+    # Per-move parameters from timeline.schedule() style entries
+    startTime = np.array([entry["startTime"] for entry in moves], dtype=float)
+    order = np.argsort(startTime, kind="stable")
+    entries = [moves[k] for k in order]
+    displacement = np.array([entry["move"]["displacement"] for entry in entries], dtype=float)
+    Tf, Ta = motionArray(
+        displacement,
+        [entry["move"]["accelLimit"] for entry in entries],
+        [entry["move"]["veloLimit"] for entry in entries],
+    )
+    start = np.array([entry["start"] for entry in entries], dtype=float)
+    return (order, startTime[order], displacement, start, Tf, Ta)
+
+
+def commandedPosition(moves, t):
+    """
+    Commanded position at arbitrary timestamps, one vectorized pass.
+
+    Args:
+        moves (list of dicts): timeline.schedule() entries for one axis
+        t (array): Timestamps in order
+
+    Returns:
+        tuple: (pos, index) where index is the move running at each time,
+            -1 before the first move
+    """
+    _, startTime, displacement, start, Tf, Ta = _moveArrays(moves)
+    return _evaluate(startTime, displacement, start, Tf, Ta, np.asarray(t, dtype=float))
+
+
+def _evaluate(startTime, displacement, start, Tf, Ta, t):
+    index = np.searchsorted(startTime, t, side="right") - 1
+    move = np.maximum(index, 0)
+    # Every sample against its own move: per-sample parameters, one time each
+    local = np.clip(t - startTime[move], 0, Tf[move])
+    pos, _, _ = profileArray(
+        displacement[move], start[move], local[:, np.newaxis], Ta[move], Tf[move]
+    )
+    return (pos[:, 0], index)
+
+
+def analyzeLog(log, moves, column=1, tolerance=None, chunkRows=DEFAULT_BLOCK_SIZE):
+    """
+    Per-move tracking error statistics, streamed over the log in chunks.
+
+    Args:
+        log (array of shape (rows, columns)): openLog() output, times in column 0
+        moves (list of dicts): timeline.schedule() entries for the logged axis
+        column (int): Log column holding the actual position
+        tolerance (float): Error band for settling, defaults to 1% of the
+            largest displacement
+        chunkRows (int): Rows read and evaluated at a time
+
+    Returns:
+        list of dicts: Per move, in the order given, "id", "samples", "rms",
+            "peak", "settlingTime" (seconds after the commanded end until the
+            error stays within tolerance, None if it never does before the
+            next move or the end of the log) and "settled"
+    """
+    order, startTime, displacement, start, Tf, Ta = _moveArrays(moves)
+    if tolerance is None:
+        tolerance = 0.01 * float(np.abs(displacement).max())
+    count = len(order)
+    endTime = startTime + Tf
+
+    samples = np.zeros(count, dtype=np.int64)
+    sumSquares = np.zeros(count)
+    peak = np.zeros(count)
+    lastOutside = np.full(count, -np.inf)
+    lastSample = np.full(count, -np.inf)
+
+    for first in range(0, len(log), chunkRows):
+        chunk = np.asarray(log[first : first + chunkRows], dtype=float)
+        t = chunk[:, 0]
+        commanded, index = _evaluate(startTime, displacement, start, Tf, Ta, t)
+        inMove = index >= 0
+        index, t = index[inMove], t[inMove]
+        error = np.abs(chunk[inMove, column] - commanded[inMove])
+
+        samples += np.bincount(index, minlength=count)
+        sumSquares += np.bincount(index, weights=error**2, minlength=count)
+        np.maximum.at(peak, index, error)
+        np.maximum.at(lastSample, index, t)
+        outside = error > tolerance
+        np.maximum.at(lastOutside, index[outside], t[outside])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rms = np.sqrt(sumSquares / samples)
+    # Settled when the last out-of-band sample is followed by in-band ones
+    settled = (lastOutside < lastSample) & (lastSample >= endTime)
+    settlingTime = np.maximum(lastOutside - endTime, 0.0)
+
+    rows = [None] * count
+    for k, original in enumerate(order):
+        entry = moves[original]
+        rows[original] = {
+            "id": entry.get("id", original),
+            "samples": int(samples[k]),
+            "rms": float(rms[k]) if samples[k] else None,
+            "peak": float(peak[k]) if samples[k] else None,
+            "settlingTime": float(settlingTime[k]) if settled[k] else None,
+            "settled": bool(settled[k]),
+        }
+    return rows
+
+
+def formatSummary(rows):
+    """Fixed-width summary table of analyzeLog() rows."""
+    lines = [f"{'move':>16} {'samples':>9} {'rms':>10} {'peak':>10} {'settle s':>9}"]
+    for row in rows:
+        rms = "-" if row["rms"] is None else f"{row['rms']:.4g}"
+        peak = "-" if row["peak"] is None else f"{row['peak']:.4g}"
+        settle = "never" if row["settlingTime"] is None else f"{row['settlingTime']:.3f}"
+        lines.append(f"{str(row['id']):>16} {row['samples']:>9} {rms:>10} {peak:>10} {settle:>9}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    logPath, movesPath = sys.argv[1:3]
+    column = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    with open(movesPath, encoding="utf-8") as file:
+        moves = json.load(file)
+    print(formatSummary(analyzeLog(openLog(logPath), moves, column)))
@@ -23,9 +23,15 @@ def profile(displacement, start, time, Ta):
                 -accel,
             )
 
-    results = [calc(ti) for ti in time]
-    displacements = [x[0] for x in results]
-    velocities = [x[1] for x in results]
-    accelerations = [x[2] for x in results]
+    # Fill the three lists directly; a list of (d, v, a) tuples first
+    # would hold every sample twice at the peak
+    displacements = []
+    velocities = []
+    accelerations = []
+    for ti in time:
+        d, v, a = calc(ti)
+        displacements.append(d)
+        velocities.append(v)
+        accelerations.append(a)
 
     return (displacements, velocities, accelerations)
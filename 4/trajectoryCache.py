@@ -0,0 +1,248 @@
+"""
+Persistent content-addressed cache for motion, profile and jointInterpolation.
+
+Entries are keyed by a hash of the planner source and the normalized inputs,
+stored as .npy files that are memory-mapped on a hit, and evicted least
+recently used first once the directory exceeds its size cap. Writes go
+through a temporary file and os.replace(), so concurrent processes only
+ever see complete entries.
+
+Eviction is serialized with fcntl.flock on POSIX and msvcrt.locking on
+Windows. Windows also refuses to remove or replace a file another process
+has memory-mapped; such entries are skipped, not treated as errors. An entry
+that cannot be replaced already holds the same content, since keys are
+content hashes.
+"""
+
+import hashlib
+import marshal
+import os
+import tempfile
+
+import numpy as np
+
+import jointInterpolation as jointInterpolationModule
+import motion as motionModule
+import trajectory as trajectoryModule
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+def plannerVersion():
+    """
+    Hash of the planners' bytecode; any code change invalidates the cache.
+    Bytecode rather than source so it also works in the frozen app.
+    """
+    digest = hashlib.sha256()
+    for function in (
+        motionModule.motion,
+        trajectoryModule.profile,
+        jointInterpolationModule.jointInterpolation,
+    ):
+        digest.update(marshal.dumps(function.__code__))
+    return digest.hexdigest()[:16]
+
+
+PLANNER_VERSION = plannerVersion()
+
+
+def defaultDirectory():
+    base = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "motion-profiles")
+
+
+def cacheKey(function, *args):
+    """
+    Key for a planner call. Scalars are normalized to float so 100 and
+    100.0 share an entry; sequences are hashed by their float64 bytes.
+    """
+    digest = hashlib.sha256(f"{PLANNER_VERSION}:{function}".encode())
+    for arg in args:
+        if np.ndim(arg) == 0:
+            digest.update(b"s" + np.float64(arg).tobytes())
+        else:
+            values = np.ascontiguousarray(arg, dtype=np.float64)
+            digest.update(b"a" + str(len(values)).encode() + values.tobytes())
+    return digest.hexdigest()
+
+
+class TrajectoryCache:
+    """
+    Disk cache with the same call signatures as the planners.
+    Results are NumPy arrays, read-only memory maps on a hit.
+
+    Args:
+        directory (str): Cache directory, created if missing
+        maxBytes (int): Size cap enforced with LRU eviction after each store
+    """
+
+    def __init__(self, directory=None, maxBytes=256 * 1024 * 1024):
+        self.directory = directory or defaultDirectory()
+        self.maxBytes = maxBytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def motion(self, displacement, interval, accelLimit, veloLimit):
+        key = cacheKey("motion", displacement, interval, accelLimit, veloLimit)
+        stored = self._load(key)
+        if stored is None:
+            time, Ta = motionModule.motion(displacement, interval, accelLimit, veloLimit)
+            stored = self._store(key, np.concatenate(([Ta], time)))
+        return (stored[1:], float(stored[0]))
+
+    def profile(self, displacement, start, time, Ta):
+        key = cacheKey("profile", displacement, start, time, Ta)
+        stored = self._load(key)
+        if stored is None:
+            stored = self._store(
+                key, np.array(trajectoryModule.profile(displacement, start, time, Ta))
+            )
+        return (stored[0], stored[1], stored[2])
+
+    def jointInterpolation(
+        self,
+        displacementA,
+        startA,
+        displacementB,
+        startB,
+        interval,
+        accelLimitA,
+        veloLimitA,
+        accelLimitB,
+        veloLimitB,
+    ):
+        args = (
+            displacementA,
+            startA,
+            displacementB,
+            startB,
+            interval,
+            accelLimitA,
+            veloLimitA,
+            accelLimitB,
+            veloLimitB,
+        )
+        key = cacheKey("jointInterpolation", *args)
+        stored = self._load(key)
+        if stored is None:
+            eomA, eomB, time = jointInterpolationModule.jointInterpolation(*args)
+            stored = self._store(key, np.array(list(eomA) + list(eomB) + [time]))
+        return ((stored[0], stored[1], stored[2]), (stored[3], stored[4], stored[5]), stored[6])
+
+    def size(self):
+        """Bytes currently used by cache entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        for path, _, _ in self._entries():
+            _remove(path)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npy")
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            array = np.load(path, mmap_mode="r")
+            os.utime(path)  # Mark as recently used
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return array
+
+    def _store(self, key, array):
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                np.save(file, array)
+            os.replace(temporary, self._path(key))
+        except PermissionError:
+            # Windows: the entry is mapped elsewhere and already up to date
+            _remove(temporary)
+        except BaseException:
+            _remove(temporary)
+            raise
+        self._evict(keep=self._path(key))
+        return array
+
+    def _entries(self):
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(".npy"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((entry.path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _evict(self, keep=None):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.maxBytes:
+            return
+
+        with _DirectoryLock(self.directory):
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+            for path, size, _ in entries:
+                if total <= self.maxBytes:
+                    break
+                if path == keep:
+                    continue
+                # Open memory maps in other processes keep the data alive
+                # on POSIX; on Windows a mapped entry is skipped
+                if _remove(path):
+                    total -= size
+
+
+class _DirectoryLock:
+    """Advisory lock so only one process evicts at a time."""
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, ".lock")
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.path, "a+")
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            # Lock the first byte; LK_LOCK gives up after ten seconds
+            self.file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        self.file.close()
+
+
+def _remove(path):
+    """Delete path; False if it is gone or in use (mapped on Windows)."""
+    try:
+        os.remove(path)
+    except (FileNotFoundError, PermissionError):
+        return False
+    return True
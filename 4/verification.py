@@ -0,0 +1,131 @@
+"""
+Limit and continuity verification for batches of planned trajectories.
+All checks are vectorized reductions over (moves, samples) arrays.
+"""
+
+import numpy as np
+
+
+def padMoves(traces):
+    """
+    Stack ragged per-move sample lists into NaN-padded 2D arrays.
+
+    Args:
+        traces (list of lists or arrays): One sample sequence per move
+
+    Returns:
+        array of shape (m, n): Samples padded with NaN past each move's end
+    """
+    length = max(len(trace) for trace in traces)
+    padded = np.full((len(traces), length), np.nan)
+    for i, trace in enumerate(traces):
+        padded[i, : len(trace)] = trace
+    return padded
+
+
+def verifyTrajectories(
+    time,
+    pos,
+    vel,
+    acc,
+    displacement,
+    start,
+    accelLimit,
+    veloLimit,
+    tolerance=1e-6,
+):
+    """
+    Check every move in a batch against its limits and endpoints.
+
+    Args:
+        time (array of shape (m, n) or (n,)): Sample times, NaN-padded
+        pos (array of shape (m, n)): Position samples, NaN-padded
+        vel (array of shape (m, n)): Velocity samples, NaN-padded
+        acc (array of shape (m, n)): Acceleration samples, NaN-padded
+        displacement (float or array of shape (m,)): Commanded change in position
+        start (float or array of shape (m,)): Commanded initial position
+        accelLimit (float or array of shape (m,)): The acceleration limit
+        veloLimit (float or array of shape (m,)): The velocity limit
+        tolerance (float): Relative and absolute slack allowed on each check
+
+    Returns:
+        list of dicts: One report per move with the measured peaks and
+            errors, "violations" (list of str) and "ok" (bool)
+    """
+    pos = np.atleast_2d(np.asarray(pos, dtype=float))
+    vel = np.atleast_2d(np.asarray(vel, dtype=float))
+    acc = np.atleast_2d(np.asarray(acc, dtype=float))
+    time = np.broadcast_to(np.asarray(time, dtype=float), pos.shape)
+    moves = pos.shape[0]
+
+    displacement = np.broadcast_to(np.asarray(displacement, dtype=float), moves)
+    start = np.broadcast_to(np.asarray(start, dtype=float), moves)
+    accelLimit = np.broadcast_to(np.asarray(accelLimit, dtype=float), moves)
+    veloLimit = np.broadcast_to(np.asarray(veloLimit, dtype=float), moves)
+
+    valid = ~np.isnan(pos)
+    last = valid.sum(axis=1) - 1
+    rows = np.arange(moves)
+
+    # Peaks
+    maxVelocity = np.nanmax(np.abs(vel), axis=1)
+    maxAcceleration = np.nanmax(np.abs(acc), axis=1)
+
+    # Endpoints
+    startError = np.abs(pos[:, 0] - start)
+    endError = np.abs(pos[rows, last] - (start + displacement))
+    endpointError = np.maximum(startError, endError)
+    restVelocity = np.maximum(np.abs(vel[:, 0]), np.abs(vel[rows, last]))
+
+    # Sample-to-sample differences; NaN where either side is padding
+    dt = np.diff(time, axis=1)
+    dp = np.diff(pos, axis=1)
+    dv = np.diff(vel, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stepVelocity = np.where(dt > 0, np.abs(dp) / dt, np.nan)
+        stepAcceleration = np.where(dt > 0, np.abs(dv) / dt, np.nan)
+        # Velocity is piecewise linear, so the trapezoid rule is exact except
+        # across a phase change, where it is off by at most a*dt^2/4
+        trapezoid = np.abs(dp - 0.5 * (vel[:, :-1] + vel[:, 1:]) * dt)
+        differentiationError = np.where(dt > 0, trapezoid / dt**2, np.nan)
+
+    maxJump = _rowMax(stepVelocity)
+    maxStepAcceleration = _rowMax(stepAcceleration)
+    maxDifferentiationError = _rowMax(differentiationError)
+
+    velocitySlack = veloLimit * (1 + tolerance) + tolerance
+    accelSlack = accelLimit * (1 + tolerance) + tolerance
+
+    checks = {
+        "velocity limit": maxVelocity > velocitySlack,
+        "acceleration limit": maxAcceleration > accelSlack,
+        "endpoint": endpointError > tolerance * (1 + np.abs(displacement)),
+        "rest velocity": restVelocity > tolerance * (1 + veloLimit),
+        "position continuity": maxJump > velocitySlack,
+        "differentiated acceleration": maxStepAcceleration > accelSlack,
+        "differentiated position": maxDifferentiationError > accelSlack / 4,
+    }
+
+    reports = []
+    for i in range(moves):
+        violations = [name for name, failed in checks.items() if failed[i]]
+        reports.append(
+            {
+                "move": i,
+                "ok": not violations,
+                "violations": violations,
+                "maxVelocity": float(maxVelocity[i]),
+                "maxAcceleration": float(maxAcceleration[i]),
+                "endpointError": float(endpointError[i]),
+                "maxJump": float(maxJump[i]),
+                "maxStepAcceleration": float(maxStepAcceleration[i]),
+            }
+        )
+    return reports
+
+
+def _rowMax(values):
+    # Non-negative row maximum ignoring padding; single-sample moves give 0
+    if values.shape[1] == 0:
+        return np.zeros(values.shape[0])
+    return np.max(np.nan_to_num(values, nan=0.0), axis=1)